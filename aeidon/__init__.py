@@ -105,7 +105,11 @@ from aeidon.finder import *
 from aeidon.parser import *
 from aeidon.liner import *
 from aeidon import containers
+from aeidon.timing import *
 from aeidon.subtitle import *
+from aeidon.table import *
+from aeidon.sniffer import *
+from aeidon.buffer import *
 from aeidon.file import *
 from aeidon import files
 from aeidon.markup import *
@@ -114,7 +118,11 @@ from aeidon.markupconv import *
 from aeidon.pattern import *
 from aeidon.patternman import *
 from aeidon.clipboard import *
+from aeidon.ranges import *
+from aeidon.journal import *
 from aeidon.revertable import *
+from aeidon.transform import *
 from aeidon import agents
 from aeidon.project import *
+from aeidon.snapshot import *
 from aeidon.unittest import *
@@ -24,6 +24,7 @@ from .open      import OpenAgent
 from .position  import PositionAgent
 from .preview   import PreviewAgent
 from .register  import RegisterAgent
+from .revision  import RevisionAgent
 from .save      import SaveAgent
 from .search    import SearchAgent
 from .set       import SetAgent
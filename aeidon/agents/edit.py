@@ -51,18 +51,20 @@ class EditAgent(aeidon.Delegate):
                 subtitle = self.subtitles[rindices[0]]
                 window = subtitle.start_seconds - first_start
                 duration = window / len(rindices)
+            subtitles = []
             for i, index in enumerate(rindices):
                 subtitle = self.new_subtitle()
                 subtitle.start_seconds = first_start + i*duration
                 subtitle.duration_seconds = duration
-                self.subtitles.insert(index, subtitle)
+                subtitles.append(subtitle)
+            self.subtitles.bulk_insert(rindices, subtitles)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Inserting subtitles")
         action.revert_function = self.remove_subtitles
         action.revert_args = (indices,)
         self.register_action(action)
-        self.emit("subtitles-inserted", indices)
+        self.emit("subtitles-inserted", aeidon.IndexRanges(indices))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -76,15 +78,14 @@ class EditAgent(aeidon.Delegate):
         """
         if subtitles is None:
             return self._insert_blank_subtitles(indices, register=register)
-        for i, index in enumerate(indices):
-            self.subtitles.insert(index, subtitles[i])
+        self.subtitles.bulk_insert(indices, subtitles)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Inserting subtitles")
         action.revert_function = self.remove_subtitles
         action.revert_args = (indices,)
         self.register_action(action)
-        self.emit("subtitles-inserted", indices)
+        self.emit("subtitles-inserted", aeidon.IndexRanges(indices))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -108,14 +109,14 @@ class EditAgent(aeidon.Delegate):
     def remove_subtitles(self, indices, register=-1):
         """Remove subtitles at `indices`."""
         indices = sorted(indices)
-        subtitles = [self.subtitles.pop(i) for i in reversed(indices)][::-1]
+        subtitles = self.subtitles.bulk_remove(indices)
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Removing subtitles")
         action.revert_function = self.insert_subtitles
         action.revert_args = (indices, subtitles)
         self.register_action(action)
-        self.emit("subtitles-removed", indices)
+        self.emit("subtitles-removed", aeidon.IndexRanges(indices))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -132,7 +133,7 @@ class EditAgent(aeidon.Delegate):
         action.revert_function = self.replace_positions
         action.revert_args = (indices, orig_subtitles)
         self.register_action(action)
-        self.emit("positions-changed", indices)
+        self.emit("positions-changed", aeidon.IndexRanges(indices))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -148,7 +149,7 @@ class EditAgent(aeidon.Delegate):
         action.revert_function = self.replace_texts
         action.revert_args = (indices, doc, orig_texts)
         self.register_action(action)
-        self.emit(self.get_text_signal(doc), indices)
+        self.emit(self.get_text_signal(doc), aeidon.IndexRanges(indices))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -18,7 +18,9 @@
 """Reading and parsing data from subtitle files."""
 
 import aeidon
-import bisect
+import collections
+import os
+import statistics
 
 
 class OpenAgent(aeidon.Delegate):
@@ -32,17 +34,109 @@ class OpenAgent(aeidon.Delegate):
         for i, subtitle in enumerate(subtitles):
             self.subtitles[i].tran_text = subtitle.main_text
 
+    def _align_translations_by_dtw(self, subtitles, band=32, text_weight=0.0):
+        """
+        Add translation texts by dynamic time warping of positions.
+
+        Translation subtitles are aligned to existing subtitles by finding
+        the lowest-cost path of matches and skips, where the cost of a match
+        is the difference of middle positions and durations relative to the
+        median duration of existing subtitles. `text_weight` is the weight
+        of an additional cost from the relative difference of text lengths.
+        A global offset between the documents is estimated and removed before
+        comparing positions. The path is limited to `band` subtitles on
+        either side of the proportional diagonal, so time and memory are
+        O(n*band).
+        """
+        main = list(self.subtitles)
+        n, m = len(main), len(subtitles)
+        if n == 0 or m == 0:
+            return self._align_translations_by_position(subtitles)
+        mstarts = [x.start_seconds for x in main]
+        mends = [x.end_seconds for x in main]
+        tstarts = [x.start_seconds for x in subtitles]
+        tends = [x.end_seconds for x in subtitles]
+        mmids = [(x + y) / 2 for x, y in zip(mstarts, mends)]
+        tmids = [(x + y) / 2 for x, y in zip(tstarts, tends)]
+        mdurs = [y - x for x, y in zip(mstarts, mends)]
+        tdurs = [y - x for x, y in zip(tstarts, tends)]
+        scale = statistics.median(mdurs)
+        scale = scale if scale > 0 else 1.0
+        # Bands of consecutive rows must overlap for a path to exist.
+        band = max(band, -(-m // n) + 1)
+        offset = self._get_offset(mmids, tmids, band, scale)
+        tmids = [x - offset for x in tmids]
+        mlens = [len(x.main_text) for x in main]
+        tlens = [len(x.main_text) for x in subtitles]
+        gap = 1.0
+        # Moves: 1 = skip main, 2 = skip translation, 3 = match.
+        prev_lo, prev_hi = 0, min(m, band)
+        prev = [j * gap for j in range(prev_lo, prev_hi + 1)]
+        moves = [(prev_lo, bytearray([0] + [2] * (prev_hi - prev_lo)))]
+        for i in range(1, n + 1):
+            center = i * m // n
+            lo, hi = max(0, center - band), min(m, center + band)
+            row = [0.0] * (hi - lo + 1)
+            back = bytearray(hi - lo + 1)
+            mmid, mdur, mlen = mmids[i-1], mdurs[i-1], mlens[i-1]
+            for j in range(lo, hi + 1):
+                best, move = float("inf"), 0
+                if prev_lo <= j <= prev_hi:
+                    best, move = prev[j - prev_lo] + gap, 1
+                if j > lo:
+                    cost = row[j - lo - 1] + gap
+                    if cost < best:
+                        best, move = cost, 2
+                if prev_lo < j <= prev_hi + 1:
+                    cost = (abs(mmid - tmids[j-1]) +
+                            abs(mdur - tdurs[j-1]) / 2) / scale
+                    if text_weight:
+                        tlen = tlens[j-1]
+                        cost += (text_weight * abs(mlen - tlen) /
+                                 max(mlen, tlen, 1))
+                    cost += prev[j - prev_lo - 1]
+                    if cost < best:
+                        best, move = cost, 3
+                row[j - lo] = best
+                back[j - lo] = move
+            moves.append((lo, back))
+            prev_lo, prev_hi, prev = lo, hi, row
+        path = []
+        i, j = n, m
+        while i > 0 or j > 0:
+            lo, back = moves[i]
+            move = back[j - lo]
+            path.append((move, i - 1, j - 1))
+            i -= move & 1
+            j -= move >> 1
+        new_subtitles = []
+        for move, i, j in reversed(path):
+            if move == 1:
+                new_subtitles.append(main[i])
+            if move == 2:
+                # Place new subtitles in the timing of existing subtitles.
+                subtitle = self.new_subtitle()
+                subtitle.start_seconds = tstarts[j] - offset
+                subtitle.end_seconds = tends[j] - offset
+                subtitle.tran_text = subtitles[j].main_text
+                new_subtitles.append(subtitle)
+            if move == 3:
+                main[i].tran_text = subtitles[j].main_text
+                new_subtitles.append(main[i])
+        if len(new_subtitles) != n:
+            self.subtitles = new_subtitles
+
     def _align_translations_by_position(self, subtitles):
         """Add translation texts by aligning subtitle positions."""
-        subtitles = [x.copy() for x in subtitles]
         mode = self.main_file.mode
+        new_subtitles = []
         i = 0
-        while subtitles:
+        for translation in subtitles:
             # Examine subtitles to be added one-by-one by comparing
             # their temporal middle positions with the start and end
             # positions of existing subtitles.
-            ts = subtitles[0].get_start(mode)
-            te = subtitles[0].get_end(mode)
+            ts = translation.get_start(mode)
+            te = translation.get_end(mode)
             tm = self.calc.get_middle(ts, te)
             while True:
                 # Skip over existing subtitles when
@@ -51,24 +145,72 @@ class OpenAgent(aeidon.Delegate):
                 ms = self.subtitles[i].get_start(mode)
                 me = self.subtitles[i].get_end(mode)
                 if not self.calc.is_earlier(me, tm): break
+                new_subtitles.append(self.subtitles[i])
                 i += 1
             if i == len(self.subtitles) or self.calc.is_later(ms, tm):
                 # Add a new subtitle when no suitable match
                 # found among existing subtitles.
                 subtitle = self.new_subtitle()
-                subtitle.start = subtitles[0].start
-                subtitle.end = subtitles[0].end
-                self.subtitles.insert(i, subtitle)
-            self.subtitles[i].tran_text = subtitles[0].main_text
-            subtitles.pop(0)
+                subtitle.start = translation.start
+                subtitle.end = translation.end
+                subtitle.tran_text = translation.main_text
+                new_subtitles.append(subtitle)
+                continue
+            self.subtitles[i].tran_text = translation.main_text
+            new_subtitles.append(self.subtitles[i])
             i += 1
+        new_subtitles.extend(self.subtitles[i:])
+        if len(new_subtitles) != len(self.subtitles):
+            # Build a new list instead of inserting one-by-one.
+            self.subtitles = new_subtitles
+
+    def _get_offset(self, mmids, tmids, band, scale):
+        """Return estimated offset of translation middle positions."""
+        # Vote for offsets between translation subtitles and existing
+        # subtitles near the proportional index. Use a sample of
+        # translation subtitles to keep this fast for long documents.
+        n, m = len(mmids), len(tmids)
+        width = scale / 4
+        votes = collections.defaultdict(list)
+        for j in range(0, m, max(1, m // 1000)):
+            center = j * n // m
+            for i in range(max(0, center - band), min(n, center + band + 1)):
+                offset = tmids[j] - mmids[i]
+                votes[round(offset / width)].append(offset)
+        offsets = max(votes.values(), key=len)
+        return statistics.median(offsets)
+
+    def _new_file(self, path, encoding, buffer=None):
+        """
+        Return a new subtitle file for `path` with format detected.
+
+        Files at least :attr:`map_size` large are not read into a buffer
+        unless `buffer` is given, to be read memory-mapped instead.
+        """
+        if (buffer is None and
+            self.map_size is not None and
+            os.path.getsize(path) >= self.map_size):
+            encoding = aeidon.encodings.detect_bom(path) or encoding
+            format = aeidon.util.detect_format(path, encoding)
+            return aeidon.files.new(format, path, encoding)
+        buffer = buffer or aeidon.FileBuffer(path)
+        encoding = buffer.detect_bom() or encoding
+        format = buffer.detect_format(encoding)
+        file = aeidon.files.new(format, path, encoding)
+        file.buffer = buffer
+        return file
 
     @aeidon.deco.export
-    def open(self, doc, path, encoding=None, align_method=None):
+    def open(self, doc, path, encoding=None, align_method=None, buffer=None,
+             text_weight=0.0):
         """
         Read and parse subtitle data for `doc` from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `buffer` can be an :class:`aeidon.FileBuffer` instance of the file
+        at `path` already read, otherwise the file is read from disk.
+        `align_method` and `text_weight` are used only for translation, see
+        :meth:`open_translation`.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -78,18 +220,21 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         if doc == aeidon.documents.MAIN:
-            return self.open_main(path, encoding)
+            return self.open_main(path, encoding, buffer)
         if doc == aeidon.documents.TRAN:
-            return self.open_translation(path, encoding, align_method)
+            return self.open_translation(
+                path, encoding, align_method, buffer, text_weight)
         raise ValueError("Invalid document: {!r}".format(doc))
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_main(self, path, encoding=None):
+    def open_main(self, path, encoding=None, buffer=None):
         """
         Read and parse subtitle data for main file from `path`.
 
         `encoding` can be ``None`` to use the system default encoding.
+        `buffer` can be an :class:`aeidon.FileBuffer` instance of the file
+        at `path` already read, otherwise the file is read from disk.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -99,11 +244,7 @@ class OpenAgent(aeidon.Delegate):
         Raise :exc:`aeidon.ParseError` if parsing fails.
         """
         encoding = encoding or aeidon.util.get_default_encoding()
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_main(path, bom_encoding)
-        format = aeidon.util.detect_format(path, encoding)
-        self.main_file = aeidon.files.new(format, path, encoding)
+        self.main_file = self._new_file(path, encoding, buffer)
         subtitles = self._read_file(self.main_file)
         self.subtitles, sort_count = self._sort_subtitles(subtitles)
         self.set_framerate(self.framerate, register=None)
@@ -116,7 +257,8 @@ class OpenAgent(aeidon.Delegate):
 
     @aeidon.deco.export
     @aeidon.deco.notify_frozen
-    def open_translation(self, path, encoding=None, align_method=None):
+    def open_translation(self, path, encoding=None, align_method=None,
+                         buffer=None, text_weight=0.0):
         """
         Read and parse subtitle data for translation file from `path`.
 
@@ -131,7 +273,15 @@ class OpenAgent(aeidon.Delegate):
         takes into account that not all subtitles are translated, or vice versa
         and that one main subtitle may correspond to two translation subtitles,
         or vice versa, as per length restrictions etc.
+        :attr:`aeidon.align_methods.DTW` compares positions and durations of
+        all subtitles by dynamic time warping, which is slower, but tolerates
+        translations with shifted timing. `text_weight` is the weight of
+        differences in text lengths relative to differences in positions,
+        used only by :attr:`aeidon.align_methods.DTW` to tell apart
+        subtitles with similar timing.
 
+        `buffer` can be an :class:`aeidon.FileBuffer` instance of the file
+        at `path` already read, otherwise the file is read from disk.
         Return the amount of subtitles that needed to be moved in order
         to arrange them in ascending chronological order.
 
@@ -142,11 +292,7 @@ class OpenAgent(aeidon.Delegate):
         """
         encoding = encoding or aeidon.util.get_default_encoding()
         align_method = align_method or aeidon.align_methods.POSITION
-        bom_encoding = aeidon.encodings.detect_bom(path)
-        if not bom_encoding in (encoding, None):
-            return self.open_translation(path, bom_encoding, align_method)
-        format = aeidon.util.detect_format(path, encoding)
-        self.tran_file = aeidon.files.new(format, path, encoding)
+        self.tran_file = self._new_file(path, encoding, buffer)
         subtitles = self._read_file(self.tran_file)
         subtitles, sort_count = self._sort_subtitles(subtitles)
         for subtitle in subtitles:
@@ -158,14 +304,19 @@ class OpenAgent(aeidon.Delegate):
             self._align_translations_by_number(subtitles)
         if align_method == aeidon.align_methods.POSITION:
             self._align_translations_by_position(subtitles)
+        if align_method == aeidon.align_methods.DTW:
+            self._align_translations_by_dtw(
+                subtitles, text_weight=text_weight)
         self.unblock("subtitles-inserted", blocked)
         self.tran_changed = 0
         self.emit("translation-file-opened", self.tran_file)
         return sort_count
 
     def _read_file(self, file):
-        """Read `file` and return subtitles."""
+        """Read `file` and return subtitles, memory-mapped if no buffer."""
         try:
+            if file.buffer is None:
+                return list(file.iter_read_mapped())
             return file.read()
         except (IOError, UnicodeError):
             raise
@@ -178,10 +329,17 @@ class OpenAgent(aeidon.Delegate):
 
     def _sort_subtitles(self, subtitles):
         """Return sorted `subtitles` and sort count."""
+        # Sort count is the amount of subtitles that start earlier than
+        # some subtitle before them, which only requires a running maximum.
+        starts = [x.start_seconds for x in subtitles]
         sort_count = 0
-        sorted_starts = []
-        for start in (x.start_frame for x in subtitles):
-            bisect.insort(sorted_starts, start)
-            if sorted_starts[-1] != start:
+        latest = float("-inf")
+        for start in starts:
+            if start < latest:
                 sort_count += 1
-        return sorted(subtitles), sort_count
+            else:
+                latest = start
+        if sort_count == 0:
+            return list(subtitles), sort_count
+        indices = sorted(range(len(subtitles)), key=starts.__getitem__)
+        return [subtitles[i] for i in indices], sort_count
@@ -18,6 +18,7 @@
 """Manipulating times and frames."""
 
 import aeidon
+import array
 
 from aeidon.i18n import _
 
@@ -45,11 +46,13 @@ class PositionAgent(aeidon.Delegate):
         """
         new_indices = []
         new_subtitles = []
+        subtitles = self.subtitles
+        get_text_length = self.get_text_length
         for index in indices or self.get_all_indices():
-            start = self.subtitles[index].start_seconds
-            end = self.subtitles[index].end_seconds
+            start = subtitles[index].start_seconds
+            end = subtitles[index].end_seconds
             if speed is not None:
-                length = self.get_text_length(index, aeidon.documents.MAIN)
+                length = get_text_length(index, aeidon.documents.MAIN)
                 optimal_duration = length / speed
                 dol = lengthen and end - start < optimal_duration
                 dos = shorten  and end - start > optimal_duration
@@ -58,15 +61,15 @@ class PositionAgent(aeidon.Delegate):
             domax = maximum and end - start > maximum
             end = start + minimum if domin else end
             end = start + maximum if domax else end
-            end_max = (self.subtitles[index + 1].start_seconds
-                       if index < len(self.subtitles) - 1
+            end_max = (subtitles[index + 1].start_seconds
+                       if index < len(subtitles) - 1
                        else 360000)
 
             dogap = gap is not None and end_max - end < gap
             end = max(start, end_max - gap) if dogap else end
-            if end != self.subtitles[index].end_seconds:
+            if end != subtitles[index].end_seconds:
                 new_indices.append(index)
-                subtitle = self.subtitles[index].copy()
+                subtitle = subtitles[index].copy()
                 subtitle.end_seconds = end
                 new_subtitles.append(subtitle)
         if not new_indices: return []
@@ -84,15 +87,17 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles. `framerate_in` and
         `framerate_out` should be constants from :attr:`aeidon.framerates`.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         self.set_framerate(framerate_in, register=None)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.convert_framerate(framerate_out)
-            new_subtitles.append(subtitle)
+        # Use exact fractions to avoid drift with e.g. NTSC framerates,
+        # see aeidon.Subtitle.convert_framerate.
+        coefficient = aeidon.Calculator(framerate_in).get_ratio(framerate_out)
+        mode = self.get_mode()
+        if mode == aeidon.modes.TIME:
+            coefficient = 1 / coefficient
+        transform = aeidon.PositionTransform(mode, coefficient)
         self.set_framerate(framerate_out)
-        self.replace_positions(indices, new_subtitles, register=register)
+        self._transform_native_positions(indices, transform, register=register)
         self.group_actions(register, 2, _("Converting framerate"))
 
     def _get_frame_transform(self, p1, p2):
@@ -107,6 +112,15 @@ class PositionAgent(aeidon.Delegate):
         constant = int(round(-coefficient * x1 + y1, 0))
         return coefficient, constant
 
+    def _get_native_position(self, value, mode):
+        """Return position `value` as an integer in native units of `mode`."""
+        if mode == aeidon.modes.TIME:
+            return self.calc.to_milliseconds(value)
+        if mode == aeidon.modes.FRAME:
+            return self.calc.to_frame(value)
+        raise ValueError("Invalid mode: {!r}"
+                         .format(mode))
+
     def _get_seconds_transform(self, p1, p2):
         """Return a formula for linear correction of positions."""
         # Think of this as a linear transformation where input positions
@@ -139,8 +153,12 @@ class PositionAgent(aeidon.Delegate):
         orig_framerate = self.framerate
         self.framerate = framerate
         self.calc = aeidon.Calculator(framerate)
-        for subtitle in self.subtitles:
-            subtitle.framerate = framerate
+        if isinstance(self.subtitles, aeidon.SubtitleTable):
+            # Framerate is common to all rows of a table.
+            self.subtitles.framerate = framerate
+        else:
+            for subtitle in self.subtitles:
+                subtitle.framerate = framerate
         action = aeidon.RevertableAction(register=register)
         action.docs = tuple(aeidon.documents)
         action.description = _("Setting framerate")
@@ -158,15 +176,74 @@ class PositionAgent(aeidon.Delegate):
         `value` can be any valid position type, negative to make subtitles
         appear ealier, positive to make subtitles appear later.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.shift_positions(value)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode = self.get_mode()
+        value = self._get_native_position(value, mode)
+        transform = aeidon.PositionTransform(mode, after=value)
+        self._transform_native_positions(indices, transform, register=register)
         self.set_action_description(register, _("Shifting positions"))
 
+    def _transform_columns(self, indices, transform, inverse, starts, ends):
+        """
+        Return columns of `starts` and `ends` at `indices` transformed.
+
+        Positions are transformed a whole column at a time with the batch
+        methods of :class:`aeidon.Calculator`. Corrections for positions that
+        `inverse` would not restore exactly are added to `inverse`.
+        """
+        new_starts = transform.apply_column(starts)
+        new_ends = transform.apply_column(ends)
+        for index, (start, end) in transform.corrections.items():
+            if not index in indices: continue
+            i = indices.index(index)
+            new_starts[i], new_ends[i] = start, end
+        old_starts = inverse.apply_column(new_starts)
+        old_ends = inverse.apply_column(new_ends)
+        if old_starts != starts or old_ends != ends:
+            for i, index in enumerate(indices):
+                if (old_starts[i] != starts[i] or old_ends[i] != ends[i]):
+                    inverse.corrections[index] = (starts[i], ends[i])
+        return new_starts, new_ends
+
+    @aeidon.deco.revertable
+    def _transform_native_positions(self, indices, transform, register=-1):
+        """
+        Apply `transform` to positions at `indices`.
+
+        `transform` should be a :class:`aeidon.PositionTransform`. Only the
+        inverse transform is saved for undo, along with corrections for
+        positions that the inverse would not restore exactly.
+        """
+        mode = transform.mode
+        inverse = transform.get_inverse()
+        indices = aeidon.IndexRanges(indices)
+        subtitles = self.subtitles
+        # Positions of a table are read and written a column at a time,
+        # positions of other subtitles are gathered to columns.
+        table = (isinstance(subtitles, aeidon.SubtitleTable) and
+                 subtitles.mode == mode)
+        if table:
+            starts, ends = subtitles.get_positions(indices)
+        else:
+            rows = [subtitles[i] for i in indices]
+            starts = [x._get_native_start(mode) for x in rows]
+            ends = [x._get_native_end(mode) for x in rows]
+            starts, ends = array.array("q", starts), array.array("q", ends)
+        starts, ends = self._transform_columns(
+            indices, transform, inverse, starts, ends)
+        if table:
+            subtitles.set_positions(indices, starts, ends)
+        else:
+            for row, start, end in zip(rows, starts, ends):
+                row._set_native_positions(start, end, mode)
+        action = aeidon.RevertableAction(register=register)
+        action.docs = tuple(aeidon.documents)
+        action.description = _("Transforming positions")
+        action.revert_function = self._transform_native_positions
+        action.revert_args = (indices, inverse)
+        self.register_action(action)
+        self.emit("positions-changed", aeidon.IndexRanges(indices))
+
     @aeidon.deco.export
     @aeidon.deco.revertable
     def transform_positions(self, indices, p1, p2, register=-1):
@@ -176,13 +253,32 @@ class PositionAgent(aeidon.Delegate):
         `indices` can be ``None`` to process all subtitles.
         `p1` and `p2` should be tuples of index, position.
         """
-        new_subtitles = []
         indices = indices or self.get_all_indices()
         coefficient, constant = self._get_transform(p1, p2)
-        for index in indices:
-            subtitle = self.subtitles[index].copy()
-            subtitle.scale_positions(coefficient)
-            subtitle.shift_positions(constant)
-            new_subtitles.append(subtitle)
-        self.replace_positions(indices, new_subtitles, register=register)
+        mode = self.get_mode()
+        constant = self._get_native_position(constant, mode)
+        transform = aeidon.PositionTransform(mode, coefficient, after=constant)
+        self._transform_native_positions(indices, transform, register=register)
+        self.set_action_description(register, _("Transforming positions"))
+
+    @aeidon.deco.export
+    @aeidon.deco.revertable
+    def transform_positions_piecewise(self, indices, anchors, register=-1):
+        """
+        Change positions by a piecewise linear correction.
+
+        `indices` can be ``None`` to process all subtitles. `anchors` should
+        be a sequence of at least two tuples of index, position. Positions
+        between two consecutive anchors are corrected linearly, positions
+        before the first or after the last anchor by extending the nearest
+        correction, see :meth:`transform_positions`.
+        """
+        indices = indices or self.get_all_indices()
+        mode = self.get_mode()
+        points = [(self.subtitles[i]._get_native_start(mode),
+                   self._get_native_position(position, mode))
+                  for i, position in anchors]
+
+        transform = aeidon.PiecewiseTransform(mode, points)
+        self._transform_native_positions(indices, transform, register=register)
         self.set_action_description(register, _("Transforming positions"))
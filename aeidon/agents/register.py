@@ -40,9 +40,24 @@ resulting action needs to be grouped as one using :meth:`group_actions`.
 If a revertable method needs to be performed without the possibility of
 reverting, the `register` keyword argument should be given a value of ``None``.
 This way it will not be in any way processed by the undo/redo system.
+
+The memory size of the revert arguments of each action is estimated when
+registering the action. If the total exceeds :attr:`undo_memory_limit`, revert
+arguments of the oldest actions are moved to a temporary file on disk, from
+where they are loaded back when the actions are reverted. Revert arguments that
+cannot be pickled are kept in memory.
+
+Multiple revertable methods can be done as one action using
+:meth:`transaction`, which also defers signals emitted until the end of the
+transaction and merges notifications of changed subtitles. Signals of inserted
+and removed subtitles are emitted immediately, since their handlers need to
+see subtitles as they are at the indices given, and indices of the deferred
+notifications are shifted to match.
 """
 
 import aeidon
+import contextlib
+import weakref
 
 
 class RegisterAgent(aeidon.Delegate):
@@ -50,14 +65,32 @@ class RegisterAgent(aeidon.Delegate):
     """
     Managing revertable actions.
 
+    :cvar _changed_signals: Signals whose indices can be merged
     :ivar _do_description: Original description of the action
+    :ivar _journal: :class:`aeidon.Journal` or ``None`` until first spilled
+    :ivar _memory_size: Estimated memory size of actions in stacks in bytes
+
+       Sizes of registered actions are added and sizes of actions spilled to
+       disk or removed from the stacks are subtracted.
     """
 
+    _changed_signals = (
+        "main-texts-changed",
+        "positions-changed",
+        "subtitles-changed",
+        "translation-texts-changed",
+    )
+
     def __init__(self, master):
         """Initialize a :class:`RegisterAgent` instance."""
         aeidon.Delegate.__init__(self, master)
         self._do_description = None
+        self._journal = None
+        self._memory_size = 0
         aeidon.util.connect(self, self, "notify::undo_limit")
+        aeidon.util.connect(self, self, "notify::undo_memory_limit")
+        aeidon.util.connect(self, self, "subtitles-inserted")
+        aeidon.util.connect(self, self, "subtitles-removed")
 
     def _break_action_group(self, stack, index=0):
         """Break the action group in `stack` and return amount broken into."""
@@ -76,13 +109,35 @@ class RegisterAgent(aeidon.Delegate):
         """Return ``True`` if one or more actions can be undone."""
         return len(self.undoables) >= count
 
+    @aeidon.deco.export
+    def clear_reversion_stacks(self):
+        """Remove all actions from undo and redo stacks."""
+        self._drop_actions(self.undoables)
+        self._drop_actions(self.redoables)
+        self.undoables = []
+        self.redoables = []
+        if self._journal is not None:
+            self._journal.remove()
+        self._memory_size = 0
+
     @aeidon.deco.export
     def cut_reversion_stacks(self):
         """Cut undo and redo stacks to their maximum lengths."""
         if self.undo_limit is not None:
+            self._drop_actions(self.redoables[self.undo_limit:])
+            self._drop_actions(self.undoables[self.undo_limit:])
             del self.redoables[self.undo_limit:]
             del self.undoables[self.undo_limit:]
 
+    def _drop_actions(self, actions):
+        """Release `actions` removed from the stacks without reverting."""
+        for action in actions:
+            if isinstance(action, aeidon.RevertableActionGroup):
+                self._drop_actions(action.actions)
+                continue
+            self._forget_action(action)
+            action.release()
+
     @aeidon.deco.export
     def emit_action_signal(self, register):
         """Emit an action signal for the most recent registered action."""
@@ -90,6 +145,40 @@ class RegisterAgent(aeidon.Delegate):
             self.emit(register.signal,
                       self._get_destination_stack(register)[0])
 
+    def _emit_deferred_signals(self, signals):
+        """Emit `signals` merging indices of changed subtitles."""
+        merged = []
+        pending = {}
+        for signal, args in signals:
+            if signal in self._changed_signals:
+                if signal in pending:
+                    pending[signal].update(args[0])
+                    continue
+                pending[signal] = set(args[0])
+                merged.append((signal, (pending[signal],)))
+                continue
+            merged.append((signal, args))
+        for signal, args in merged:
+            if signal in self._changed_signals:
+                args = (aeidon.IndexRanges(args[0]),)
+            self.emit(signal, *args)
+
+    def _forget_action(self, action):
+        """Subtract memory size of `action` removed from the stacks."""
+        if not action.spilled:
+            self._memory_size -= action.size
+
+    def _get_actions(self):
+        """Return a list of all single actions from oldest to newest."""
+        actions = []
+        for stack in (self.undoables, self.redoables):
+            for action in reversed(stack):
+                if isinstance(action, aeidon.RevertableActionGroup):
+                    actions.extend(action.actions)
+                else: # Single action
+                    actions.append(action)
+        return actions
+
     def _get_destination_stack(self, register):
         """Return the stack where the registered action will be placed."""
         if register.shift == 1:
@@ -124,11 +213,39 @@ class RegisterAgent(aeidon.Delegate):
                 action_group.actions.append(action)
         stack.insert(0, action_group)
 
+    def _limit_memory(self):
+        """Move revert arguments of oldest actions to disk if needed."""
+        if self.undo_memory_limit is None: return
+        if self._memory_size <= self.undo_memory_limit: return
+        # Spill down to half of the limit to avoid
+        # spilling again after every action.
+        target = self.undo_memory_limit // 2
+        if self._journal is None:
+            self._journal = aeidon.Journal()
+            # Remove the temporary file once the project is discarded.
+            weakref.finalize(self, self._journal.remove)
+        for action in self._get_actions():
+            if self._memory_size <= target: break
+            if action.spill(self._journal):
+                self._memory_size -= action.size
+
     def _on_notify_undo_limit(self, *args):
         """Cut reversion stacks if limit set."""
         if self.undo_limit is not None:
             self.cut_reversion_stacks()
 
+    def _on_notify_undo_memory_limit(self, *args):
+        """Move revert arguments to disk if limit exceeded."""
+        self._limit_memory()
+
+    def _on_subtitles_inserted(self, project, indices):
+        """Shift indices of deferred signals by inserted subtitles."""
+        self._shift_deferred_signals(aeidon.util.shift_inserted, indices)
+
+    def _on_subtitles_removed(self, project, indices):
+        """Shift indices of deferred signals by removed subtitles."""
+        self._shift_deferred_signals(aeidon.util.shift_removed, indices)
+
     @aeidon.deco.export
     def redo(self, count=1):
         """Redo `count` amount of actions from the redoable stack."""
@@ -136,13 +253,18 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.redoables[0], group):
             return self._revert_multiple(count, aeidon.registers.REDO)
         self._do_description = self.redoables[0].description
-        self.redoables.pop(0).revert()
+        self._revert_action(self.redoables.pop(0))
 
     @aeidon.deco.export
     def register_action(self, action):
         """Register `action` as done, undone or redone."""
+        if self.undo_memory_limit is not None:
+            action.size = aeidon.util.get_size(
+                (action.revert_args, action.revert_kwargs))
+            self._memory_size += action.size
         if action.register == aeidon.registers.DO:
             self.undoables.insert(0, action)
+            self._drop_actions(self.redoables)
             self.redoables = []
             self._shift_changed_value(action, action.register.shift)
         if action.register == aeidon.registers.UNDO:
@@ -153,6 +275,12 @@ class RegisterAgent(aeidon.Delegate):
             self.undoables.insert(0, action)
             action.description = self._do_description
             self._shift_changed_value(action, action.register.shift)
+        self._limit_memory()
+
+    def _revert_action(self, action):
+        """Revert single `action` removed from its stack."""
+        self._forget_action(action)
+        action.revert()
 
     def _revert_multiple(self, count, register):
         """Revert multiple actions."""
@@ -165,7 +293,7 @@ class RegisterAgent(aeidon.Delegate):
                 part_count = self._break_action_group(stack)
             for j in range(part_count):
                 self._do_description = stack[0].description
-                stack.pop(0).revert()
+                self._revert_action(stack.pop(0))
             if part_count > 1:
                 self.group_actions(register, part_count, description)
         self.unblock(register.signal)
@@ -191,6 +319,55 @@ class RegisterAgent(aeidon.Delegate):
             if self.tran_changed is not None:
                 self.tran_changed += shift
 
+    def _shift_deferred_signals(self, shift, indices):
+        """Shift indices of deferred signals of changed subtitles."""
+        if not self._deferred_signals: return
+        indices = list(indices)
+        for i, (signal, args) in enumerate(self._deferred_signals):
+            if not signal in self._changed_signals: continue
+            args = (shift(sorted(args[0]), indices),) + args[1:]
+            self._deferred_signals[i] = (signal, args)
+
+    @aeidon.deco.export
+    @contextlib.contextmanager
+    def transaction(self, description):
+        """
+        Return a context manager to do multiple actions as one.
+
+        All actions done within the context are grouped as one action with
+        `description`. Signals emitted are deferred until the end of the
+        context, where notifications of changed subtitles are merged and
+        the action signal is emitted once. Signals of inserted and removed
+        subtitles are emitted immediately and indices of deferred
+        notifications of changed subtitles shifted to match. Actions are grouped and signals
+        emitted also if an exception is raised. Nested transactions are
+        part of the outermost one.
+
+        Undoing or redoing within a transaction is not supported.
+        """
+        if self._deferred_signals is not None:
+            yield
+            return
+        register = aeidon.registers.DO
+        count = len(self.undoables)
+        blocked = self.block(register.signal)
+        frozen = self.freeze_notify()
+        self._deferred_signals = []
+        try:
+            yield
+        finally:
+            signals = self._deferred_signals
+            self._deferred_signals = None
+            self.unblock(register.signal, blocked)
+            count = len(self.undoables) - count
+            if count > 0:
+                self.group_actions(register, count, description)
+            self.cut_reversion_stacks()
+            self.thaw_notify(frozen)
+            self._emit_deferred_signals(signals)
+            if count > 0:
+                self.emit_action_signal(register)
+
     @aeidon.deco.export
     def undo(self, count=1):
         """Undo `count` amount of actions from the undoable stack."""
@@ -198,4 +375,4 @@ class RegisterAgent(aeidon.Delegate):
         if count > 1 or isinstance(self.undoables[0], group):
             return self._revert_multiple(count, aeidon.registers.UNDO)
         self._do_description = self.undoables[0].description
-        self.undoables.pop(0).revert()
+        self._revert_action(self.undoables.pop(0))
@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""
+Tracking revisions of subtitles.
+
+Each signal of changed, inserted or removed subtitles increases the revision
+of the project by one and marks the affected subtitles with that revision.
+This allows e.g. caches to update only subtitles changed since the revision
+at which they were last updated. Opening a file marks all subtitles changed.
+Subtitles modified directly instead of through methods of the project are
+not tracked.
+
+Changes are also appended to a log of revisions and indices, so that
+subtitles changed since a recent revision can be found in time proportional
+to the amount of changes instead of the amount of subtitles. Indices in the
+log are shifted when subtitles are inserted or removed and the oldest
+entries are dropped once the log grows as large as the list of revisions.
+"""
+
+import aeidon
+import bisect
+
+
+class RevisionAgent(aeidon.Delegate):
+
+    """
+    Tracking revisions of subtitles.
+
+    :ivar _log: List of :class:`aeidon.IndexRanges` of changed subtitles
+    :ivar _log_revisions: List of revisions corresponding to `_log`
+    :ivar _log_size: Total amount of indices in `_log`
+    :ivar _log_start: Earliest revision since which `_log` is complete
+    :ivar _revision: Revision of the project, increased by each change
+    :ivar _revisions: List of revisions at which each subtitle last changed
+    :ivar _structure_revision: Revision at which subtitles were last
+       inserted or removed
+    """
+
+    def __init__(self, master):
+        """Initialize a :class:`RevisionAgent` instance."""
+        aeidon.Delegate.__init__(self, master)
+        self._log = []
+        self._log_revisions = []
+        self._log_size = 0
+        self._log_start = 0
+        self._revision = 0
+        self._revisions = []
+        self._structure_revision = 0
+        aeidon.util.connect(self, self, "main-file-opened")
+        aeidon.util.connect(self, self, "main-texts-changed")
+        aeidon.util.connect(self, self, "positions-changed")
+        aeidon.util.connect(self, self, "subtitles-changed")
+        aeidon.util.connect(self, self, "subtitles-inserted")
+        aeidon.util.connect(self, self, "subtitles-removed")
+        aeidon.util.connect(self, self, "translation-file-opened")
+        aeidon.util.connect(self, self, "translation-texts-changed")
+
+    def _append_log(self, revision, indices):
+        """Append `indices` changed at `revision` to the log."""
+        self._log.append(indices)
+        self._log_revisions.append(revision)
+        self._log_size += len(indices)
+        if self._log_size <= max(len(self._revisions), 1): return
+        # Drop the oldest entries once the log holds more indices than
+        # there are subtitles, at which point a scan would be cheaper.
+        count = 0
+        while (count < len(self._log) and
+               self._log_size > len(self._revisions) // 2):
+            self._log_size -= len(self._log[count])
+            count += 1
+        self._log_start = self._log_revisions[count-1]
+        del self._log[:count]
+        del self._log_revisions[:count]
+
+    def _bump_revision(self):
+        """Increase revision of the project by one and return it."""
+        self._revision += 1
+        return self._revision
+
+    def _clear_log(self, revision):
+        """Clear the log and start a new one at `revision`."""
+        self._log = []
+        self._log_revisions = []
+        self._log_size = 0
+        self._log_start = revision
+
+    @aeidon.deco.export
+    def get_changed_indices(self, revision):
+        """
+        Return indices of subtitles changed since `revision`.
+
+        Inserted subtitles are included, but removed subtitles cannot be;
+        use :meth:`is_structure_changed` to check if subtitles have been
+        inserted or removed. Return value is an :class:`aeidon.IndexRanges`.
+        """
+        revisions = self._get_revisions()
+        if revision < self._log_start:
+            return aeidon.IndexRanges(
+                i for i, x in enumerate(revisions) if x > revision)
+        i = bisect.bisect_right(self._log_revisions, revision)
+        if i == len(self._log):
+            return aeidon.IndexRanges()
+        if i == len(self._log) - 1:
+            return self._log[i]
+        return aeidon.IndexRanges(
+            index for indices in self._log[i:] for index in indices)
+
+    @aeidon.deco.export
+    def get_revision(self):
+        """Return current revision of the project."""
+        return self._revision
+
+    def _get_revisions(self):
+        """Return a list of revisions of subtitles."""
+        if len(self._revisions) != len(self.subtitles):
+            # Subtitles have been replaced without signals, e.g. by
+            # assigning to the subtitles attribute.
+            self._mark_all_changed()
+        return self._revisions
+
+    @aeidon.deco.export
+    def get_subtitle_revision(self, index):
+        """Return revision at which subtitle at `index` last changed."""
+        return self._get_revisions()[index]
+
+    @aeidon.deco.export
+    def is_structure_changed(self, revision):
+        """Return ``True`` if subtitles inserted or removed after `revision`."""
+        self._get_revisions()
+        return self._structure_revision > revision
+
+    def _mark_all_changed(self):
+        """Mark all subtitles changed at a new revision."""
+        revision = self._bump_revision()
+        self._revisions = [revision] * len(self.subtitles)
+        self._structure_revision = revision
+        self._clear_log(revision)
+
+    def _mark_changed(self, indices):
+        """Mark subtitles at `indices` changed at a new revision."""
+        revisions = self._revisions
+        revision = self._bump_revision()
+        for index in indices:
+            if index >= len(revisions):
+                return self._mark_all_changed()
+            revisions[index] = revision
+        self._append_log(revision, aeidon.IndexRanges(indices))
+
+    def _on_main_file_opened(self, *args):
+        """Mark all subtitles changed."""
+        self._mark_all_changed()
+
+    def _on_main_texts_changed(self, project, indices):
+        """Mark subtitles at `indices` changed."""
+        self._mark_changed(indices)
+
+    def _on_positions_changed(self, project, indices):
+        """Mark subtitles at `indices` changed."""
+        self._mark_changed(indices)
+
+    def _on_subtitles_changed(self, project, indices):
+        """Mark subtitles at `indices` changed."""
+        self._mark_changed(indices)
+
+    def _on_subtitles_inserted(self, project, indices):
+        """Add revisions of subtitles inserted at `indices`."""
+        revisions = self._revisions
+        revision = self._structure_revision = self._bump_revision()
+        ranges = aeidon.IndexRanges(indices)
+        if ranges == indices:
+            items = [revision] * len(ranges)
+            revisions[:] = ranges.insert_into(revisions, items)
+        else:
+            for index in indices:
+                revisions.insert(index, revision)
+            # Positions of subtitles inserted in an arbitrary order
+            # are not worth tracking in the log, start a new one.
+            return self._clear_log(revision)
+        inserted = list(ranges)
+        for i, logged in enumerate(self._log):
+            self._log[i] = aeidon.IndexRanges(
+                aeidon.util.shift_inserted(logged, inserted))
+        self._append_log(revision, ranges)
+
+    def _on_subtitles_removed(self, project, indices):
+        """Remove revisions of subtitles removed from `indices`."""
+        revisions = self._revisions
+        self._structure_revision = self._bump_revision()
+        ranges = aeidon.IndexRanges(indices)
+        if ranges and ranges[-1] >= len(revisions):
+            return self._mark_all_changed()
+        revisions[:] = ranges.remove_from(revisions)
+        removed = list(ranges)
+        for i, logged in enumerate(self._log):
+            indices = aeidon.util.shift_removed(logged, removed)
+            self._log_size -= len(logged) - len(indices)
+            self._log[i] = aeidon.IndexRanges(indices)
+
+    def _on_translation_file_opened(self, *args):
+        """Mark all subtitles changed."""
+        self._mark_all_changed()
+
+    def _on_translation_texts_changed(self, project, indices):
+        """Mark subtitles at `indices` changed."""
+        self._mark_changed(indices)
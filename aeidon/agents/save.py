@@ -84,10 +84,11 @@ class SaveAgent(aeidon.Delegate):
                 # Apply possibly changed mode (times vs. frames).
                 for i, subtitle in enumerate(self.subtitles):
                     subtitle.mode = file.mode
-                self.emit("positions-changed", self.get_all_indices())
+                self.emit("positions-changed",
+                          aeidon.IndexRanges(range(len(self.subtitles))))
             self.main_file = file
             self.main_changed = 0
-            self.emit("main-texts-changed", indices)
+            self.emit("main-texts-changed", aeidon.IndexRanges(indices))
         self.emit("main-file-saved", file)
 
     @aeidon.deco.export
@@ -106,5 +107,5 @@ class SaveAgent(aeidon.Delegate):
         if keep_changes:
             self.tran_file = file
             self.tran_changed = 0
-            self.emit("translation-texts-changed", indices)
+            self.emit("translation-texts-changed", aeidon.IndexRanges(indices))
         self.emit("translation-file-saved", file)
@@ -30,13 +30,17 @@ class SetAgent(aeidon.Delegate):
     def _move_if_needed(self, index):
         """Move subtitle for correct order and return new index."""
         subtitle = self.subtitles[index]
-        subtitles = self.subtitles[:index] + self.subtitles[(index + 1):]
-        new_index = bisect.bisect_right(subtitles, subtitle)
+        # All subtitles except the one at index are in order, so find the
+        # new index by bisecting either side of it without copying the list.
+        new_index = bisect.bisect_right(self.subtitles, subtitle, 0, index)
+        if new_index == index:
+            new_index = bisect.bisect_right(
+                self.subtitles, subtitle, index + 1, len(self.subtitles)) - 1
         if new_index == index: return new_index
         subtitle = self.subtitles.pop(index)
-        self.emit("subtitles-removed", (index,))
+        self.emit("subtitles-removed", aeidon.IndexRanges((index,)))
         self.subtitles.insert(new_index, subtitle)
-        self.emit("subtitles-inserted", (new_index,))
+        self.emit("subtitles-inserted", aeidon.IndexRanges((new_index,)))
         return new_index
 
     @aeidon.deco.export
@@ -59,7 +63,7 @@ class SetAgent(aeidon.Delegate):
         action.revert_function = self.set_end
         action.revert_args = (index, orig_end)
         self.register_action(action)
-        self.emit("positions-changed", (index,))
+        self.emit("positions-changed", aeidon.IndexRanges((index,)))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -81,7 +85,7 @@ class SetAgent(aeidon.Delegate):
         action.revert_function = self.set_end
         action.revert_args = (index, orig_value)
         self.register_action(action)
-        self.emit("positions-changed", (index,))
+        self.emit("positions-changed", aeidon.IndexRanges((index,)))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -114,7 +118,7 @@ class SetAgent(aeidon.Delegate):
         action.revert_function = self.set_start
         action.revert_args = (index, orig_value)
         self.register_action(action)
-        self.emit("positions-changed", (index,))
+        self.emit("positions-changed", aeidon.IndexRanges((index,)))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
@@ -131,7 +135,7 @@ class SetAgent(aeidon.Delegate):
         action.revert_args = (index, doc, orig_value)
         self.register_action(action)
         signal = self.get_text_signal(doc)
-        self.emit(signal, (index,))
+        self.emit(signal, aeidon.IndexRanges((index,)))
 
     @aeidon.deco.export
     @aeidon.deco.revertable
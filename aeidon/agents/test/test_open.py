@@ -18,6 +18,8 @@
 import aeidon
 import codecs
 
+from unittest.mock import patch
+
 
 class TestOpenAgent(aeidon.TestCase):
 
@@ -38,6 +40,24 @@ class TestOpenAgent(aeidon.TestCase):
         assert self.project.subtitles
         assert self.project.main_file.encoding == "utf_8_sig"
 
+    def test_open_main__buffer(self):
+        path = self.new_subrip_file()
+        buffer = aeidon.FileBuffer(path)
+        with patch("aeidon.FileBuffer") as cls:
+            self.project.open_main(path, "ascii", buffer)
+        assert not cls.called
+        assert self.project.subtitles
+
+    def test_open_main__mapped(self):
+        path = self.new_subrip_file()
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = file.read()
+        self.project.map_size = 0
+        with patch("aeidon.FileBuffer") as cls:
+            self.project.open_main(path, "ascii")
+        assert not cls.called
+        assert self.project.subtitles == subtitles
+
     def test_open_main__sort(self):
         path = self.new_microdvd_file()
         with open(path, "w") as f:
@@ -47,6 +67,77 @@ class TestOpenAgent(aeidon.TestCase):
         sort_count = self.project.open_main(path, "ascii")
         assert sort_count == 1
 
+    def test_open_main__sort_many(self):
+        path = self.new_microdvd_file()
+        with open(path, "w") as f:
+            f.write("{500}{600}\n")
+            f.write("{100}{200}\n")
+            f.write("{700}{800}\n")
+            f.write("{300}{400}\n")
+            f.write("{300}{350}\n")
+        sort_count = self.project.open_main(path, "ascii")
+        assert sort_count == 3
+        starts = [x.start_frame for x in self.project.subtitles]
+        assert starts == [100, 300, 300, 500, 700]
+        assert self.project.subtitles[1].end_frame == 400
+
+    def test_open_translation__mapped(self):
+        self.project.map_size = 0
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            self.project.open_translation(path, "ascii")
+            assert self.project.tran_file.format == format
+
+    def test_open_translation__align_dtw(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            method = aeidon.align_methods.DTW
+            self.project.open_translation(path, "ascii", method)
+
+    def test_open_translation__align_dtw_shifted(self):
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        texts = [x.main_text for x in self.project.subtitles]
+        translation = aeidon.Project()
+        translation.open_main(self.new_subrip_file(), "ascii")
+        translation.shift_positions(None, 3.0)
+        translation.remove_subtitles((2,))
+        translation.save_main()
+        path = translation.main_file.path
+        method = aeidon.align_methods.DTW
+        self.project.open_translation(path, "ascii", method)
+        assert len(self.project.subtitles) == len(texts)
+        assert self.project.subtitles[2].tran_text == ""
+        for i in (0, 1, 3, len(texts) - 1):
+            assert self.project.subtitles[i].tran_text == texts[i]
+
+    def test_open_translation__align_dtw_text_weight(self):
+        def new_subtitles(project, items):
+            subtitles = []
+            for start, end, text in items:
+                subtitle = project.new_subtitle()
+                subtitle.start_seconds = start
+                subtitle.end_seconds = end
+                subtitle.main_text = text
+                subtitles.append(subtitle)
+            return subtitles
+        translation = aeidon.Project()
+        translation.open_main(self.new_subrip_file(), "ascii")
+        translation.subtitles = new_subtitles(translation, [
+            (0, 2, "a" * 10), (2.9, 4.9, "c" * 40),
+            (6, 8, "d" * 10), (8, 10, "e" * 10)])
+        translation.save_main()
+        path = translation.main_file.path
+        method = aeidon.align_methods.DTW
+        main = [(0, 2, "A" * 10), (2, 4, "B"), (4, 6, "C" * 40),
+                (6, 8, "D" * 10), (8, 10, "E" * 10)]
+        self.project.subtitles = new_subtitles(self.project, main)
+        self.project.open_translation(path, "ascii", method)
+        assert self.project.subtitles[1].tran_text == "c" * 40
+        self.project.subtitles = new_subtitles(self.project, main)
+        self.project.open_translation(path, "ascii", method, text_weight=1.0)
+        assert self.project.subtitles[1].tran_text == ""
+        assert self.project.subtitles[2].tran_text == "c" * 40
+
     def test_open_translation__align_number(self):
         for format in aeidon.formats:
             path = self.new_temp_file(format)
@@ -118,6 +118,14 @@ class TestPositionAgent(aeidon.TestCase):
         assert self.project.subtitles[0].start == 104
         assert self.project.subtitles[1].start == 209
 
+    @aeidon.deco.reversion_test
+    def test_convert_framerate__time(self):
+        ifps = aeidon.framerates.FPS_23_976
+        ofps = aeidon.framerates.FPS_25_000
+        end = self.project.subtitles[-1].end_seconds
+        self.project.convert_framerate(None, ifps, ofps)
+        assert self.project.subtitles[-1].end_seconds < end
+
     def test_set_framerate(self):
         framerate = aeidon.framerates.FPS_25_000
         self.project.set_framerate(framerate)
@@ -136,6 +144,18 @@ class TestPositionAgent(aeidon.TestCase):
             assert subtitle.start_frame == start
             assert subtitle.end_frame == end
 
+    @aeidon.deco.reversion_test
+    def test_shift_positions__limit(self):
+        self.project.shift_positions(None, "99:59:30.000")
+        transform = self.project.undoables[0].revert_args[1]
+        assert transform.corrections
+
+    def test_shift_positions__undo(self):
+        self.project.shift_positions(None, 1.0)
+        transform = self.project.undoables[0].revert_args[1]
+        assert isinstance(transform, aeidon.PositionTransform)
+        assert not transform.corrections
+
     @aeidon.deco.reversion_test
     def test_transform_positions(self):
         a, b = "00:00:01.000", "00:00:45.000"
@@ -144,3 +164,22 @@ class TestPositionAgent(aeidon.TestCase):
         for subtitle in self.project.subtitles[3:6]:
             assert a < subtitle.start_time < b
         assert self.project.subtitles[6].start_time == b
+
+    @aeidon.deco.reversion_test
+    def test_transform_positions_piecewise(self):
+        a, b, c = "00:00:01.000", "00:00:10.000", "00:00:45.000"
+        anchors = ((2, a), (4, b), (6, c))
+        self.project.transform_positions_piecewise(None, anchors)
+        assert self.project.subtitles[2].start_time == a
+        assert self.project.subtitles[4].start_time == b
+        assert self.project.subtitles[6].start_time == c
+        for subtitle in self.project.subtitles[3:4]:
+            assert a < subtitle.start_time < b
+        for subtitle in self.project.subtitles[5:6]:
+            assert b < subtitle.start_time < c
+        assert len(self.project.undoables) == 1
+
+    def test_transform_positions_piecewise__invalid(self):
+        self.assert_raises(ValueError,
+                           self.project.transform_positions_piecewise,
+                           None, ((2, "00:00:01.000"),))
@@ -44,6 +44,117 @@ class TestRegisterAgent(aeidon.TestCase):
         assert self.project.subtitles[1].main_text == ""
         assert self.project.subtitles[2].main_text == ""
 
+    def test_register_action__memory_limit(self):
+        texts = [x.main_text for x in self.project.subtitles]
+        self.project.remove_subtitles((0, 1, 2))
+        self.project.clear_texts((0,), MAIN)
+        assert self.project.undoables[1].size > 0
+        self.project.undo_memory_limit = 1
+        assert self.project.undoables[1].spilled
+        self.project.undo(2)
+        assert [x.main_text for x in self.project.subtitles] == texts
+        self.project.redo(2)
+        assert self.project.redoables == []
+        self.project.undo(2)
+        assert [x.main_text for x in self.project.subtitles] == texts
+
+    def test_register_action__memory_limit_release(self):
+        self.project.undo_limit = 5
+        self.project.undo_memory_limit = 1
+        for i in range(50):
+            self.project.clear_texts((i % 3,), MAIN)
+            self.project.cut_reversion_stacks()
+        journal = self.project.cut_reversion_stacks.__self__._journal
+        assert len(self.project.undoables) == 5
+        assert len(journal) == 5
+        self.project.undo(2)
+        self.project.clear_texts((0,), MAIN)
+        assert len(journal) == 4
+        self.project.clear_reversion_stacks()
+        assert len(journal) == 0
+        assert journal.path is None
+
+    def test_register_action__memory_limit_unpicklable(self):
+        reverted = []
+        def revert(function, register=None):
+            reverted.append(function)
+        action = aeidon.RevertableAction(register=aeidon.registers.DO)
+        action.docs = (MAIN,)
+        action.description = "Test"
+        action.revert_function = revert
+        action.revert_args = (lambda: None,)
+        self.project.undo_memory_limit = 1
+        self.project.register_action(action)
+        assert not action.spilled
+        self.project.clear_texts((0,), MAIN)
+        assert self.project.undoables[0].spilled
+        self.project.undo(2)
+        assert reverted == [action.revert_args[0]]
+
+    def test_transaction(self):
+        texts = [x.main_text for x in self.project.subtitles]
+        with self.project.transaction("Test"):
+            self.project.clear_texts((0,), MAIN)
+            self.project.clear_texts((1,), MAIN)
+            self.project.remove_subtitles((2,))
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "Test"
+        assert self.project.main_changed == 3
+        self.project.undo()
+        assert [x.main_text for x in self.project.subtitles] == texts
+        assert self.project.main_changed == 0
+
+    def test_transaction__exception(self):
+        try:
+            with self.project.transaction("Test"):
+                self.project.clear_texts((0,), MAIN)
+                raise ValueError
+        except ValueError:
+            pass
+        assert len(self.project.undoables) == 1
+        assert self.project._deferred_signals is None
+
+    def test_transaction__nested(self):
+        with self.project.transaction("Test"):
+            self.project.clear_texts((0,), MAIN)
+            with self.project.transaction("Nested"):
+                self.project.clear_texts((1,), MAIN)
+        assert len(self.project.undoables) == 1
+        assert self.project.undoables[0].description == "Test"
+
+    def test_transaction__signals(self):
+        emitted = []
+        def on_signal(project, *args):
+            emitted.append(args)
+        self.project.connect("action-done", on_signal)
+        self.project.connect("main-texts-changed", on_signal)
+        self.project.connect("subtitles-removed", on_signal)
+        with self.project.transaction("Test"):
+            self.project.clear_texts((3,), MAIN)
+            self.project.clear_texts((1,), MAIN)
+            self.project.remove_subtitles((2,))
+            assert emitted == [([2],)]
+            self.project.clear_texts((0,), MAIN)
+        assert emitted[1] == ([0, 1, 2],)
+        assert emitted[2] == (self.project.undoables[0],)
+
+    def test_transaction__signals_structure(self):
+        subtitles = []
+        def on_inserted(project, indices):
+            subtitles.extend(project.subtitles[i] for i in indices)
+        def on_changed(project, indices):
+            subtitles.extend(project.subtitles[i] for i in indices)
+        self.project.connect("subtitles-inserted", on_inserted)
+        self.project.connect("main-texts-changed", on_changed)
+        count = len(self.project.subtitles)
+        with self.project.transaction("Test"):
+            self.project.set_text(1, MAIN, "test")
+            self.project.insert_subtitles([count])
+            self.project.remove_subtitles([0])
+            assert subtitles == [self.project.subtitles[count-1]]
+        assert subtitles[1] is self.project.subtitles[0]
+        assert subtitles[1].main_text == "test"
+
     def test_undo(self):
         text_0 = self.project.subtitles[0].main_text
         text_1 = self.project.subtitles[1].main_text
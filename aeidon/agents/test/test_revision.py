@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestRevisionAgent(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.revision = self.project.get_revision()
+
+    def test_get_changed_indices(self):
+        self.project.set_text(3, MAIN, "test")
+        self.project.shift_positions((1,), 1.0)
+        indices = self.project.get_changed_indices(self.revision)
+        assert indices == [1, 3]
+
+    def test_get_changed_indices__insert(self):
+        self.project.insert_subtitles((1, 2))
+        self.project.set_text(5, MAIN, "test")
+        indices = self.project.get_changed_indices(self.revision)
+        assert indices == [1, 2, 5]
+        assert self.project.is_structure_changed(self.revision)
+
+    def test_get_changed_indices__log(self):
+        self.project.set_text(3, MAIN, "test")
+        revision = self.project.get_revision()
+        self.project.insert_subtitles((0,))
+        self.project.set_text(1, MAIN, "test")
+        self.project.remove_subtitles((2,))
+        assert self.project.get_changed_indices(revision) == [0, 1]
+        assert self.project.get_changed_indices(self.revision) == [0, 1, 3]
+
+    def test_get_changed_indices__log_trimmed(self):
+        for i in range(len(self.project.subtitles) * 2):
+            self.project.set_text(0, MAIN, str(i))
+        self.project.set_text(3, MAIN, "test")
+        indices = self.project.get_changed_indices(self.revision)
+        assert indices == [0, 3]
+
+    def test_get_changed_indices__open(self):
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        indices = self.project.get_changed_indices(self.revision)
+        assert len(indices) == len(self.project.subtitles)
+
+    def test_get_changed_indices__remove(self):
+        self.project.set_text(3, MAIN, "test")
+        self.project.remove_subtitles((0, 1))
+        indices = self.project.get_changed_indices(self.revision)
+        assert indices == [1]
+        assert self.project.is_structure_changed(self.revision)
+
+    def test_get_changed_indices__transaction(self):
+        with self.project.transaction("Test"):
+            self.project.set_text(3, MAIN, "test")
+            self.project.remove_subtitles((0,))
+            self.project.set_text(0, MAIN, "test")
+        indices = self.project.get_changed_indices(self.revision)
+        assert indices == [0, 2]
+
+    def test_get_changed_indices__undo(self):
+        self.project.set_text(3, MAIN, "test")
+        revision = self.project.get_revision()
+        self.project.undo()
+        assert self.project.get_changed_indices(revision) == [3]
+
+    def test_get_changed_indices__unchanged(self):
+        assert not self.project.get_changed_indices(self.revision)
+        assert not self.project.is_structure_changed(self.revision)
+
+    def test_get_revision(self):
+        self.project.set_text(0, MAIN, "test")
+        assert self.project.get_revision() > self.revision
+
+    def test_get_subtitle_revision(self):
+        self.project.set_text(0, MAIN, "test")
+        revision = self.project.get_revision()
+        assert self.project.get_subtitle_revision(0) == revision
+        assert self.project.get_subtitle_revision(1) <= self.revision
+
+    def test_is_structure_changed(self):
+        self.project.subtitles = self.project.subtitles[1:]
+        assert self.project.is_structure_changed(self.revision)
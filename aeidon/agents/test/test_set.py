@@ -57,6 +57,15 @@ class TestSetAgent(aeidon.TestCase):
         assert subtitles[0].main_text == text_3
         assert subtitles[1].main_text == text_0
 
+    @aeidon.deco.reversion_test
+    def test_set_start__reorder_later(self):
+        subtitles = self.project.subtitles
+        text_0 = subtitles[0].main_text
+        text_2 = subtitles[2].main_text
+        self.project.set_start(0, subtitles[2].start)
+        assert subtitles[1].main_text == text_2
+        assert subtitles[2].main_text == text_0
+
     @aeidon.deco.reversion_test
     def test_set_text__main(self):
         subtitles = self.project.subtitles
@@ -166,8 +166,9 @@ class TextAgent(aeidon.Delegate):
         patterns = [x for x in patterns if x.enabled]
         re_patterns = self._get_substitutions(patterns)
         repeats = [x.get_field_boolean("Repeat") for x in patterns]
+        subtitles = self.subtitles
         for index in indices or self.get_all_indices():
-            subtitle = self.subtitles[index]
+            subtitle = subtitles[index]
             parser.set_text(subtitle.get_text(doc))
             for i, item in enumerate(re_patterns):
                 string, flags, replacement = item
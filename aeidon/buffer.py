@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Contents of a file read into memory once."""
+
+import aeidon
+import codecs
+import io
+import os
+
+__all__ = ("FileBuffer",)
+
+
+class FileBuffer:
+
+    """
+    Contents of a file read into memory once.
+
+    :ivar data: Bytes read from the file
+    :ivar path: Full, absolute path to the file on disk
+
+    Opening a subtitle file requires detecting its BOM, format and newlines
+    and reading its lines, all of which need the contents of the file.
+    :class:`FileBuffer` reads the file with a single read, so that the above
+    can be done without reading the file multiple times. Only :attr:`data` is
+    kept, lines are split lazily from text decoded when iterated over.
+    """
+
+    def __init__(self, path):
+        """
+        Initialize a :class:`FileBuffer` instance.
+
+        Raise :exc:`IOError` if reading fails.
+        """
+        self.path = os.path.abspath(path)
+        with open(self.path, "rb") as f:
+            self.data = f.read()
+        self._encoding = None
+        self._newlines = None
+
+    def can_decode(self, encoding, size=65536):
+        """
+        Return ``True`` if file can be decoded with `encoding`.
+
+        Data is decoded incrementally in blocks of `size` bytes, stopping at
+        the first error, without keeping the decoded text.
+        """
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            for i in range(0, len(self.data), size):
+                decoder.decode(self.data[i:i+size])
+            decoder.decode(b"", True)
+        except UnicodeError:
+            return False
+        return True
+
+    def detect_bom(self):
+        """Return corresponding encoding if BOM found, else ``None``."""
+        return aeidon.encodings.detect_bom_data(self.data)
+
+    def detect_format(self, encoding, sniffer=None):
+        """
+        Detect and return format of file.
+
+        `sniffer` can be a :class:`aeidon.FormatSniffer` instance to use
+        instead of the default, see :meth:`sniff_format`.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Raise :exc:`aeidon.FormatError` if unable to detect format.
+        Return an :attr:`aeidon.formats` enumeration item.
+        """
+        format, confidence = self.sniff_format(encoding, sniffer)
+        if format is not None: return format
+        raise aeidon.FormatError("Failed to detect format of file {!r}"
+                                 .format(self.path))
+
+    def detect_newlines(self, encoding):
+        """
+        Detect and return the newline type of file or ``None``.
+
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        if encoding != self._encoding:
+            for line in self.iter_lines(encoding): pass
+        return aeidon.util.find_newline(self._newlines)
+
+    def iter_lines(self, encoding, size=65536):
+        """
+        Decode file and iterate over lines.
+
+        Lines are split the same way as when iterating over a file opened in
+        text mode, i.e. on any of the newline types, with newlines translated
+        to ``\\n`` and kept at the ends of lines. Text is split in blocks of
+        about `size` characters ending at a line feed, so that lines of one
+        block at a time are kept in memory. Newlines found are stored for
+        :meth:`detect_newlines` once all lines have been iterated over.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        text = self.data.decode(encoding)
+        found = set()
+        start = 0
+        while start < len(text):
+            stop = text.find("\n", start + size) + 1 or len(text)
+            stream = io.StringIO(text[start:stop], newline=None)
+            yield from stream.readlines()
+            newlines = stream.newlines or ()
+            found.update((newlines,) if isinstance(newlines, str)
+                         else newlines)
+            start = stop
+        newlines = tuple(x for x in ("\r", "\n", "\r\n") if x in found)
+        self._newlines = (newlines[0] if len(newlines) == 1 else
+                          newlines or None)
+        self._encoding = encoding
+
+    def read_lines(self, encoding):
+        """
+        Decode file and return a list of lines.
+
+        See :meth:`iter_lines` for how lines are split.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        return list(self.iter_lines(encoding))
+
+    def sniff_format(self, encoding, sniffer=None):
+        """
+        Detect and return format of file and confidence of detection.
+
+        Only the beginning of the file is decoded, see
+        :class:`aeidon.FormatSniffer`, of which `sniffer` can be given,
+        otherwise a shared default instance is used.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Return an :attr:`aeidon.formats` enumeration item or ``None`` and
+        confidence as a float between zero and one.
+        """
+        sniffer = sniffer or aeidon.FormatSniffer.get_default()
+        return sniffer.sniff(self.data, encoding)
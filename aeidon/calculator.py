@@ -18,9 +18,50 @@
 """Time and frame calculator."""
 
 import aeidon
+import array
+import fractions
+import sys
 
 __all__ = ("Calculator",)
 
+# Minimum length of a sequence to be worth converting to a NumPy array.
+NUMPY_THRESHOLD = 256
+
+
+def _get_numpy(values):
+    """Return :mod:`numpy` if it should be used for `values`, else ``None``."""
+    numpy = sys.modules.get("numpy")
+    if numpy is not None and isinstance(values, numpy.ndarray):
+        return numpy
+    if len(values) < NUMPY_THRESHOLD: return None
+    if not aeidon.util.numpy_available(): return None
+    import numpy
+    return numpy
+
+def _round_divide(x, y):
+    """Return `x` divided by positive `y` rounded half to even."""
+    quotient, remainder = divmod(x, y)
+    if 2 * remainder > y or (2 * remainder == y and quotient % 2):
+        quotient += 1
+    return int(quotient)
+
+def _to_ndarray(numpy, values):
+    """Return `values` as a NumPy array, avoiding copies if possible."""
+    if isinstance(values, numpy.ndarray):
+        return values
+    if isinstance(values, array.array) and values.typecode in "qd":
+        return numpy.frombuffer(values, dtype=values.typecode)
+    return numpy.asarray(values)
+
+def _to_result(numpy, values, result, typecode):
+    """Return NumPy `result` of the same kind of sequence as `values`."""
+    result = result.astype(typecode)
+    if isinstance(values, numpy.ndarray):
+        return result
+    column = array.array(typecode)
+    column.frombytes(result.tobytes())
+    return column
+
 
 class Calculator:
 
@@ -29,8 +70,33 @@ class Calculator:
 
     Times are handled as strings, frames as integers and seconds as floats.
     Only one instance of :class:`Calculator` exists for a given framerate.
+
+    :ivar fraction: Framerate as an exact :class:`fractions.Fraction`
+
+    Conversions between frames and milliseconds or times use integer
+    arithmetic on :attr:`fraction` and are thus exact, e.g. 24000/1001
+    instead of the float approximation of 23.976 fps.
+
+    Methods dealing with milliseconds are meant for the integer position
+    storage of :class:`aeidon.Subtitle`. Milliseconds are integers and thus
+    cannot be distinguished from frames, so they should never be passed as
+    generic position arguments.
+
+    Methods with plural names, e.g. :meth:`frames_to_times`, convert whole
+    columns of positions of a known type in one call. Numeric results are
+    returned as NumPy arrays if given a NumPy array, otherwise as
+    :class:`array.array` (``"q"`` for integers, ``"d"`` for floats). Times
+    are returned as lists of strings. If NumPy is available, it is used
+    for numeric conversions of long sequences; results are the same as
+    from the corresponding single-position methods.
     """
 
+    # Times are limited to two digits of hours.
+    max_milliseconds = 359999999
+
+    # Limit used to recover exact framerates from float values.
+    max_denominator = 1000000
+
     _instances = {}
 
     def __new__(cls, framerate=None):
@@ -55,14 +121,29 @@ class Calculator:
 
         `framerate` can be either an :attr:`aeidon.framerates` item
         (preferred to be able to reuse instances) or an exact float value.
+        Items can define an exact `fraction` attribute, otherwise one is
+        derived from `value`. Non-item values can also be given as
+        :class:`fractions.Fraction` or strings, e.g. "24000/1001".
         """
         if framerate is None:
             framerate = aeidon.framerates.FPS_23_976
+        # Instances for framerate items are shared,
+        # initialize those only once per item.
+        if self.__dict__.get("_item") is framerate: return
+        self._item = None
+        self._ratios = {}
         if framerate in aeidon.framerates:
-            self._framerate = framerate.value
-        else:
-            # Use non-constant values as is.
-            self._framerate = float(framerate)
+            self._item = framerate
+            framerate = getattr(framerate, "fraction", framerate.value)
+        # Floats that approximate rational framerates, e.g. 24 / 1.001
+        # are converted to the closest fraction, i.e. 24000/1001.
+        self.fraction = fractions.Fraction(framerate)
+        self.fraction = self.fraction.limit_denominator(self.max_denominator)
+        self._framerate = float(self.fraction)
+        # Cache integer constants for frame and millisecond conversions:
+        # milliseconds = frames * _ms_numerator / _ms_denominator.
+        self._ms_numerator = 1000 * self.fraction.denominator
+        self._ms_denominator = self.fraction.numerator
 
     def add(self, x, y):
         """Add position `y` to `x`."""
@@ -77,14 +158,35 @@ class Calculator:
         raise ValueError("Invalid type for x: {!r}"
                          .format(type(x)))
 
+    def frame_to_milliseconds(self, frame):
+        """Convert `frame` to milliseconds."""
+        ms = _round_divide(frame * self._ms_numerator, self._ms_denominator)
+        return max(-self.max_milliseconds, min(self.max_milliseconds, ms))
+
     def frame_to_seconds(self, frame):
         """Convert `frame` to seconds."""
-        return aeidon.as_seconds(frame / self._framerate)
+        return aeidon.as_seconds(frame * self.fraction.denominator /
+                                 self.fraction.numerator)
 
     def frame_to_time(self, frame):
         """Convert `frame` to time."""
-        seconds = self.frame_to_seconds(frame)
-        return self.seconds_to_time(seconds)
+        ms = self.frame_to_milliseconds(frame)
+        return self.milliseconds_to_time(ms)
+
+    def frames_to_milliseconds(self, frames):
+        """Convert a sequence of `frames` to milliseconds."""
+        numpy = _get_numpy(frames)
+        if numpy is None:
+            return array.array("q", map(self.frame_to_milliseconds, frames))
+        ms = _to_ndarray(numpy, frames) * self._ms_numerator
+        ms = numpy.rint(ms / self._ms_denominator)
+        ms = numpy.clip(ms, -self.max_milliseconds, self.max_milliseconds)
+        return _to_result(numpy, frames, ms, "q")
+
+    def frames_to_times(self, frames):
+        """Convert a sequence of `frames` to times."""
+        ms = self.frames_to_milliseconds(frames)
+        return self.milliseconds_to_times(ms)
 
     def get_middle(self, x, y):
         """Return time, frame or seconds halfway between `x` and `y`."""
@@ -101,6 +203,22 @@ class Calculator:
         raise ValueError("Invalid type for x: {!r}"
                          .format(type(x)))
 
+    def get_ratio(self, framerate):
+        """
+        Return `framerate` divided by framerate of calculator.
+
+        The ratio is returned as an exact :class:`fractions.Fraction`.
+        Ratios to :attr:`aeidon.framerates` items are cached.
+        """
+        other = Calculator(framerate)
+        fraction, ratio = self._ratios.get(other, (None, None))
+        if fraction is other.fraction:
+            return ratio
+        ratio = other.fraction / self.fraction
+        if other._item is not None:
+            self._ratios[other] = (other.fraction, ratio)
+        return ratio
+
     def is_earlier(self, x, y):
         """Return ``True`` if `x` is earlier than `y`."""
         if aeidon.is_time(x):
@@ -141,6 +259,37 @@ class Calculator:
                 0 <= seconds  <=  59 and
                 0 <= mseconds <= 999)
 
+    def milliseconds_to_frame(self, ms):
+        """Convert `ms` to frame."""
+        return _round_divide(ms * self._ms_denominator, self._ms_numerator)
+
+    def milliseconds_to_frames(self, ms):
+        """Convert a sequence of `ms` to frames."""
+        numpy = _get_numpy(ms)
+        if numpy is None:
+            return array.array("q", map(self.milliseconds_to_frame, ms))
+        frames = _to_ndarray(numpy, ms) * self._ms_denominator
+        frames = numpy.rint(frames / self._ms_numerator)
+        return _to_result(numpy, ms, frames, "q")
+
+    def milliseconds_to_time(self, ms):
+        """Convert `ms` to time."""
+        sign = "-" if ms < 0 else ""
+        ms = min(abs(ms), self.max_milliseconds)
+        return ("{}{:02d}:{:02d}:{:02d}.{:03d}"
+                .format(sign,
+                        ms // 3600000,
+                        ms // 60000 % 60,
+                        ms // 1000 % 60,
+                        ms % 1000))
+
+    def milliseconds_to_times(self, ms):
+        """Convert a sequence of `ms` to times."""
+        if hasattr(ms, "tolist"):
+            # Avoid formatting NumPy scalars.
+            ms = ms.tolist()
+        return list(map(self.milliseconds_to_time, ms))
+
     def normalize_time(self, time):
         """
         Convert `time` to valid format.
@@ -186,36 +335,139 @@ class Calculator:
         raise ValueError("Invalid type for pos: {!r}"
                          .format(type(pos)))
 
+    def round_frames(self, frames, ndigits):
+        """
+        Round a sequence of `frames` to given precision in decimal digits.
+
+        `ndigits` may be negative, zero is used if it is greater than zero.
+        Halves are rounded to even, as with :meth:`round`.
+        """
+        step = 10 ** -min(0, ndigits)
+        numpy = _get_numpy(frames)
+        if numpy is None:
+            return array.array("q", [_round_divide(x, step) * step
+                                     for x in frames])
+        result = numpy.rint(_to_ndarray(numpy, frames) / step) * step
+        return _to_result(numpy, frames, result, "q")
+
+    def round_milliseconds(self, ms, ndigits):
+        """
+        Round a sequence of `ms` to given precision in decimal digits.
+
+        `ndigits` is the amount of decimal digits of seconds, i.e. a value of
+        three or greater leaves milliseconds unchanged, and may be negative.
+        Halves are rounded to even.
+        """
+        step = 10 ** max(0, 3 - ndigits)
+        limit = self.max_milliseconds
+        numpy = _get_numpy(ms)
+        if numpy is None:
+            return array.array("q", [
+                max(-limit, min(limit, _round_divide(x, step) * step))
+                for x in ms])
+        result = numpy.rint(_to_ndarray(numpy, ms) / step) * step
+        result = numpy.clip(result, -limit, limit)
+        return _to_result(numpy, ms, result, "q")
+
+    def round_seconds(self, seconds, ndigits):
+        """Round a sequence of `seconds` to `ndigits` decimal digits."""
+        numpy = _get_numpy(seconds)
+        if numpy is None:
+            return array.array("d", [round(x, ndigits) for x in seconds])
+        result = numpy.round(_to_ndarray(numpy, seconds), ndigits)
+        return _to_result(numpy, seconds, result, "d")
+
+    def scale_frames(self, frames, value):
+        """Multiply a sequence of `frames` by `value`."""
+        numpy = _get_numpy(frames)
+        if numpy is None:
+            return array.array("q", [round(x * value) for x in frames])
+        # NumPy doesn't multiply by fractions without object arrays.
+        result = numpy.rint(_to_ndarray(numpy, frames) * float(value))
+        return _to_result(numpy, frames, result, "q")
+
+    def scale_milliseconds(self, ms, value):
+        """Multiply a sequence of `ms` by `value`."""
+        limit = self.max_milliseconds
+        numpy = _get_numpy(ms)
+        if numpy is None:
+            return array.array("q", [max(-limit, min(limit, round(x * value)))
+                                     for x in ms])
+        result = numpy.rint(_to_ndarray(numpy, ms) * float(value))
+        result = numpy.clip(result, -limit, limit)
+        return _to_result(numpy, ms, result, "q")
+
     def seconds_to_frame(self, seconds):
         """Convert `seconds` to frame."""
         return int(round(seconds * self._framerate, 0))
 
+    def seconds_to_frames(self, seconds):
+        """Convert a sequence of `seconds` to frames."""
+        numpy = _get_numpy(seconds)
+        if numpy is None:
+            return array.array("q", map(self.seconds_to_frame, seconds))
+        frames = numpy.rint(_to_ndarray(numpy, seconds) * self._framerate)
+        return _to_result(numpy, seconds, frames, "q")
+
+    def seconds_to_milliseconds(self, seconds):
+        """Convert `seconds` to milliseconds."""
+        ms = int(round(seconds * 1000, 0))
+        return max(-self.max_milliseconds, min(self.max_milliseconds, ms))
+
     def seconds_to_time(self, seconds):
         """Convert `seconds` to time."""
-        sign = "-" if seconds < 0 else ""
-        seconds = abs(round(seconds, 3))
-        if seconds > 359999.999:
-            return "{}99:59:59.999".format(sign)
-        return ("{}{:02.0f}:{:02.0f}:{:02.0f}.{:03.0f}"
-                .format(sign,
-                        seconds // 3600,
-                        (seconds % 3600) // 60,
-                        int(seconds % 60),
-                        (seconds % 1) * 1000))
+        ms = self.seconds_to_milliseconds(seconds)
+        return self.milliseconds_to_time(ms)
+
+    def shift_frames(self, frames, value):
+        """Add `value` to a sequence of `frames`."""
+        numpy = _get_numpy(frames)
+        if numpy is None:
+            return array.array("q", [x + value for x in frames])
+        result = _to_ndarray(numpy, frames) + value
+        return _to_result(numpy, frames, result, "q")
+
+    def shift_milliseconds(self, ms, value):
+        """Add `value` to a sequence of `ms`."""
+        limit = self.max_milliseconds
+        numpy = _get_numpy(ms)
+        if numpy is None:
+            return array.array("q", [max(-limit, min(limit, x + value))
+                                     for x in ms])
+        result = _to_ndarray(numpy, ms) + value
+        result = numpy.clip(result, -limit, limit)
+        return _to_result(numpy, ms, result, "q")
 
     def time_to_frame(self, time):
         """Convert `time` to frame."""
-        seconds = self.time_to_seconds(time)
-        return self.seconds_to_frame(seconds)
+        ms = self.time_to_milliseconds(time)
+        return self.milliseconds_to_frame(ms)
+
+    def time_to_milliseconds(self, time):
+        """Convert `time` to milliseconds."""
+        if time.startswith("-"):
+            return -self.time_to_milliseconds(time[1:])
+        return (int(time[ :2]) * 3600000 +
+                int(time[3:5]) *   60000 +
+                int(time[6:8]) *    1000 +
+                int(time[9: ]))
 
     def time_to_seconds(self, time):
         """Convert `time` to seconds."""
-        coefficient = -1 if time.startswith("-") else 1
-        time = time[1:] if time.startswith("-") else time
-        return coefficient * sum((float(time[ :2]) * 3600,
-                                  float(time[3:5]) * 60,
-                                  float(time[6:8]),
-                                  float(time[9: ]) / 1000))
+        return self.time_to_milliseconds(time) / 1000
+
+    def times_to_milliseconds(self, times):
+        """Convert a sequence of `times` to milliseconds."""
+        return array.array("q", map(self.time_to_milliseconds, times))
+
+    def times_to_seconds(self, times):
+        """Convert a sequence of `times` to seconds."""
+        ms = self.times_to_milliseconds(times)
+        numpy = _get_numpy(ms)
+        if numpy is None:
+            return array.array("d", [x / 1000 for x in ms])
+        seconds = _to_ndarray(numpy, ms) / 1000
+        return _to_result(numpy, ms, seconds, "d")
 
     def to_frame(self, pos):
         """Convert `pos` to frame."""
@@ -228,6 +480,17 @@ class Calculator:
         raise ValueError("Invalid type for pos: {!r}"
                          .format(type(pos)))
 
+    def to_milliseconds(self, pos):
+        """Convert `pos` to milliseconds."""
+        if aeidon.is_time(pos):
+            return self.time_to_milliseconds(pos)
+        if aeidon.is_frame(pos):
+            return self.frame_to_milliseconds(pos)
+        if aeidon.is_seconds(pos):
+            return self.seconds_to_milliseconds(pos)
+        raise ValueError("Invalid type for pos: {!r}"
+                         .format(type(pos)))
+
     def to_seconds(self, pos):
         """Convert `pos` to seconds."""
         if aeidon.is_time(pos):
@@ -60,7 +60,7 @@ def _dump_subtitles(subtitles):
                   subtitle._end,
                   subtitle._main_text,
                   subtitle._tran_text,
-                  subtitle._framerate) for subtitle in subtitles)
+                  subtitle.framerate) for subtitle in subtitles)
 
 def _is_method(function, args):
     """
@@ -20,12 +20,38 @@
 __all__ = ("Delegate",)
 
 
+class _MasterAttribute:
+
+    """
+    Descriptor for reading an attribute of :attr:`Delegate.master`.
+
+    :class:`_MasterAttribute` is a non-data descriptor, which means that an
+    instance variable of the delegate with the same name takes precedence.
+    """
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        """Initialize a :class:`_MasterAttribute` instance."""
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        """Return value of master attribute."""
+        if instance is None: return self
+        return getattr(instance.master, self.name)
+
+
 class Delegate:
 
     """
     Base class for objects that dispatch ``self``-lookups.
 
     :ivar master: Object to where attribute calls are dispatched
+
+    Masters can declare the attributes their delegates use with
+    :meth:`bind_master_attributes`, which adds descriptors to the delegate
+    class to find those attributes directly in the master without going
+    through :meth:`__getattr__`.
     """
 
     def __init__(self, master):
@@ -42,3 +68,19 @@ class Delegate:
         if hasattr(self.master, name):
             return setattr(self.master, name, value)
         return object.__setattr__(self, name, value)
+
+    @classmethod
+    def bind_master_attributes(cls, names):
+        """
+        Add descriptors to read master attributes `names` directly.
+
+        Names defined by the class or its bases and :attr:`master` are
+        skipped. This should be called once when setting up a subclass,
+        not for :class:`Delegate` itself.
+        """
+        if cls is Delegate:
+            raise ValueError("Cannot bind master attributes to Delegate")
+        for name in names:
+            if name.startswith("__") or name == "master": continue
+            if hasattr(cls, name): continue
+            setattr(cls, name, _MasterAttribute(name))
@@ -138,6 +138,24 @@ CODE, NAME, DESC = range(3)
 _re_illegal = re.compile(r"[^a-z0-9_]")
 
 
+def can_decode(path, code, size=65536):
+    """
+    Return ``True`` if file at `path` can be decoded with `code`.
+
+    The file is read and decoded incrementally in blocks of `size` bytes,
+    stopping at the first error, without keeping the decoded text.
+    Raise :exc:`IOError` if reading fails.
+    """
+    decoder = codecs.getincrementaldecoder(code)()
+    with open(path, "rb") as f:
+        try:
+            for block in iter(lambda: f.read(size), b""):
+                decoder.decode(block)
+            decoder.decode(b"", True)
+        except UnicodeError:
+            return False
+    return True
+
 def code_to_description(code):
     """Convert encoding `code` to localized description."""
     for item in _encodings:
@@ -195,20 +213,23 @@ def detect(path):
 def detect_bom(path):
     """Return corresponding encoding if BOM found, else ``None``."""
     with open(path, "rb") as f:
-        line = f.readline()
-    if (line.startswith(codecs.BOM_UTF32_BE) and
+        return detect_bom_data(f.read(4))
+
+def detect_bom_data(data):
+    """Return corresponding encoding if BOM found in `data`, else ``None``."""
+    if (data.startswith(codecs.BOM_UTF32_BE) and
         is_valid_code("utf_32_be")):
         return "utf_32_be"
-    if (line.startswith(codecs.BOM_UTF32_LE) and
+    if (data.startswith(codecs.BOM_UTF32_LE) and
         is_valid_code("utf_32_le")):
         return "utf_32_le"
-    if (line.startswith(codecs.BOM_UTF8) and
+    if (data.startswith(codecs.BOM_UTF8) and
         is_valid_code("utf_8_sig")):
         return "utf_8_sig"
-    if (line.startswith(codecs.BOM_UTF16_BE) and
+    if (data.startswith(codecs.BOM_UTF16_BE) and
         is_valid_code("utf_16_be")):
         return "utf_16_be"
-    if (line.startswith(codecs.BOM_UTF16_LE) and
+    if (data.startswith(codecs.BOM_UTF16_LE) and
         is_valid_code("utf_16_le")):
         return "utf_16_le"
     return None
@@ -237,6 +258,26 @@ def get_valid():
             valid_encodings.append(item)
     return valid_encodings
 
+@aeidon.deco.memoize(None)
+def is_ascii_compatible(code):
+    """
+    Return ``True`` if ASCII bytes only occur as ASCII in encoding `code`.
+
+    This is true for UTF-8 and single-byte encodings, which allows scanning
+    encoded data for ASCII characters without decoding it.
+    """
+    if codecs.lookup(code).name == "utf-8":
+        return True
+    try:
+        # Check that escape sequences of stateful encodings are not decoded.
+        ascii = bytes(range(128)) + b"\x1b$B!!\x1b(B+AGE-~{!!~}"
+        if ascii.decode(code) != ascii.decode("ascii"):
+            return False
+        # Bytes are combined into characters in multibyte encodings.
+        return len(bytes(range(256)).decode(code, "replace")) == 256
+    except (LookupError, UnicodeError):
+        return False
+
 def is_valid_code(code):
     """Return ``True`` if encoding `code` is valid."""
     try:
@@ -23,6 +23,8 @@ integers. The string value of an item will be the name that it was defined with
 in its set. New items can always be added to an enumeration.
 """
 
+import importlib
+
 __all__ = ("EnumerationItem", "Enumeration",)
 
 
@@ -47,6 +49,15 @@ class EnumerationItem(int):
         """For consistency, always return ``True``."""
         return True
 
+    def __reduce_ex__(self, protocol):
+        """Return arguments to look up item by name when unpickling."""
+        location = getattr(self.parent, "location", None)
+        if location is None:
+            # Enumeration location not known,
+            # fall back on pickling a detached copy.
+            return int.__reduce_ex__(self, protocol)
+        return (_get_item, location + (self.name,))
+
     def __str__(self):
         """Return name as the string representation."""
         return self.name
@@ -57,13 +68,15 @@ class Enumeration(list):
     """
     List of named constants with integer values.
 
+    :ivar location: Module and attribute name of enumeration or ``None``
+
     :class:`Enumeration` is an actual :class:`list` where enumeration items are
     stored as both list items and instance attributes. New items should be
     added by setting an instance attribute.
 
     Typical use to create a new enumeration would be something like::
 
-        fruits = aeidon.Enumeration()
+        fruits = aeidon.Enumeration(__name__, "fruits")
         fruits.APPLE = aeidon.EnumerationItem()
         fruits.MANGO = aeidon.EnumerationItem()
         fruits.APPLE.size = 10
@@ -72,10 +85,21 @@ class Enumeration(list):
     Note that there is no finalization of an enumeration. New items can always
     be added just by assigning a new attribute to the enumeration. Likewise,
     existing items can always be removed using :func:`delattr`.
+
+    Enumerations defined at module level should be given the name of the
+    module and the name of the enumeration in it as `location`, so that
+    items can be pickled as references, i.e. unpickled as the same items.
     """
 
     NONE = None
 
+    def __init__(self, module=None, name=None):
+        """Initialize an :class:`Enumeration` instance."""
+        list.__init__(self)
+        self.location = ((module, name)
+                         if module is not None and name is not None
+                         else None)
+
     def __contains__(self, item):
         """Return ``True`` if enumeration contains `item`."""
         return list.__contains__(self, item)
@@ -98,3 +122,9 @@ class Enumeration(list):
             value = value.__class__(len(self), name, self)
             list.append(self, value)
         return object.__setattr__(self, name, value)
+
+
+def _get_item(module, name, item_name):
+    """Return enumeration item by module, enumeration and item names."""
+    enumeration = getattr(importlib.import_module(module), name)
+    return getattr(enumeration, item_name)
@@ -18,6 +18,7 @@
 """Miscellanous enumerations."""
 
 import aeidon
+import fractions
 import os
 import sys
 
@@ -35,42 +36,50 @@ __all__ = [
 ]
 
 
+class AlignMethodDTW(aeidon.EnumerationItem):
+    label = _("Subtitle timing pattern")
+
 class AlignMethodNumber(aeidon.EnumerationItem):
     label = _("Subtitle number")
 
 class AlignMethodPosition(aeidon.EnumerationItem):
     label = _("Subtitle position")
 
-align_methods = aeidon.Enumeration()
+align_methods = aeidon.Enumeration(__name__, "align_methods")
 align_methods.NUMBER = AlignMethodNumber()
 align_methods.POSITION = AlignMethodPosition()
+align_methods.DTW = AlignMethodDTW()
 
 
 class DocumentMain(aeidon.EnumerationItem): pass
 class DocumentTranslation(aeidon.EnumerationItem): pass
 
-documents = aeidon.Enumeration()
+documents = aeidon.Enumeration(__name__, "documents")
 documents.MAIN = DocumentMain()
 documents.TRAN = DocumentTranslation()
 
 
 class Framerate23976(aeidon.EnumerationItem):
+    fraction = fractions.Fraction(24000, 1001)
     label = _("23.976 fps")
     value = 24 / 1.001
 
 class Framerate24000(aeidon.EnumerationItem):
+    fraction = fractions.Fraction(24, 1)
     label = _("24.000 fps")
     value = 24.0
 
 class Framerate25000(aeidon.EnumerationItem):
+    fraction = fractions.Fraction(25, 1)
     label = _("25.000 fps")
     value = 25.0
 
 class Framerate29970(aeidon.EnumerationItem):
+    fraction = fractions.Fraction(30000, 1001)
     label = _("29.970 fps")
     value = 30 / 1.001
 
-framerates = aeidon.Enumeration()
+framerates = aeidon.Enumeration(__name__, "framerates")
 framerates.FPS_23_976 = Framerate23976()
 framerates.FPS_24_000 = Framerate24000()
 framerates.FPS_25_000 = Framerate25000()
@@ -81,7 +90,7 @@ class ModeTime(aeidon.EnumerationItem): pass
 class ModeFrame(aeidon.EnumerationItem): pass
 class ModeSeconds(aeidon.EnumerationItem): pass
 
-modes = aeidon.Enumeration()
+modes = aeidon.Enumeration(__name__, "modes")
 modes.TIME = ModeTime()
 modes.FRAME = ModeFrame()
 modes.SECONDS = ModeSeconds()
@@ -99,7 +108,7 @@ class NewlinesWindows(aeidon.EnumerationItem):
     label = "Windows"
     value = "\r\n"
 
-newlines = aeidon.Enumeration()
+newlines = aeidon.Enumeration(__name__, "newlines")
 newlines.MAC = NewlinesMac()
 newlines.UNIX = NewlinesUnix()
 newlines.WINDOWS = NewlinesWindows()
@@ -195,7 +204,7 @@ class PlayerVLC(aeidon.EnumerationItem):
 
     label = "VLC"
 
-players = aeidon.Enumeration()
+players = aeidon.Enumeration(__name__, "players")
 players.MPLAYER = PlayerMPlayer()
 players.MPV = PlayerMPV()
 players.VLC = PlayerVLC()
@@ -213,7 +222,7 @@ class RegisterRedo(aeidon.EnumerationItem):
     shift = 1
     signal = "action-redone"
 
-registers = aeidon.Enumeration()
+registers = aeidon.Enumeration(__name__, "registers")
 registers.DO = RegisterDo()
 registers.UNDO = RegisterUndo()
 registers.REDO = RegisterRedo()
@@ -305,7 +314,7 @@ class FormatWebVTT(aeidon.EnumerationItem):
     mime_type = "text/vtt"
     mode = modes.TIME
 
-formats = aeidon.Enumeration()
+formats = aeidon.Enumeration(__name__, "formats")
 formats.ASS = FormatAdvSubStationAlpha()
 formats.LRC = FormatLRC()
 formats.MICRODVD = FormatMicroDVD()
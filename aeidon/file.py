@@ -19,6 +19,7 @@
 
 import aeidon
 import codecs
+import mmap
 import os
 import re
 
@@ -30,7 +31,13 @@ class SubtitleFile:
     """
     Base class for subtitle files.
 
+    :ivar buffer: :class:`aeidon.FileBuffer` to read from or ``None``
+
+       If ``None``, the file is read from disk when reading subtitles. The
+       buffer is released once read to not keep the data of the file.
+
     :cvar format: :attr:`aeidon.formats` item corresponding to file format
+    :cvar mappable: ``True`` if format supports :meth:`iter_read_mapped`
     :cvar mode: :attr:`aeidon.modes` item corresponding to native positions
     :ivar encoding: Character encoding used to read and write file
     :ivar has_utf_16_bom: True if BOM found for UTF-16-BE or UTF-16-LE
@@ -44,10 +51,12 @@ class SubtitleFile:
     read file contains a header, it will replace the template.
     """
     format = aeidon.formats.NONE
+    mappable = False
     mode = aeidon.modes.NONE
 
     def __init__(self, path, encoding, newline=None):
         """Initialize a :class:`SubtitleFile` instance."""
+        self.buffer = None
         self.encoding = encoding
         self.has_utf_16_bom = False
         self.header = (aeidon.util.get_template_header(self.format)
@@ -62,10 +71,132 @@ class SubtitleFile:
         if self.format != other.format: return
         self.header = other.header
 
+    def _get_mapped_newlines(self, data):
+        """Return a tuple of newline types found in bytes `data`."""
+        newlines = []
+        if re.search(rb"\r(?!\n)", data) is not None:
+            newlines.append("\r")
+        if re.search(rb"(?<!\r)\n", data) is not None:
+            newlines.append("\n")
+        if data.find(b"\r\n") >= 0:
+            newlines.append("\r\n")
+        return tuple(newlines)
+
     def _get_subtitle(self):
         """Return a new subtitle instance with proper properties."""
         return aeidon.Subtitle(self.mode)
 
+    def iter_read(self):
+        """
+        Read file and iterate over subtitles.
+
+        Subtitles are read incrementally with only a few lines of lookahead,
+        which allows processing large files without reading all of the file
+        or all of its subtitles into memory at once.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        raise NotImplementedError
+
+    def _iter_mapped(self, data):
+        """Iterate over subtitles in memory-mapped bytes `data`."""
+        raise NotImplementedError
+
+    def iter_read_mapped(self):
+        """
+        Read file memory-mapped and iterate over subtitles.
+
+        If the format is :attr:`mappable`, the file is scanned for subtitles
+        as bytes, positions are parsed directly from bytes and only the text
+        of each subtitle is decoded, which keeps memory use low for very large
+        files. Otherwise, or if the encoding is not ASCII-compatible or the
+        file uses Mac newlines, the file is read with :meth:`iter_read`.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        if (not self.mappable or
+            not aeidon.encodings.is_ascii_compatible(self.encoding) or
+            # Empty files cannot be memory-mapped.
+            os.path.getsize(self.path) == 0):
+            yield from self.iter_read()
+            return
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                newlines = self._get_mapped_newlines(data)
+                if not "\r" in newlines:
+                    if (self.encoding == "utf_8" and
+                        data[:3] == codecs.BOM_UTF8):
+                        self.encoding = "utf_8_sig"
+                    yield from self._iter_mapped(data)
+                    newline = aeidon.util.find_newline(newlines or None)
+                    if newline is not None:
+                        self.newline = newline
+                    return
+        # Regular expressions do not recognize lone carriage returns
+        # as line boundaries, which is why Mac newlines need decoding.
+        yield from self.iter_read()
+
+    def _iter_lines(self):
+        """
+        Read file and iterate over lines.
+
+        All newlines are stripped.
+        All blank lines from beginning and end are skipped.
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        """
+        if self.encoding.startswith("utf_16"):
+            # Erroneous linebreaks in UTF-16 encoded files
+            # can only be detected after reading all lines.
+            yield from self._read_lines()
+            return
+        yield from self._iter_text_lines()
+
+    def _iter_raw_lines(self):
+        """
+        Read file and iterate over lines with newlines.
+
+        Lines are read from :attr:`buffer` if set, otherwise from disk.
+        :attr:`newline` is set once all lines have been read.
+        """
+        buffer, self.buffer = self.buffer, None
+        encoding = self.encoding
+        if buffer is not None:
+            yield from buffer.iter_lines(encoding)
+            newline = buffer.detect_newlines(encoding)
+        else:
+            with open(self.path, "r", encoding=encoding) as f:
+                yield from f
+                newline = aeidon.util.find_newline(f.newlines)
+        if newline is not None:
+            self.newline = newline
+
+    def _iter_text_lines(self):
+        """Iterate over lines of file without special UTF-16 handling."""
+        re_newline_char = re.compile(r"\r?\n?$")
+        blank_lines = []
+        started = False
+        for i, line in enumerate(self._iter_raw_lines()):
+            line = re_newline_char.sub("", line)
+            if i == 0 and self.encoding == "utf_8":
+                bom = str(codecs.BOM_UTF8, "utf_8")
+                if line.startswith(bom):
+                    # If a UTF-8 BOM (a.k.a. signature) is found, switch to
+                    # UTF-8-SIG encoding, which automatically strips the BOM
+                    # when reading and adds it when writing.
+                    self.encoding = "utf_8_sig"
+                    line = line[len(bom):]
+            if not line.strip():
+                # Hold blank lines until the next non-blank line
+                # to skip them at the beginning and end of file.
+                if started:
+                    blank_lines.append(line)
+                continue
+            yield from blank_lines
+            blank_lines = []
+            started = True
+            yield line
+
     def read(self):
         """
         Read file and return subtitles.
@@ -73,7 +204,7 @@ class SubtitleFile:
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        raise NotImplementedError
+        return list(self.iter_read())
 
     def _read_lines(self):
         """
@@ -85,24 +216,7 @@ class SubtitleFile:
         Raise :exc:`UnicodeError` if decoding fails.
         Return a list of lines read.
         """
-        re_newline_char = re.compile(r"\r?\n?$")
-        with open(self.path, "r", encoding=self.encoding) as f:
-            lines = f.readlines()
-            lines = [re_newline_char.sub("", x) for x in lines]
-        for index in (0, -1):
-            while lines and not lines[index].strip():
-                lines.pop(index)
-        newline = aeidon.util.detect_newlines(self.path)
-        if newline is not None:
-            self.newline = newline
-        if self.encoding == "utf_8":
-            bom = str(codecs.BOM_UTF8, "utf_8")
-            if lines and lines[0].startswith(bom):
-                # If a UTF-8 BOM (a.k.a. signature) is found, reread file with
-                # UTF-8-SIG encoding, which automatically strips the BOM when
-                # reading and adds it when writing.
-                self.encoding = "utf_8_sig"
-                return SubtitleFile._read_lines(self)
+        lines = list(self._iter_text_lines())
         if self.encoding.startswith("utf_16"):
             # Python automatically strips the UTF-16 BOM when reading, but only
             # when using UTF-16. If using UTF-16-BE or UTF-16-LE, the BOM is
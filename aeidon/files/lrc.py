@@ -35,18 +35,20 @@ class LRC(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d\d:\d\d.\d\d)\](.*)$")
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = [self._get_subtitle()]
-        for line in self._read_lines():
+        # End position of a subtitle is the start position of the next one,
+        # which is why each subtitle can be yielded only once the next is read.
+        previous = None
+        for line in self._iter_lines():
             match = self._re_line.match(line)
-            if match is None and len(subtitles) == 1:
+            if match is None and previous is None:
                 # Read line into file header.
                 if self.header:
                     self.header += "\n"
@@ -55,11 +57,14 @@ class LRC(aeidon.SubtitleFile):
                 subtitle = self._get_subtitle()
                 normalize = subtitle.calc.normalize_time
                 subtitle.start_time = normalize(match.group(1))
-                subtitles[-1].end_time = subtitle.start_time
                 subtitle.main_text = match.group(2) or ""
-                subtitles.append(subtitle)
-        subtitles[-1].duration_seconds = 5
-        return subtitles[1:]
+                if previous is not None:
+                    previous.end_time = subtitle.start_time
+                    yield previous
+                previous = subtitle
+        if previous is not None:
+            previous.duration_seconds = 5
+            yield previous
 
     def write_to_file(self, subtitles, doc, f):
         """
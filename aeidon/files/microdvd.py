@@ -28,28 +28,49 @@ class MicroDVD(aeidon.SubtitleFile):
     """MicroDVD file."""
 
     format = aeidon.formats.MICRODVD
+    mappable = True
     mode = aeidon.modes.FRAME
     _re_line = re.compile(r"^\{(-?\d+)\}\{(-?\d+)\}(.*?)$")
 
-    def read(self):
+    _re_mapped_line = re.compile((
+        # Same as the above line or a header line, but for bytes,
+        # allowing a UTF-8 BOM at the start of the first line.
+        rb"(?:^|(?<=\A\xef\xbb\xbf))"
+        rb"(?:\{(-?\d+)\}\{(-?\d+)\}([^\r\n]*)|(\{DEFAULT\}[^\r\n]*))"),
+        re.MULTILINE)
+
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is not None:
                 subtitle = self._get_subtitle()
                 subtitle.start_frame = int(match.group(1))
                 subtitle.end_frame = int(match.group(2))
                 subtitle.main_text = match.group(3).replace("|", "\n")
-                subtitles.append(subtitle)
+                yield subtitle
             elif line.startswith("{DEFAULT}"):
                 self.header = line
-        return subtitles
+
+    def _iter_mapped(self, data):
+        """Iterate over subtitles in memory-mapped bytes `data`."""
+        for match in self._re_mapped_line.finditer(data):
+            if match.group(4) is not None:
+                self.header = match.group(4).decode(self.encoding)
+                continue
+            subtitle = self._get_subtitle()
+            subtitle._set_native_positions(int(match.group(1)),
+                                           int(match.group(2)),
+                                           aeidon.modes.FRAME)
+
+            text = match.group(3).decode(self.encoding)
+            subtitle.main_text = text.replace("|", "\n")
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
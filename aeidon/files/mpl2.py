@@ -31,23 +31,21 @@ class MPL2(aeidon.SubtitleFile):
     mode = aeidon.modes.TIME
     _re_line = re.compile(r"^\[(-?\d+)\]\[(-?\d+)\](.*?)$")
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        for line in self._iter_lines():
             match = self._re_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_seconds = float(match.group(1)) / 10
             subtitle.end_seconds = float(match.group(2)) / 10
             subtitle.main_text = match.group(3).replace("|", "\n")
-            subtitles.append(subtitle)
-        return subtitles
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
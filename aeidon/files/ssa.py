@@ -93,39 +93,42 @@ class SubStationAlpha(aeidon.SubtitleFile):
         name = aeidon.util.title_to_lower_case(field_name)
         return getattr(subtitle.ssa, name)
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
+        Dialogue lines are read using the fields of the last format line
+        before them in the ``[Events]`` section.
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        lines = self._read_lines()
+        lines = self._iter_lines()
         self._read_header(lines)
         for line in lines:
-            if not line.startswith("Format:"): continue
-            line = line.replace("Format:", "").strip()
-            fields = self._re_separator.split(line)
-            indices = dict((x, fields.index(x)) for x in fields)
-            max_split = len(fields) - 1
-        for line in lines:
+            if line.startswith("Format:"):
+                line = line.replace("Format:", "").strip()
+                fields = self._re_separator.split(line)
+                indices = dict((x, fields.index(x)) for x in fields)
+                max_split = len(fields) - 1
+                self.event_fields = tuple(fields)
             if not line.startswith("Dialogue:"): continue
             line = line.replace("Dialogue:", "").lstrip()
             values = self._re_separator.split(line, max_split)
             subtitle = self._get_subtitle()
             for name, index in indices.items():
                 self._decode_field(name, values[index], subtitle)
-            subtitles.append(subtitle)
-        self.event_fields = tuple(fields)
-        return subtitles
+            yield subtitle
 
     def _read_header(self, lines):
-        """Read header and remove its lines."""
+        """Read header from iterator of `lines` up to ``[Events]``."""
         self.header = ""
-        while not lines[0].startswith("[Events]"):
+        for line in lines:
+            if line.startswith("[Events]"): break
             self.header += "\n"
-            self.header += lines.pop(0)
+            self.header += line
+        else:
+            raise ValueError("Events section not found in file {!r}"
+                             .format(self.path))
         self.header = self.header.strip()
 
     def write_to_file(self, subtitles, doc, f):
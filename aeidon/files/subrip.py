@@ -28,8 +28,21 @@ class SubRip(aeidon.SubtitleFile):
     """SubRip file."""
 
     format = aeidon.formats.SUBRIP
+    mappable = True
     mode = aeidon.modes.TIME
 
+    _re_mapped_time_line = re.compile((
+        # Same as the below time line, but for bytes with signs, hours,
+        # minutes, seconds and fractions as separate groups, allowing
+        # a UTF-8 BOM at the start of the first line.
+        rb"(?:^|(?<=\A\xef\xbb\xbf))"
+        rb"(-?)(\d{1,2}):(\d{1,2}):(\d{1,2}),(\d{1,3}) -->"
+        rb" (-?)(\d{1,2}):(\d{1,2}):(\d{1,2}),(\d{1,3})"
+        rb"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?[ \t\f\v]*\r?$"),
+        re.MULTILINE)
+
+    _re_newline = re.compile(r"\r\n|\r|\n")
+
     _re_time_line = re.compile((
         # Techically all these fields should have fixed widths, but in the
         # name of being liberal in accepting input, accept lesser widths
@@ -39,21 +52,69 @@ class SubRip(aeidon.SubtitleFile):
         r" (-?\d{1,2}:\d{1,2}:\d{1,2},\d{1,3})"
         r"(  X1:(\d+) X2:(\d+) Y1:(\d+) Y2:(\d+))?\s*$"))
 
-    def read(self):
+    def _add_text(self, subtitle, line):
+        """Add `line` to the end of text of `subtitle`."""
+        if subtitle.main_text:
+            subtitle.main_text += "\n"
+        subtitle.main_text += line
+
+    def _get_mapped_lines(self, data, start, end):
+        """Return decoded lines of bytes `data` from `start` to `end`."""
+        text = data[start:end].decode(self.encoding)
+        return self._re_newline.split(text)
+
+    def _get_mapped_subtitle(self, match):
+        """Return a new subtitle from time line `match` of bytes."""
+        subtitle = self._get_subtitle()
+        subtitle._set_native_positions(self._get_mapped_time(match, 1),
+                                       self._get_mapped_time(match, 6),
+                                       aeidon.modes.TIME)
+
+        if match.group(11) is not None:
+            subtitle.subrip.x1 = int(match.group(12))
+            subtitle.subrip.x2 = int(match.group(13))
+            subtitle.subrip.y1 = int(match.group(14))
+            subtitle.subrip.y2 = int(match.group(15))
+        return subtitle
+
+    def _get_mapped_time(self, match, group):
+        """Return time of `match` starting at `group` as milliseconds."""
+        sign, hours, minutes, seconds, fraction = match.group(
+            group, group + 1, group + 2, group + 3, group + 4)
+        value = (int(hours) * 3600000 +
+                 int(minutes) * 60000 +
+                 int(seconds) * 1000 +
+                 int(fraction.ljust(3, b"0")))
+        return -value if sign else value
+
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
-        for line in self._read_lines():
+        subtitle = None
+        # Lines after the last time line, of which the last two can still
+        # turn out to be a number and a blank line above the next time line.
+        lines = ["\n"]
+        for line in self._iter_lines():
             match = self._re_time_line.match(line)
             if match is None:
-                if subtitles[-1].main_text:
-                    subtitles[-1].main_text += "\n"
-                subtitles[-1].main_text += line
+                lines.append(line)
+                if len(lines) > 2:
+                    self._add_text(subtitle, lines.pop(0))
                 continue
+            # Remove numbers and blank lines above them.
+            if lines and lines[-1].strip().isdigit():
+                lines.pop(-1)
+                if lines and not lines[-1].strip():
+                    lines.pop(-1)
+            for text in lines:
+                self._add_text(subtitle, text)
+            lines = []
+            if subtitle is not None:
+                yield subtitle
             subtitle = self._get_subtitle()
             subtitle.start_time = subtitle.calc.normalize_time(match.group(1))
             subtitle.end_time = subtitle.calc.normalize_time(match.group(2))
@@ -62,22 +123,52 @@ class SubRip(aeidon.SubtitleFile):
                 subtitle.subrip.x2 = int(match.group(5))
                 subtitle.subrip.y1 = int(match.group(6))
                 subtitle.subrip.y2 = int(match.group(7))
-            subtitles.append(subtitle)
-        return subtitles
+        for text in lines:
+            self._add_text(subtitle, text)
+        if subtitle is not None:
+            yield subtitle
 
-    def _read_lines(self):
-        """Read file to a unicoded list of lines."""
-        lines = ["\n"]
-        for line in aeidon.SubtitleFile._read_lines(self):
-            lines.append(line)
-            match = self._re_time_line.match(line)
-            if match is None: continue
+    def _iter_mapped(self, data):
+        """Iterate over subtitles in memory-mapped bytes `data`."""
+        subtitle = None
+        start = 0
+        for match in self._re_mapped_time_line.finditer(data):
+            lines = self._get_mapped_lines(data, start, match.start())
+            # Skip the end of the previous time line
+            # and the empty string after the last newline.
+            lines = lines[1:-1] if subtitle is not None else lines[:-1]
+            if subtitle is None:
+                # Only a number and blank lines are allowed
+                # above the first time line.
+                while lines and not lines[0].strip():
+                    lines.pop(0)
+                lines.insert(0, "\n")
             # Remove numbers and blank lines above them.
-            if lines[-2].strip().isdigit():
-                if not lines[-3].strip():
-                    lines.pop(-3)
-                lines.pop(-2)
-        return lines
+            if lines and lines[-1].strip().isdigit():
+                lines.pop(-1)
+                if lines and not lines[-1].strip():
+                    lines.pop(-1)
+            if subtitle is None and lines:
+                raise ValueError("Invalid text before first subtitle")
+            if subtitle is not None:
+                self._set_mapped_text(subtitle, lines)
+                yield subtitle
+            subtitle = self._get_mapped_subtitle(match)
+            start = match.end()
+        if subtitle is None:
+            raise ValueError("No subtitles found")
+        lines = self._get_mapped_lines(data, start, len(data))[1:]
+        while lines and not lines[-1].strip():
+            lines.pop(-1)
+        self._set_mapped_text(subtitle, lines)
+        yield subtitle
+
+    def _set_mapped_text(self, subtitle, lines):
+        """Set text of `subtitle` from `lines` like :meth:`iter_read`."""
+        # Leading empty lines are not added to text.
+        while lines and not lines[0]:
+            lines.pop(0)
+        subtitle.main_text = "\n".join(lines)
 
     def write_to_file(self, subtitles, doc, f):
         """
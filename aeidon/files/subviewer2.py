@@ -18,6 +18,7 @@
 """SubViewer 2.0 file."""
 
 import aeidon
+import itertools
 import re
 
 __all__ = ("SubViewer2",)
@@ -32,30 +33,37 @@ class SubViewer2(aeidon.SubtitleFile):
     _re_time_line = re.compile((r"^(-?\d\d:\d\d:\d\d.\d\d)"
                                 r",(-?\d\d:\d\d:\d\d.\d\d)\s*$"))
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
         self.header = ""
-        subtitles = []
-        lines = self._read_lines()
-        while lines[0].startswith("["):
+        lines = self._iter_lines()
+        for line in lines:
+            if not line.startswith("["): break
             self.header += "\n"
-            self.header += lines.pop(0)
+            self.header += line
+        else:
+            line = None
         self.header = self.header.lstrip()
-        for i, line in enumerate(lines + [""]):
+        if line is None: return
+        # Text is on the line following the time line.
+        subtitle = None
+        for line in itertools.chain((line,), lines):
+            if subtitle is not None:
+                subtitle.main_text = line.replace("[br]", "\n")
+                yield subtitle
+                subtitle = None
             match = self._re_time_line.match(line)
             if match is None: continue
             subtitle = self._get_subtitle()
             subtitle.start_time = match.group(1) + "0"
             subtitle.end_time = match.group(2) + "0"
-            text = lines[i+1].replace("[br]", "\n")
-            subtitle.main_text = text
-            subtitles.append(subtitle)
-        return subtitles
+        if subtitle is not None:
+            yield subtitle
 
     def write_to_file(self, subtitles, doc, f):
         """
@@ -27,6 +27,11 @@ class TestLRC(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_read(self):
+        subtitles = self.file.iter_read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
     def test_read(self):
         assert self.file.read()
 
@@ -27,6 +27,17 @@ class TestMicroDVD(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_read(self):
+        subtitles = self.file.iter_read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
+    def test_iter_read_mapped(self):
+        subtitles = list(self.file.iter_read_mapped())
+        assert subtitles == self.file.read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
     def test_read(self):
         assert self.file.read()
 
@@ -27,6 +27,11 @@ class TestMPL2(aeidon.TestCase):
                                      self.new_temp_file(self.format),
                                      "ascii")
 
+    def test_iter_read(self):
+        subtitles = self.file.iter_read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
     def test_read(self):
         assert self.file.read()
 
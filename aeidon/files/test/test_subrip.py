@@ -27,6 +27,17 @@ class TestSubRip(aeidon.TestCase):
         path = self.new_temp_file(self.format, self.name)
         self.file = aeidon.files.new(self.format, path, "ascii")
 
+    def test_iter_read(self):
+        subtitles = self.file.iter_read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
+    def test_iter_read_mapped(self):
+        subtitles = list(self.file.iter_read_mapped())
+        assert subtitles == self.file.read()
+        texts = [x.main_text for x in subtitles]
+        assert texts == [x.main_text for x in self.file.read()]
+
     def test_read(self):
         assert self.file.read()
 
@@ -18,6 +18,7 @@
 """WebVTT file."""
 
 import aeidon
+import itertools
 import re
 
 __all__ = ("WebVTT",)
@@ -45,22 +46,24 @@ class WebVTT(aeidon.SubtitleFile):
         r" (-?(?:\d{1,2}:)?\d{1,2}:\d{1,2}\.\d{1,3})"
         r"(\s+.+)?\s*$"))
 
-    def read(self):
+    def iter_read(self):
         """
-        Read file and return subtitles.
+        Read file and iterate over subtitles.
 
         Raise :exc:`IOError` if reading fails.
         Raise :exc:`UnicodeError` if decoding fails.
         """
-        subtitles = []
         current = "header"
         self.header = ""
-        lines = list(self._read_lines()) + [""]
-        for i, line in enumerate(lines):
+        subtitle = None
+        previous = ""
+        for line in itertools.chain(self._iter_lines(), ("",)):
             if not line.strip():
                 # A blank line terminates the preceding block.
+                if current == "text":
+                    yield subtitle
                 if current in ("header", "text"):
-                    subtitles.append(self._get_subtitle())
+                    subtitle = self._get_subtitle()
                 current = None
             elif current == "header":
                 # Header should be one line, but allow a block.
@@ -70,7 +73,6 @@ class WebVTT(aeidon.SubtitleFile):
             elif (self._re_style.match(line) or
                   current == "style"):
                 # Bind CSS styles to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.style:
                     subtitle.webvtt.style += "\n"
                 subtitle.webvtt.style += line
@@ -78,7 +80,6 @@ class WebVTT(aeidon.SubtitleFile):
             elif (self._re_comment.match(line) or
                   current == "comment"):
                 # Bind comments to following subtitle.
-                subtitle = subtitles[-1]
                 if subtitle.webvtt.comment:
                     subtitle.webvtt.comment += "\n"
                 subtitle.webvtt.comment += line
@@ -86,9 +87,8 @@ class WebVTT(aeidon.SubtitleFile):
             elif self._re_time_line.match(line):
                 # Time lines form a block with an optional preceding
                 # cue identifier and following text.
-                subtitle = subtitles[-1]
-                if lines[i-1].strip():
-                    subtitle.webvtt.id = lines[i-1]
+                if previous.strip():
+                    subtitle.webvtt.id = previous
                 match = self._re_time_line.match(line)
                 normalize = subtitle.calc.normalize_time
                 subtitle.start_time = normalize(match.group(1))
@@ -97,14 +97,13 @@ class WebVTT(aeidon.SubtitleFile):
                 current = "text"
             elif current == "text":
                 # Append inividual lines to text block.
-                subtitle = subtitles[-1]
                 if subtitle.main_text:
                     subtitle.main_text += "\n"
                 subtitle.main_text += line
+            previous = line
         # The last blank line has opened a new subtitle without times or text,
         # which we skip. This also means that any possible styles or comments
         # after the last actual subtitle are thrown out as well.
-        return subtitles[:-1]
 
     def write_to_file(self, subtitles, doc, f):
         """
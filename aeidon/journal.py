@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Temporary disk storage for data of revertable actions."""
+
+import aeidon
+import os
+import pickle
+import zlib
+
+__all__ = ("Journal",)
+
+
+class Journal:
+
+    """
+    Temporary disk storage for data of revertable actions.
+
+    :ivar path: Path to the temporary file or ``None`` if not yet created
+
+    Objects are pickled, compressed and appended to a file created with
+    :func:`aeidon.temp.create` when first written to. :meth:`write` returns
+    a key with which the object can be read back once or released unread
+    with :meth:`release`. Once all objects have been read back or released,
+    the file is truncated. If more than half of the file is taken by
+    released objects, the remaining ones are copied to the beginning of the
+    file and the file is truncated, so that the file size stays proportional
+    to the size of objects not yet released.
+    """
+
+    def __init__(self):
+        """Initialize a :class:`Journal` instance."""
+        self.path = None
+        self._next_key = 0
+        self._records = {}
+        self._size = 0
+        self._used = 0
+
+    def __len__(self):
+        """Return the amount of objects not yet read back or released."""
+        return len(self._records)
+
+    def _compact(self):
+        """Copy remaining objects to the beginning of the file."""
+        offset = 0
+        records = sorted(self._records.items(), key=lambda x: x[1])
+        with open(self.path, "r+b") as f:
+            for key, (old_offset, length) in records:
+                if old_offset != offset:
+                    f.seek(old_offset)
+                    blob = f.read(length)
+                    f.seek(offset)
+                    f.write(blob)
+                self._records[key] = (offset, length)
+                offset += length
+            f.truncate(offset)
+        self._size = offset
+
+    def read(self, key):
+        """Return object stored with `key` and release it."""
+        offset, length = self._records[key]
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            blob = f.read(length)
+        self.release(key)
+        return pickle.loads(zlib.decompress(blob))
+
+    def release(self, key):
+        """Release object stored with `key` without reading it."""
+        offset, length = self._records.pop(key)
+        self._used -= length
+        if not self._records:
+            with open(self.path, "r+b") as f:
+                f.truncate(0)
+            self._size = 0
+            return
+        if self._used < self._size // 2:
+            self._compact()
+
+    def remove(self):
+        """Remove the temporary file."""
+        if self.path is not None:
+            aeidon.temp.remove(self.path)
+        self.path = None
+        self._records = {}
+        self._size = 0
+        self._used = 0
+
+    def write(self, obj):
+        """Store `obj` to disk and return a key to read it back."""
+        blob = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        blob = zlib.compress(blob, 1)
+        if self.path is None:
+            self.path = aeidon.temp.create(".journal")
+        with open(self.path, "ab") as f:
+            f.seek(0, os.SEEK_END)
+            offset = f.tell()
+            f.write(blob)
+        key = self._next_key
+        self._next_key += 1
+        self._records[key] = (offset, len(blob))
+        self._size = offset + len(blob)
+        self._used += len(blob)
+        return key
@@ -17,6 +17,7 @@
 
 """Observable versions of built-in mutable objects."""
 
+import aeidon
 import copy
 import functools
 
@@ -126,6 +127,29 @@ class ObservableList(list):
     def append(self, *args, **kwargs):
         return list.append(self, *args, **kwargs)
 
+    @_mutation
+    def bulk_insert(self, indices, items):
+        """
+        Insert `items` at `indices` with one notification.
+
+        The result is the same as inserting items one by one, but if
+        `indices` are sorted and unique, the list is rebuilt once instead.
+        """
+        ranges = aeidon.IndexRanges(indices)
+        if ranges != indices:
+            for index, item in zip(indices, items):
+                list.insert(self, index, item)
+            return
+        list.__setitem__(self, slice(None), ranges.insert_into(self, items))
+
+    @_mutation
+    def bulk_remove(self, indices):
+        """Remove items at unique `indices` and return them in order."""
+        ranges = aeidon.IndexRanges(indices)
+        items = [list.__getitem__(self, i) for i in ranges]
+        list.__setitem__(self, slice(None), ranges.remove_from(self))
+        return items
+
     @_mutation
     def extend(self, *args, **kwargs):
         return list.extend(self, *args, **kwargs)
@@ -150,6 +174,13 @@ class ObservableList(list):
     def sort(self, *args, **kwargs):
         return list.sort(self, *args, **kwargs)
 
+    @_mutation
+    def splice(self, index, count, items=()):
+        """Replace `count` items at `index` with `items` and return removed."""
+        removed = list.__getitem__(self, slice(index, index + count))
+        list.__setitem__(self, slice(index, index + count), items)
+        return removed
+
 
 class ObservableSet(set):
 
@@ -18,9 +18,26 @@
 """Base class for observable objects."""
 
 import aeidon
+import sys
 
 __all__ = ("Observable",)
 
+# Interned notify signals by attribute name and vice versa,
+# shared by all observables to avoid formatting signal names.
+_notify_signals = {}
+_notify_names = {}
+
+
+def _get_notify_signal(name):
+    """Return interned ``notify::NAME`` signal for attribute `name`."""
+    try:
+        return _notify_signals[name]
+    except KeyError:
+        signal = sys.intern("notify::{}".format(name))
+        _notify_signals[name] = signal
+        _notify_names[signal] = name
+        return signal
+
 
 class Observable:
 
@@ -57,7 +74,7 @@ class Observable:
 
     def __init__(self):
         """Initialize an :class:`Observable` instance."""
-        self._blocked_signals = []
+        self._blocked_signals = set()
         self._blocked_state = False
         self._notify_frozen = False
         self._notify_queue = []
@@ -67,10 +84,10 @@ class Observable:
 
     def __setattr__(self, name, value):
         """Set value of observable attribute."""
-        if (name in self.__slots__) or name.startswith("_"):
+        if name.startswith("_") or (name in self.__slots__):
             return object.__setattr__(self, name, value)
         value = self._validate(name, value)
-        signal = "notify::{}".format(name)
+        signal = _get_notify_signal(name)
         if not signal in self._signal_handlers:
             self._add_signal(signal)
             return object.__setattr__(self, name, value)
@@ -80,7 +97,7 @@ class Observable:
 
     def _add_signal(self, signal):
         """Add `signal` to the list of signals emitted."""
-        self._signal_handlers[signal] = []
+        self._signal_handlers[sys.intern(signal)] = []
 
     def block(self, signal):
         """
@@ -89,7 +106,7 @@ class Observable:
         Return ``False`` if already blocked, otherwise ``True``.
         """
         if not signal in self._blocked_signals:
-            self._blocked_signals.append(signal)
+            self._blocked_signals.add(signal)
             return True
         return False
 
@@ -116,17 +133,19 @@ class Observable:
 
     def emit(self, signal, *args):
         """Send notification of ``signal`` to all registered observers."""
-        if signal.startswith("notify::") and self._notify_frozen:
+        name = _notify_names.get(signal)
+        if name is not None and self._notify_frozen:
             if not signal in self._notify_queue:
                 self._notify_queue.append(signal)
             return
-        if (not self._blocked_state and
-            not signal in self._blocked_signals):
-            if signal.startswith("notify::"):
-                name = signal.replace("notify::", "")
-                args = (getattr(self, name),)
-            for method, data in self._signal_handlers[signal]:
-                method(*((self,) + args + data))
+        if self._blocked_state or signal in self._blocked_signals:
+            return
+        handlers = self._signal_handlers[signal]
+        if not handlers: return
+        if name is not None:
+            args = (getattr(self, name),)
+        for method, data in handlers:
+            method(*((self,) + args + data))
 
     def freeze_notify(self):
         """
@@ -139,9 +158,13 @@ class Observable:
             return True
         return False
 
+    def is_notify_signal(self, signal):
+        """Return ``True`` if `signal` is a ``notify::NAME`` signal."""
+        return signal in _notify_names
+
     def notify(self, name):
         """Emit notification signal for variable."""
-        return self.emit("notify::{}".format(name))
+        return self.emit(_get_notify_signal(name))
 
     def thaw_notify(self, do=True):
         """
@@ -157,8 +180,7 @@ class Observable:
         if do and self._notify_frozen:
             self._notify_frozen = False
             for signal in self._notify_queue:
-                name = signal.replace("notify::", "")
-                self.emit(signal, getattr(self, name))
+                self.emit(signal)
             self._notify_queue = []
             return True
         return False
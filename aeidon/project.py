@@ -30,14 +30,24 @@ class ProjectMeta(type):
     Public methods are added to the class dictionary during :meth:`__new__`
     in order to fool Sphinx (and perhaps other API documentation generators)
     into thinking that the resulting instantiated class actually contains those
-    methods, which it does not since the methods are removed during
-    :meth:`Project.__init__`.
+    methods, which it does not since the methods are removed when the first
+    instance is initialized.
+
+    The mapping of delegated method names to agent classes is computed once
+    here and saved as class attribute ``_agent_classes``. Agent classes that
+    define their own ``__init__``, e.g. to connect to signals, are saved as
+    ``_eager_agent_classes`` to be instantiated along with the project, other
+    agents are instantiated only when first used.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        agent_classes = {}
+        eager_agent_classes = []
         for agent_class_name in aeidon.agents.__all__:
             agent_class = getattr(aeidon.agents, agent_class_name)
+            if agent_class.__init__ is not aeidon.Delegate.__init__:
+                eager_agent_classes.append(agent_class)
             def is_delegate_method(name):
                 value = getattr(agent_class, name)
                 return (callable(value) and
@@ -46,7 +56,14 @@ class ProjectMeta(type):
 
             attr_names = list(filter(is_delegate_method, dir(agent_class)))
             for attr_name in attr_names:
+                if attr_name in agent_classes:
+                    raise ValueError("Multiple definitions of {!r}"
+                                     .format(attr_name))
+
+                agent_classes[attr_name] = agent_class
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+        new_dict["_agent_classes"] = agent_classes
+        new_dict["_eager_agent_classes"] = tuple(eager_agent_classes)
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -57,7 +74,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar calc: Instance of :class:`aeidon.Calculator` used
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
-    :ivar _delegations: Dictionary mapping method names to agent methods
+    :ivar _deferred_signals: List of signals and arguments or ``None``
+
+       Within :meth:`transaction`, signals other than notify signals and
+       signals of inserted and removed subtitles are stored here instead of
+       being emitted immediately.
+
+    :ivar _agents: Dictionary mapping agent classes to instances
     :ivar framerate: :attr:`aeidon.framerates` item corresponding to video
     :ivar main_changed: Integer, status of main document
 
@@ -66,8 +89,19 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
        one and undoing decreases value by one.
 
     :ivar main_file: Main instance of :class:`aeidon.SubtitleFile`
-    :ivar redoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar map_size: Minimum file size in bytes to read memory-mapped or None
+
+       Files at least this large are opened without reading them into
+       memory first and read with :meth:`aeidon.SubtitleFile.iter_read_mapped`.
+       Use zero to always read files memory-mapped.
+
+    :ivar redoables: :class:`aeidon.RevertableActionStack` of actions
     :ivar subtitles: List of :class:`aeidon.Subtitle` instances
+
+       If the project was created with ``table=True``, this will be an
+       :class:`aeidon.SubtitleTable` instead, which stores subtitle data
+       in columns and can be used in place of a list.
+
     :ivar tran_changed: Integer, status of translation document
 
        At unchanged state (i.e. file on disk corresponds to the state of the
@@ -76,7 +110,13 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
 
     :ivar tran_file: Translation instance of :class:`aeidon.SubtitleFile`
     :ivar undo_limit: Maximum size of undo/redo stacks or None for no limit
-    :ivar undoables: Stack of :class:`aeidon.RevertableAction` instances
+    :ivar undo_memory_limit: Maximum memory in bytes or None for no limit
+
+       If the estimated memory size of data needed to revert actions in the
+       undo and redo stacks exceeds this value, data of the oldest actions is
+       moved to a temporary file on disk, see :class:`aeidon.Journal`.
+
+    :ivar undoables: :class:`aeidon.RevertableActionStack` of actions
     :ivar video_path: Full, absolute path to the video file on disk
 
     Signals and their arguments for callback functions:
@@ -93,6 +133,8 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
      * ``translation-file-opened``: project, tran_file
      * ``translation-file-saved``: project, tran_file
      * ``translation-texts-changed``: project, indices
+
+    Indices of subtitles are passed as :class:`aeidon.IndexRanges`.
     """
 
     signals = (
@@ -111,21 +153,31 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
         "translation-texts-changed",
     )
 
-    def __init__(self, framerate=None):
-        """Initialize a :class:`Project` instance."""
+    def __init__(self, framerate=None, table=False):
+        """
+        Initialize a :class:`Project` instance.
+
+        `table` can be ``True`` to store subtitles in a columnar
+        :class:`aeidon.SubtitleTable` instead of a list, which uses less
+        memory and allows operating on positions column-wise.
+        """
         aeidon.Observable.__init__(self)
+        self._table = table
         framerate = framerate or aeidon.framerates.FPS_23_976
         self.calc = aeidon.Calculator(framerate)
         self.clipboard = aeidon.Clipboard()
-        self._delegations = {}
+        self._agents = {}
+        self._deferred_signals = None
         self.framerate = framerate
         self.main_changed = 0
         self.main_file = None
+        self.map_size = 16 * 1024 * 1024
         self.redoables = []
         self.subtitles = []
         self.tran_changed = None
         self.tran_file = None
         self.undo_limit = 100000
+        self.undo_memory_limit = 256 * 1024 * 1024
         self.undoables = []
         self.video_path = None
         self._init_delegations()
@@ -133,28 +185,72 @@ class Project(aeidon.Observable, metaclass=ProjectMeta):
     def __getattr__(self, name):
         """Return method delegated to an agent."""
         try:
-            return self._delegations[name]
+            agent_class = self._agent_classes[name]
         except LookupError:
             raise AttributeError
+        method = getattr(self._get_agent(agent_class), name)
+        # Store the bound method as an instance attribute so that
+        # subsequent lookups find it without calling __getattr__.
+        self.__dict__[name] = method
+        return method
 
-    def _init_delegations(self):
-        """Initialize the delegation mappings."""
-        for agent_class_name in aeidon.agents.__all__:
-            agent = getattr(aeidon.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
+    def emit(self, signal, *args):
+        """Send notification of `signal` or defer it within a transaction."""
+        # Handlers of inserted and removed subtitles need to see
+        # subtitles as they are at the indices given, emit immediately.
+        if (self._deferred_signals is not None and
+            not self.is_notify_signal(signal) and
+            not signal in ("subtitles-inserted", "subtitles-removed")):
+            if (not self._blocked_state and
+                not signal in self._blocked_signals):
+                self._deferred_signals.append((signal, args))
+            return
+        return aeidon.Observable.emit(self, signal, *args)
 
-            attr_names = list(filter(is_delegate_method, dir(agent)))
-            for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {!r}"
-                                     .format(attr_name))
+    def snapshot(self):
+        """
+        Return a copy-on-write copy of project.
+
+        Subtitles of the returned :class:`aeidon.ProjectSnapshot` share data
+        with subtitles of this project until modified, see
+        :meth:`aeidon.ProjectSnapshot.changed_indices`.
+        """
+        return aeidon.ProjectSnapshot(self)
 
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ProjectMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+    def _validate(self, name, value):
+        """Return `value` or an observable version if `value` is mutable."""
+        if name in ("redoables", "undoables"):
+            if isinstance(value, aeidon.RevertableActionStack):
+                return value
+            return aeidon.RevertableActionStack(value)
+        if name == "subtitles" and self._table:
+            if isinstance(value, aeidon.SubtitleTable):
+                return value
+            return aeidon.SubtitleTable(value, framerate=self.framerate)
+        return aeidon.Observable._validate(self, name, value)
+
+    def _get_agent(self, agent_class):
+        """Return instance of `agent_class`, instantiating if needed."""
+        try:
+            return self._agents[agent_class]
+        except LookupError:
+            agent = self._agents[agent_class] = agent_class(self)
+            return agent
+
+    def _init_delegations(self):
+        """Initialize agents and agent classes on first use of class."""
+        for cls in self.__class__.__mro__:
+            if not isinstance(cls, ProjectMeta): continue
+            if cls.__dict__.get("_class_methods_removed", False): continue
+            # Remove class-level functions added by ProjectMeta.
+            for name in cls._agent_classes:
+                if name in cls.__dict__:
+                    delattr(cls, name)
+            # Let agents read attributes of the project directly
+            # instead of going through Delegate.__getattr__.
+            names = set(cls._agent_classes) | set(dir(cls)) | set(vars(self))
+            for agent_class in set(cls._agent_classes.values()):
+                agent_class.bind_master_attributes(names)
+            cls._class_methods_removed = True
+        for agent_class in self._eager_agent_classes:
+            self._get_agent(agent_class)
@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Sorted sequence of unique indices stored as ranges."""
+
+import bisect
+import collections.abc
+import itertools
+
+__all__ = ("IndexRanges",)
+
+
+class IndexRanges(collections.abc.Sequence):
+
+    """
+    Sorted sequence of unique indices stored as ranges.
+
+    :ivar ranges: List of :class:`range` instances of consecutive indices
+
+    :class:`IndexRanges` can be used in place of a sorted list of indices,
+    but uses memory and time proportional to the amount of ranges instead of
+    the amount of indices. Membership tests and access by position are done
+    with bisection. Instances should be treated as immutable.
+
+    Signals of :class:`aeidon.Project` that pass indices of subtitles pass
+    them as :class:`IndexRanges`, so that handlers can process contiguous
+    blocks of subtitles at once via :attr:`ranges`.
+    """
+
+    def __init__(self, indices=()):
+        """
+        Initialize an :class:`IndexRanges` instance.
+
+        `indices` can be any iterable of integers. Ranges with a step of one
+        and other :class:`IndexRanges` are used without iterating over them.
+        """
+        if isinstance(indices, IndexRanges):
+            self.ranges = list(indices.ranges)
+        elif isinstance(indices, range) and indices.step == 1:
+            self.ranges = [indices] if indices else []
+        else:
+            self.ranges = self._get_ranges(indices)
+        self._starts = [x.start for x in self.ranges]
+        self._offsets = []
+        self._length = 0
+        for span in self.ranges:
+            self._offsets.append(self._length)
+            self._length += len(span)
+
+    def __contains__(self, value):
+        """Return ``True`` if `value` is one of the indices."""
+        if not isinstance(value, int): return False
+        i = bisect.bisect_right(self._starts, value) - 1
+        return i >= 0 and value in self.ranges[i]
+
+    def __eq__(self, other):
+        """Compare indices with those of any sequence."""
+        if isinstance(other, IndexRanges):
+            return self.ranges == other.ranges
+        if isinstance(other, collections.abc.Sequence):
+            return (len(self) == len(other) and
+                    all(x == y for x, y in zip(self, other)))
+        return NotImplemented
+
+    def __getitem__(self, index):
+        """Return index at position `index` or a list for a slice."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Index out of range: {!r}"
+                             .format(index))
+        i = bisect.bisect_right(self._offsets, index) - 1
+        return self.ranges[i][index - self._offsets[i]]
+
+    def __iter__(self):
+        """Return an iterator over indices in ascending order."""
+        return itertools.chain.from_iterable(self.ranges)
+
+    def __len__(self):
+        """Return the amount of indices."""
+        return self._length
+
+    def __ne__(self, other):
+        """Compare indices with those of any sequence."""
+        value = self.__eq__(other)
+        return value if value is NotImplemented else not value
+
+    def __repr__(self):
+        """Return string representation with ranges."""
+        return "{}({!r})".format(self.__class__.__name__, self.ranges)
+
+    def __reversed__(self):
+        """Return an iterator over indices in descending order."""
+        ranges = map(reversed, reversed(self.ranges))
+        return itertools.chain.from_iterable(ranges)
+
+    def _get_ranges(self, indices):
+        """Return a list of ranges of consecutive `indices`."""
+        ranges = []
+        start = stop = None
+        for index in sorted(set(indices)):
+            if index == stop:
+                stop += 1
+                continue
+            if start is not None:
+                ranges.append(range(start, stop))
+            start, stop = index, index + 1
+        if start is not None:
+            ranges.append(range(start, stop))
+        return ranges
+
+    def insert_into(self, sequence, items):
+        """
+        Return a copy of `sequence` with `items` inserted at indices.
+
+        `sequence` can be any sequence that supports slicing, appending and
+        in-place concatenation, e.g. a :class:`list` or an
+        :class:`array.array`. `items` are inserted so that in the result they
+        are at the indices of :class:`IndexRanges`, which is the same as
+        inserting items one by one in order of ascending indices.
+        """
+        result = sequence[:0]
+        i = 0
+        for index, item in zip(self, items):
+            count = index - len(result)
+            if count > 0:
+                result += sequence[i:i+count]
+                i += count
+            result.append(item)
+        result += sequence[i:]
+        return result
+
+    def index(self, value):
+        """Return position of index `value`."""
+        if not value in self:
+            raise ValueError("{!r} is not in indices"
+                             .format(value))
+        i = bisect.bisect_right(self._starts, value) - 1
+        return self._offsets[i] + value - self._starts[i]
+
+    def remove_from(self, sequence):
+        """
+        Return a copy of `sequence` with items at indices removed.
+
+        `sequence` can be any sequence that supports slicing and in-place
+        concatenation, e.g. a :class:`list` or an :class:`array.array`.
+        """
+        result = sequence[:0]
+        i = 0
+        for span in self.ranges:
+            result += sequence[i:span.start]
+            i = span.stop
+        result += sequence[i:]
+        return result
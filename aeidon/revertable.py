@@ -18,8 +18,14 @@
 """Actions that can be reverted, i.e. undone and redone."""
 
 import aeidon
+import collections
+import pickle
 
-__all__ = ("RevertableAction", "RevertableActionGroup",)
+__all__ = (
+    "RevertableAction",
+    "RevertableActionGroup",
+    "RevertableActionStack",
+)
 
 
 class RevertableAction:
@@ -33,6 +39,13 @@ class RevertableAction:
     :ivar revert_args: Arguments passed to the revert method
     :ivar revert_function: Method called to revert this action
     :ivar revert_kwargs: Keyword arguments passed to the revert method
+    :ivar size: Estimated memory size of revert arguments in bytes
+
+    Revert arguments can be moved to disk with :meth:`spill` to save memory,
+    in which case they are loaded back automatically when reverting.
+    Revert arguments that cannot be pickled are kept in memory.
+    Actions that are discarded without reverting should be released with
+    :meth:`release` to free the space used on disk.
     """
 
     def __init__(self, **kwargs):
@@ -50,6 +63,10 @@ class RevertableAction:
         self.revert_args = ()
         self.revert_function = None
         self.revert_kwargs = {}
+        self.size = 0
+        self._journal = None
+        self._journal_key = None
+        self._picklable = True
         for key, value in kwargs.items():
             setattr(self, key, value)
 
@@ -62,12 +79,55 @@ class RevertableAction:
         raise ValueError("Invalid register: {!r}"
                          .format(self.register))
 
+    def release(self):
+        """Release revert arguments spilled to disk without loading them."""
+        if self._journal is None: return
+        self._journal.release(self._journal_key)
+        self._journal = None
+        self._journal_key = None
+
+    def restore(self):
+        """Load revert arguments back to memory if spilled to disk."""
+        if self._journal is None: return
+        args, kwargs = self._journal.read(self._journal_key)
+        self.revert_args = args
+        self.revert_kwargs = kwargs
+        self._journal = None
+        self._journal_key = None
+
     def revert(self):
         """Call the reversion function."""
+        self.restore()
         kwargs = self.revert_kwargs.copy()
         kwargs["register"] = self._get_reversion_register()
         return self.revert_function(*self.revert_args, **kwargs)
 
+    def spill(self, journal):
+        """
+        Move revert arguments to :class:`aeidon.Journal` on disk.
+
+        Return ``True`` if spilled, ``False`` if revert arguments cannot be
+        pickled or have already been spilled.
+        """
+        if self._journal is not None: return False
+        if not self._picklable: return False
+        data = (self.revert_args, self.revert_kwargs)
+        try:
+            self._journal_key = journal.write(data)
+        except (AttributeError, pickle.PicklingError, TypeError):
+            # Don't try pickling again each time memory is limited.
+            self._picklable = False
+            return False
+        self._journal = journal
+        self.revert_args = ()
+        self.revert_kwargs = {}
+        return True
+
+    @property
+    def spilled(self):
+        """Return ``True`` if revert arguments have been moved to disk."""
+        return self._journal is not None
+
 
 class RevertableActionGroup:
 
@@ -90,3 +150,56 @@ class RevertableActionGroup:
         self.description = None
         for key, value in kwargs.items():
             setattr(self, key, value)
+
+
+class RevertableActionStack(collections.deque):
+
+    """
+    Stack of :class:`RevertableAction` with the most recent at index zero.
+
+    :class:`RevertableActionStack` is a :class:`collections.deque` that also
+    supports the parts of the :class:`list` API used with stacks: slicing,
+    deleting slices, popping from an index and comparing to lists. Pushing
+    and popping at the top, i.e. index zero, and trimming from the bottom,
+    i.e. ``del stack[limit:]``, take constant time per item.
+    """
+
+    def __delitem__(self, index):
+        """Remove item(s) at `index`."""
+        if not isinstance(index, slice):
+            return collections.deque.__delitem__(self, index)
+        start, stop, step = index.indices(len(self))
+        if step == 1 and stop == len(self):
+            for i in range(max(0, stop - start)):
+                collections.deque.pop(self)
+            return
+        items = list(self)
+        del items[index]
+        self.clear()
+        self.extend(items)
+
+    def __eq__(self, other):
+        """Compare items with items of `other` stack or list."""
+        if isinstance(other, list):
+            return list(self) == other
+        return collections.deque.__eq__(self, other)
+
+    def __getitem__(self, index):
+        """Return item(s) at `index`."""
+        if isinstance(index, slice):
+            return list(self)[index]
+        return collections.deque.__getitem__(self, index)
+
+    def __ne__(self, other):
+        """Compare items with items of `other` stack or list."""
+        return not self == other
+
+    def pop(self, index=-1):
+        """Remove and return item at `index`."""
+        if index == 0:
+            return self.popleft()
+        if index == -1 or index == len(self) - 1:
+            return collections.deque.pop(self)
+        item = self[index]
+        del self[index]
+        return item
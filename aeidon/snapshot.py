@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Copy-on-write copies of projects."""
+
+import aeidon
+import collections.abc
+import copy
+
+__all__ = ("ProjectSnapshot", "SnapshotSubtitle", "SnapshotSubtitles",)
+
+
+class SnapshotSubtitle(aeidon.Subtitle):
+
+    """
+    Copy-on-write proxy of an unmodified subtitle in a snapshot.
+
+    :class:`SnapshotSubtitle` reads its data from the subtitle of the
+    original project until modified, when the original subtitle is copied
+    to the :class:`SnapshotSubtitles` of the snapshot, after which the copy
+    is used instead. Format-specific containers are mutable, so accessing
+    them counts as modification. Proxies are created on demand when
+    accessing subtitles of the snapshot and not kept by the snapshot.
+    """
+
+    __slots__ = ("_index", "_subtitles")
+
+    def __init__(self, subtitles, index):
+        """Initialize a :class:`SnapshotSubtitle` instance."""
+        self._index = index
+        self._subtitles = subtitles
+
+    def __reduce_ex__(self, protocol):
+        """Return a detached subtitle for pickling and copying."""
+        return (copy.copy, (self.copy(),))
+
+    @property
+    def _context(self):
+        """Return :class:`aeidon.TimingContext` of subtitle."""
+        return self._get_source()._context
+
+    @_context.setter
+    def _context(self, value):
+        """Set :class:`aeidon.TimingContext` of subtitle."""
+        self._get_copy()._context = value
+
+    @property
+    def _end(self):
+        """Return end position in native units."""
+        return self._get_source()._end
+
+    @_end.setter
+    def _end(self, value):
+        """Set end position in native units."""
+        self._get_copy()._end = value
+
+    def _get_container(self, name):
+        """Return container `name` of the copy, copying if needed."""
+        return self._get_copy()._get_container(name)
+
+    def _get_containers(self):
+        """Return a dictionary of instantiated containers by name."""
+        return self._get_source()._get_containers()
+
+    def _get_copy(self):
+        """Return copy of the original subtitle, copying if needed."""
+        return self._subtitles.get_copy(self._index)
+
+    def _get_source(self):
+        """Return copy if modified, otherwise the original subtitle."""
+        return self._subtitles.get_original(self._index)
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        return self._get_source().has_container(name)
+
+    @property
+    def _main_text(self):
+        """Return main text."""
+        return self._get_source()._main_text
+
+    @_main_text.setter
+    def _main_text(self, value):
+        """Set main text."""
+        self._get_copy()._main_text = value
+
+    def _set_container(self, name, value):
+        """Set container `name` of the copy to `value`."""
+        self._get_copy()._set_container(name, value)
+
+    @property
+    def _start(self):
+        """Return start position in native units."""
+        return self._get_source()._start
+
+    @_start.setter
+    def _start(self, value):
+        """Set start position in native units."""
+        self._get_copy()._start = value
+
+    @property
+    def _tran_text(self):
+        """Return translation text."""
+        return self._get_source()._tran_text
+
+    @_tran_text.setter
+    def _tran_text(self, value):
+        """Set translation text."""
+        self._get_copy()._tran_text = value
+
+
+class SnapshotSubtitles(collections.abc.MutableSequence):
+
+    """
+    Copy-on-write sequence of subtitles of a snapshot.
+
+    :ivar _copies: Dictionary mapping original indices to modified copies
+    :ivar _rows: List of original indices and new subtitles or ``None``
+    :ivar _source: Sequence of subtitles of the original project
+
+    Unmodified subtitles are read from the original sequence, which is kept
+    by reference, and returned as :class:`SnapshotSubtitle` proxies. Only
+    subtitles that are modified are copied. As long as subtitles have not
+    been inserted, removed or moved, positions map directly to original
+    indices; after that :attr:`_rows` holds the original index, or the
+    subtitle itself if not from the original project, of each position.
+    """
+
+    def __init__(self, source):
+        """Initialize a :class:`SnapshotSubtitles` instance."""
+        self._copies = {}
+        self._rows = None
+        self._source = source
+
+    def __delitem__(self, index):
+        """Remove item(s) at `index`."""
+        del self._get_rows()[index]
+
+    def __getitem__(self, index):
+        """Return item(s) at `index`."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            return [self[i] for i in indices]
+        if self._rows is None:
+            if index < 0:
+                index += len(self._source)
+            if not 0 <= index < len(self._source):
+                raise IndexError("Index out of range: {!r}"
+                                 .format(index))
+            return self._get_item(index)
+        return self._get_item(self._rows[index])
+
+    def __len__(self):
+        """Return the amount of subtitles."""
+        if self._rows is None:
+            return len(self._source)
+        return len(self._rows)
+
+    def __setitem__(self, index, value):
+        """Replace item(s) at `index` with `value`."""
+        self._get_rows()[index] = value
+
+    def bulk_insert(self, indices, subtitles):
+        """Insert `subtitles` at `indices`."""
+        ranges = aeidon.IndexRanges(indices)
+        rows = self._get_rows()
+        if ranges != indices:
+            for index, subtitle in zip(indices, subtitles):
+                rows.insert(index, subtitle)
+            return
+        rows[:] = ranges.insert_into(rows, subtitles)
+
+    def bulk_remove(self, indices):
+        """Remove subtitles at unique `indices` and return them in order."""
+        ranges = aeidon.IndexRanges(indices)
+        subtitles = [self[i] for i in ranges]
+        rows = self._get_rows()
+        rows[:] = ranges.remove_from(rows)
+        return subtitles
+
+    def changed_indices(self):
+        """Return a sorted list of original indices of modified subtitles."""
+        return sorted(self._copies)
+
+    def get_copy(self, index):
+        """Return copy of subtitle at original `index`, copying if needed."""
+        try:
+            return self._copies[index]
+        except KeyError:
+            subtitle = self._copies[index] = self._source[index].copy()
+            return subtitle
+
+    def _get_item(self, row):
+        """Return subtitle for item of :attr:`_rows`."""
+        if not isinstance(row, int):
+            return row
+        try:
+            return self._copies[row]
+        except KeyError:
+            return SnapshotSubtitle(self, row)
+
+    def get_original(self, index):
+        """Return subtitle at original `index`, copy if modified."""
+        try:
+            return self._copies[index]
+        except KeyError:
+            return self._source[index]
+
+    def _get_rows(self):
+        """Return :attr:`_rows`, initializing if needed."""
+        if self._rows is None:
+            self._rows = list(range(len(self._source)))
+        return self._rows
+
+    def insert(self, index, subtitle):
+        """Insert `subtitle` before `index`."""
+        self._get_rows().insert(index, subtitle)
+
+
+class ProjectSnapshot(aeidon.Project):
+
+    """
+    Copy-on-write copy of a :class:`aeidon.Project`.
+
+    Subtitles of a snapshot are a :class:`SnapshotSubtitles` sequence, which
+    shares subtitles with the original project until modified. This makes
+    taking a snapshot cheap and finding out which subtitles were modified
+    proportional to the amount of modifications. The original project
+    should not be modified while the snapshot is in use. Only the most
+    recent action done in the snapshot is kept for undoing.
+    """
+
+    def __init__(self, project):
+        """Initialize a :class:`ProjectSnapshot` instance."""
+        aeidon.Project.__init__(self, project.framerate)
+        # Snapshots are for dry runs, keep only the most recent action,
+        # which action signals refer to, and don't estimate memory sizes.
+        self.undo_limit = 1
+        self.undo_memory_limit = None
+        self.main_file = project.main_file
+        self.tran_file = project.tran_file
+        self.subtitles = SnapshotSubtitles(project.subtitles)
+
+    def changed_indices(self):
+        """Return a sorted list of original indices of modified subtitles."""
+        return self.subtitles.changed_indices()
+
+    def get_snapshot_subtitle(self, index):
+        """
+        Return subtitle that was at `index` when the snapshot was taken.
+
+        The subtitle is returned even if it has since been removed from or
+        moved in :attr:`subtitles`.
+        """
+        return self.subtitles.get_original(index)
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Detection of subtitle file formats from the beginning of files."""
+
+import aeidon
+import codecs
+import re
+
+__all__ = ("FormatSniffer",)
+
+
+class FormatSniffer:
+
+    """
+    Detection of subtitle file formats from the beginning of files.
+
+    :ivar formats: Tuple of :attr:`aeidon.formats` items to detect
+    :ivar size: Maximum amount of bytes to read from the beginning of files
+
+    The identifiers of all formats are combined into a single regular
+    expression, which is compiled once and matched against the whole text
+    at once. Formats are scored by the amount of lines matching their
+    identifier and the best scoring format is detected, with ties resolved
+    by the order of `formats`. Confidence of detection is the share of the
+    best scoring format of all matching lines.
+    """
+
+    def __init__(self, formats=None, size=65536):
+        """Initialize a :class:`FormatSniffer` instance."""
+        self.formats = tuple(formats or aeidon.formats)
+        self.size = size
+        self._formats = dict((x.name, x) for x in self.formats)
+        # All identifiers are anchored to the start of the line, matching
+        # is a lot faster with the anchor outside the alternation.
+        self._re_identifier = re.compile(r"^(?:{})".format("|".join(
+            "(?P<{}>{})".format(x.name, x.identifier.lstrip("^"))
+            for x in self.formats)), re.MULTILINE)
+
+    def _decode(self, data, encoding, final):
+        """Return `data` decoded with complete lines only unless `final`."""
+        decoder = codecs.getincrementaldecoder(encoding)()
+        text = decoder.decode(data, final)
+        if not final:
+            # Discard the last line, which is likely to be cut.
+            text = text[:max(text.rfind("\n"), text.rfind("\r")) + 1]
+        return text.replace("\r\n", "\n").replace("\r", "\n")
+
+    @classmethod
+    @aeidon.deco.once
+    def get_default(cls):
+        """Return a shared instance for all formats and default size."""
+        return cls()
+
+    def get_scores(self, text):
+        """Return a dictionary mapping formats to matching line counts."""
+        scores = dict((x, 0) for x in self.formats)
+        for match in self._re_identifier.finditer(text):
+            scores[self._formats[match.lastgroup]] += 1
+        return scores
+
+    def sniff(self, data, encoding, final=True):
+        """
+        Detect and return format of `data` and confidence of detection.
+
+        `data` should be bytes from the beginning of a file, of which at most
+        :attr:`size` are used. `final` should be ``False`` if `data` does not
+        extend to the end of the file.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Return an :attr:`aeidon.formats` enumeration item or ``None`` and
+        confidence as a float between zero and one.
+        """
+        final = final and len(data) <= self.size
+        text = self._decode(data[:self.size], encoding, final)
+        scores = self.get_scores(text)
+        total = sum(scores.values())
+        if total == 0: return None, 0.0
+        format = max(self.formats, key=scores.get)
+        return format, scores[format] / total
+
+    def sniff_file(self, path, encoding):
+        """
+        Detect and return format of file at `path` and confidence.
+
+        Raise :exc:`IOError` if reading fails.
+        Raise :exc:`UnicodeError` if decoding fails.
+        Return an :attr:`aeidon.formats` enumeration item or ``None`` and
+        confidence as a float between zero and one.
+        """
+        with open(path, "rb") as f:
+            data = f.read(self.size + 1)
+        return self.sniff(data, encoding)
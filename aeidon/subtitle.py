@@ -22,6 +22,10 @@ import copy
 
 __all__ = ("Subtitle",)
 
+# Names of all format-specific attribute containers.
+CONTAINER_NAMES = tuple(sorted(set(
+    x.container for x in aeidon.formats if x.container)))
+
 
 class Subtitle:
 
@@ -50,141 +54,128 @@ class Subtitle:
     Use :func:`aeidon.as_time`, :func:`aeidon.as_frame` or
     :func:`aeidon.as_seconds` if necessary to ensure correct type.
 
+    Positions are stored internally as integers, milliseconds in
+    :attr:`aeidon.modes.TIME` and frames in :attr:`aeidon.modes.FRAME`,
+    and only formatted as time strings when requested.
+
     Additional format-specific attributes are kept under separate containers,
     e.g. ``ssa`` for Sub Station Alpha formats, accessed as ``subtitle.ssa.*``.
     These containers are lazily created upon first use in order to avoid slow
     instantiation and excessive memory use when handling simpler formats.
+
+    Mode, framerate and calculator are kept in an immutable
+    :class:`aeidon.TimingContext` instance shared by all subtitles with the
+    same mode and framerate. Together with ``__slots__`` this keeps instances
+    small and copying cheap when handling large amounts of subtitles.
     """
 
+    __slots__ = ("_containers",
+                 "_context",
+                 "_end",
+                 "_main_text",
+                 "_start",
+                 "_tran_text")
+
     def __init__(self, mode=None, framerate=None):
         """Initialize a :class:`Subtitle` instance."""
-        self._start = None
-        self._end = None
+        self._containers = None
+        self._start = 0
+        self._end = 0
         self._main_text = ""
         self._tran_text = ""
-        self._mode = mode or aeidon.modes.TIME
-        self._framerate = framerate or aeidon.framerates.FPS_23_976
-        self.calc = aeidon.Calculator(self._framerate)
-        self.start = "00:00:00.000"
-        self.end = "00:00:00.000"
+        self._context = aeidon.TimingContext(mode, framerate)
 
     def __eq__(self, other):
         """Compare subtitle equality by value."""
         if not isinstance(other, Subtitle):
             raise NotImplementedError
-        return (self.start == other.start and
-                self.end == other.end and
+        return (self._context.mode == other._context.mode and
+                self._start == other._start and
+                self._end == other._end and
                 self.main_text == other.main_text and
                 self.tran_text == other.tran_text and
                 self.framerate == other.framerate and
                 self.mode == other.mode)
 
-    def __getattr__(self, name):
-        """Return lazily instantiated format-specific attribute container."""
-        if name in (x.container for x in aeidon.formats):
-            # Lazily instantiate a new container.
-            container = aeidon.containers.new(name)
-            object.__setattr__(self, name, container)
-            return container
-        raise AttributeError("Invalid container name: {!r}"
-                             .format(name))
-
     def __ge__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds >= other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame >= other.start_frame
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._start >= other._get_native_start(self._context.mode)
 
     def __gt__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds > other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame > other.start_frame
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._start > other._get_native_start(self._context.mode)
 
     def __le__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds <= other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame <= other.start_frame
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._start <= other._get_native_start(self._context.mode)
 
     def __lt__(self, other):
         """Compare start positions."""
-        if self._mode == aeidon.modes.TIME:
-            return self.start_seconds < other.start_seconds
-        if self._mode == aeidon.modes.FRAME:
-            return self.start_frame < other.start_frame
-        raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+        return self._start < other._get_native_start(self._context.mode)
+
+    def _clamp(self, value):
+        """Return native position `value` limited to the valid range."""
+        if self._context.mode == aeidon.modes.TIME:
+            limit = self._context.calc.max_milliseconds
+            return max(-limit, min(limit, value))
+        return value
 
     def convert_framerate(self, framerate):
         """Set framerate and convert positions to it."""
-        coefficient = framerate.value / self._framerate.value
-        if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds / coefficient
-            self.end_seconds = self.end_seconds / coefficient
-        if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(coefficient * self.start_frame)
-            self.end_frame = round(coefficient * self.end_frame)
+        # Use exact fractions to avoid drift with e.g. NTSC framerates.
+        coefficient = self._context.calc.get_ratio(framerate)
+        if self._context.mode == aeidon.modes.TIME:
+            self._start = self._clamp(round(self._start / coefficient))
+            self._end = self._clamp(round(self._end / coefficient))
+        if self._context.mode == aeidon.modes.FRAME:
+            self._start = round(coefficient * self._start)
+            self._end = round(coefficient * self._end)
         self.framerate = framerate
 
     def _convert_position(self, value):
-        """Return `value` of position in correct mode."""
-        if aeidon.is_time(value):
-            if self._mode == aeidon.modes.TIME:
-                return value
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.time_to_frame(value)
-        if aeidon.is_frame(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.frame_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return value
-        if aeidon.is_seconds(value):
-            if self._mode == aeidon.modes.TIME:
-                return self.calc.seconds_to_time(value)
-            if self._mode == aeidon.modes.FRAME:
-                return self.calc.seconds_to_frame(value)
-        raise ValueError("Invalid type for value: {!r}"
-                         .format(type(value)))
+        """Return `value` of position as an integer in native units."""
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.to_milliseconds(value)
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._context.calc.to_frame(value)
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._context.mode))
+
+    @property
+    def calc(self):
+        """Return :class:`aeidon.Calculator` instance used."""
+        return self._context.calc
 
     def copy(self):
         """Return a new subtitle instance with the same values."""
-        subtitle = Subtitle(self._mode, self._framerate)
+        subtitle = object.__new__(Subtitle)
+        subtitle._context = self._context
         subtitle._start = self._start
         subtitle._end = self._end
         subtitle._main_text = self._main_text
         subtitle._tran_text = self._tran_text
         # Copy all containers that have been instantiated.
-        containers = (x.container for x in aeidon.formats)
-        for name in set(dir(self)) & set(containers):
-            container = copy.deepcopy(getattr(self, name))
-            setattr(subtitle, name, container)
+        containers = self._get_containers()
+        subtitle._containers = ({x: copy.deepcopy(y)
+                                 for x, y in containers.items()}
+                                if containers else None)
         return subtitle
 
     @property
     def duration(self):
         """Return duration in correct mode."""
-        if self._mode == aeidon.modes.TIME:
+        if self._context.mode == aeidon.modes.TIME:
             return self.duration_time
-        if self._mode == aeidon.modes.FRAME:
+        if self._context.mode == aeidon.modes.FRAME:
             return self.duration_frame
         raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+                         .format(self._context.mode))
 
     @duration.setter
     def duration(self, value):
         """Set duration from `value`."""
         value = self._convert_position(value)
-        self._end = self.calc.add(self._start, value)
+        self._end = self._clamp(self._start + value)
 
     @property
     def duration_frame(self):
@@ -199,6 +190,8 @@ class Subtitle:
     @property
     def duration_seconds(self):
         """Return duration as seconds."""
+        if self._context.mode == aeidon.modes.TIME:
+            return (self._end - self._start) / 1000
         return self.end_seconds - self.start_seconds
 
     @duration_seconds.setter
@@ -209,7 +202,10 @@ class Subtitle:
     @property
     def duration_time(self):
         """Return duration as time."""
-        return self.calc.seconds_to_time(self.duration_seconds)
+        if self._context.mode == aeidon.modes.TIME:
+            duration = self._end - self._start
+            return self._context.calc.milliseconds_to_time(duration)
+        return self._context.calc.seconds_to_time(self.duration_seconds)
 
     @duration_time.setter
     def duration_time(self, value):
@@ -219,7 +215,12 @@ class Subtitle:
     @property
     def end(self):
         """Return end position in correct mode."""
-        return self._end
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_time(self._end)
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._end
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._context.mode))
 
     @end.setter
     def end(self, value):
@@ -229,12 +230,12 @@ class Subtitle:
     @property
     def end_frame(self):
         """Return end position as frames."""
-        if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._end)
-        if self._mode == aeidon.modes.FRAME:
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_frame(self._end)
+        if self._context.mode == aeidon.modes.FRAME:
             return self._end
         raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+                         .format(self._context.mode))
 
     @end_frame.setter
     def end_frame(self, value):
@@ -244,7 +245,12 @@ class Subtitle:
     @property
     def end_seconds(self):
         """Return end position as seconds."""
-        return self.calc.time_to_seconds(self.end_time)
+        if self._context.mode == aeidon.modes.TIME:
+            return self._end / 1000
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._context.calc.frame_to_milliseconds(self._end) / 1000
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._context.mode))
 
     @end_seconds.setter
     def end_seconds(self, value):
@@ -254,12 +260,12 @@ class Subtitle:
     @property
     def end_time(self):
         """Return end position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._end
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._end)
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_time(self._end)
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._context.calc.frame_to_time(self._end)
         raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+                         .format(self._context.mode))
 
     @end_time.setter
     def end_time(self, value):
@@ -269,13 +275,25 @@ class Subtitle:
     @property
     def framerate(self):
         """Return framerate."""
-        return self._framerate
+        return self._context.framerate
 
     @framerate.setter
     def framerate(self, value):
         """Set framerate from `value`."""
-        self._framerate = value
-        self.calc = aeidon.Calculator(value)
+        self._context = self._context.with_framerate(value)
+
+    def _get_container(self, name):
+        """Return container `name`, instantiating if needed."""
+        if self._containers is None:
+            self._containers = {}
+        if not name in self._containers:
+            # Lazily instantiate a new container.
+            self._containers[name] = aeidon.containers.new(name)
+        return self._containers[name]
+
+    def _get_containers(self):
+        """Return a dictionary of instantiated containers by name."""
+        return dict(self._containers or {})
 
     def get_duration(self, mode):
         """Return duration in `mode`."""
@@ -295,6 +313,28 @@ class Subtitle:
         raise ValueError("Invalid mode: {!r}"
                          .format(mode))
 
+    def _get_native_end(self, mode):
+        """Return end position as an integer in native units of `mode`."""
+        if mode == self._context.mode:
+            return self._end
+        if mode == aeidon.modes.TIME:
+            return self._context.calc.frame_to_milliseconds(self._end)
+        if mode == aeidon.modes.FRAME:
+            return self._context.calc.milliseconds_to_frame(self._end)
+        raise ValueError("Invalid mode: {!r}"
+                         .format(mode))
+
+    def _get_native_start(self, mode):
+        """Return start position as an integer in native units of `mode`."""
+        if mode == self._context.mode:
+            return self._start
+        if mode == aeidon.modes.TIME:
+            return self._context.calc.frame_to_milliseconds(self._start)
+        if mode == aeidon.modes.FRAME:
+            return self._context.calc.milliseconds_to_frame(self._start)
+        raise ValueError("Invalid mode: {!r}"
+                         .format(mode))
+
     def get_start(self, mode):
         """Return start position in `mode`."""
         if mode == aeidon.modes.TIME:
@@ -315,7 +355,7 @@ class Subtitle:
 
     def has_container(self, name):
         """Return ``True`` if container has been instantiated."""
-        return name in dir(self)
+        return self._containers is not None and name in self._containers
 
     @property
     def main_text(self):
@@ -330,27 +370,44 @@ class Subtitle:
     @property
     def mode(self):
         """Return current position mode."""
-        return self._mode
+        return self._context.mode
 
     @mode.setter
     def mode(self, mode):
         """Set current position mode."""
+        if mode == self._context.mode: return
         if mode == aeidon.modes.TIME:
-            self._start = self.start_time
-            self._end = self.end_time
+            self._start = self._context.calc.frame_to_milliseconds(self._start)
+            self._end = self._context.calc.frame_to_milliseconds(self._end)
         if mode == aeidon.modes.FRAME:
-            self._start = self.start_frame
-            self._end = self.end_frame
-        self._mode = mode
+            self._start = self._context.calc.milliseconds_to_frame(self._start)
+            self._end = self._context.calc.milliseconds_to_frame(self._end)
+        self._context = self._context.with_mode(mode)
 
     def scale_positions(self, value):
         """Multiply start and end positions by `value`."""
-        if self._mode == aeidon.modes.TIME:
-            self.start_seconds = self.start_seconds * value
-            self.end_seconds = self.end_seconds * value
-        if self._mode == aeidon.modes.FRAME:
-            self.start_frame = round(self._start * value)
-            self.end_frame = round(self._end * value)
+        self._start = self._clamp(round(self._start * value))
+        self._end = self._clamp(round(self._end * value))
+
+    def _set_container(self, name, value):
+        """Set container `name` to `value`."""
+        if self._containers is None:
+            self._containers = {}
+        self._containers[name] = value
+
+    def _set_native_positions(self, start, end, mode):
+        """Set positions from integers in native units of `mode`."""
+        if mode != self._context.mode:
+            if mode == aeidon.modes.TIME:
+                convert = self._context.calc.milliseconds_to_frame
+            elif mode == aeidon.modes.FRAME:
+                convert = self._context.calc.frame_to_milliseconds
+            else:
+                raise ValueError("Invalid mode: {!r}"
+                                 .format(mode))
+            start, end = convert(start), convert(end)
+        self._start = start
+        self._end = end
 
     def set_text(self, doc, value):
         """Set text corresponding to `doc` to `value`."""
@@ -361,13 +418,19 @@ class Subtitle:
 
     def shift_positions(self, value):
         """Add `value` to start and end positions."""
-        self._start = self.calc.add(self._start, value)
-        self._end = self.calc.add(self._end, value)
+        value = self._convert_position(value)
+        self._start = self._clamp(self._start + value)
+        self._end = self._clamp(self._end + value)
 
     @property
     def start(self):
         """Return start position in correct mode."""
-        return self._start
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_time(self._start)
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._start
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._context.mode))
 
     @start.setter
     def start(self, value):
@@ -377,12 +440,12 @@ class Subtitle:
     @property
     def start_frame(self):
         """Return start position as frames."""
-        if self._mode == aeidon.modes.TIME:
-            return self.calc.time_to_frame(self._start)
-        if self._mode == aeidon.modes.FRAME:
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_frame(self._start)
+        if self._context.mode == aeidon.modes.FRAME:
             return self._start
         raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+                         .format(self._context.mode))
 
     @start_frame.setter
     def start_frame(self, value):
@@ -392,7 +455,12 @@ class Subtitle:
     @property
     def start_seconds(self):
         """Return start position as seconds."""
-        return self.calc.time_to_seconds(self.start_time)
+        if self._context.mode == aeidon.modes.TIME:
+            return self._start / 1000
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._context.calc.frame_to_milliseconds(self._start) / 1000
+        raise ValueError("Invalid mode: {!r}"
+                         .format(self._context.mode))
 
     @start_seconds.setter
     def start_seconds(self, value):
@@ -402,12 +470,12 @@ class Subtitle:
     @property
     def start_time(self):
         """Return start position as time."""
-        if self._mode == aeidon.modes.TIME:
-            return self._start
-        if self._mode == aeidon.modes.FRAME:
-            return self.calc.frame_to_time(self._start)
+        if self._context.mode == aeidon.modes.TIME:
+            return self._context.calc.milliseconds_to_time(self._start)
+        if self._context.mode == aeidon.modes.FRAME:
+            return self._context.calc.frame_to_time(self._start)
         raise ValueError("Invalid mode: {!r}"
-                         .format(self._mode))
+                         .format(self._context.mode))
 
     @start_time.setter
     def start_time(self, value):
@@ -423,3 +491,14 @@ class Subtitle:
     def tran_text(self, value):
         """Set translation text from `value`."""
         self._tran_text = value
+
+
+def _new_container_property(name):
+    """Return a property for lazily instantiated container `name`."""
+    return property(lambda self: self._get_container(name),
+                    lambda self, value: self._set_container(name, value),
+                    doc="Return format-specific container {!r}.".format(name))
+
+for name in CONTAINER_NAMES:
+    setattr(Subtitle, name, _new_container_property(name))
+del name
@@ -0,0 +1,358 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Array-backed columnar store of subtitle data."""
+
+import aeidon
+import array
+import collections.abc
+import copy
+
+__all__ = ("SubtitleTable",)
+
+
+class SubtitleRow(aeidon.Subtitle):
+
+    """
+    Lightweight view of a single row of :class:`SubtitleTable`.
+
+    Rows read and write their data directly from and to the columns of
+    the table. A row is only valid until the table is structurally modified,
+    i.e. subtitles are inserted or removed; use :meth:`copy` to get a detached
+    :class:`aeidon.Subtitle` that can be kept.
+    """
+
+    __slots__ = ("_index", "_table")
+
+    def __init__(self, table, index):
+        """Initialize a :class:`SubtitleRow` instance."""
+        self._table = table
+        self._index = index
+
+    def __reduce_ex__(self, protocol):
+        """Return a detached subtitle for pickling and copying."""
+        return (copy.copy, (self.copy(),))
+
+    @property
+    def _context(self):
+        """Return :class:`aeidon.TimingContext` of the table."""
+        return self._table._context
+
+    @_context.setter
+    def _context(self, value):
+        """Raise :exc:`AttributeError`, context is common to all rows."""
+        raise AttributeError("Cannot set timing context of a single row, "
+                             "set framerate or mode of the table instead")
+
+    @property
+    def _end(self):
+        """Return end position in native units."""
+        return self._table._ends[self._index]
+
+    @_end.setter
+    def _end(self, value):
+        """Set end position in native units."""
+        self._table._ends[self._index] = value
+
+    def _get_container(self, name):
+        """Return container `name`, instantiating if needed."""
+        containers = self._table._containers[self._index]
+        if containers is None:
+            containers = self._table._containers[self._index] = {}
+        if not name in containers:
+            containers[name] = aeidon.containers.new(name)
+        return containers[name]
+
+    def _get_containers(self):
+        """Return a dictionary of instantiated containers by name."""
+        return dict(self._table._containers[self._index] or {})
+
+    def has_container(self, name):
+        """Return ``True`` if container has been instantiated."""
+        containers = self._table._containers[self._index]
+        return containers is not None and name in containers
+
+    @property
+    def _main_text(self):
+        """Return main text."""
+        return self._table._main_texts[self._index]
+
+    @_main_text.setter
+    def _main_text(self, value):
+        """Set main text."""
+        self._table._main_texts[self._index] = value
+
+    @property
+    def mode(self):
+        """Return current position mode."""
+        return self._table.mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set position mode of the whole table."""
+        self._table.mode = mode
+
+    def _set_container(self, name, value):
+        """Set container `name` to `value`."""
+        containers = self._table._containers[self._index]
+        if containers is None:
+            containers = self._table._containers[self._index] = {}
+        containers[name] = value
+
+    @property
+    def _start(self):
+        """Return start position in native units."""
+        return self._table._starts[self._index]
+
+    @_start.setter
+    def _start(self, value):
+        """Set start position in native units."""
+        self._table._starts[self._index] = value
+
+    @property
+    def _tran_text(self):
+        """Return translation text."""
+        return self._table._tran_texts[self._index]
+
+    @_tran_text.setter
+    def _tran_text(self, value):
+        """Set translation text."""
+        self._table._tran_texts[self._index] = value
+
+
+class SubtitleTable(collections.abc.MutableSequence):
+
+    """
+    Array-backed columnar store of subtitle data.
+
+    :ivar framerate: :attr:`aeidon.framerates` item common to all rows
+    :ivar mode: :attr:`aeidon.modes` item common to all rows
+
+    :class:`SubtitleTable` can be used in place of a list of
+    :class:`aeidon.Subtitle` instances, e.g. as
+    :attr:`aeidon.Project.subtitles`.
+    Positions are stored in native integer units (milliseconds or frames)
+    in parallel :class:`array.array` columns, texts in plain lists and
+    format-specific containers in a column that is ``None`` for rows without
+    containers. Items returned are row views of the table; inserted subtitles
+    have their values copied into the columns.
+
+    Mode and framerate are shared by all rows. If the table is empty, it
+    adopts the mode and framerate of the first inserted subtitle.
+    """
+
+    def __init__(self, subtitles=(), mode=None, framerate=None):
+        """Initialize a :class:`SubtitleTable` instance."""
+        subtitles = list(subtitles)
+        if subtitles:
+            mode = mode or subtitles[0].mode
+            framerate = framerate or subtitles[0].framerate
+        self._containers = []
+        self._context = aeidon.TimingContext(mode, framerate)
+        self._ends = array.array("q")
+        self._main_texts = []
+        self._starts = array.array("q")
+        self._tran_texts = []
+        for subtitle in subtitles:
+            self._append(subtitle)
+
+    def __delitem__(self, index):
+        """Remove row(s) at `index`."""
+        for column in self._get_columns():
+            del column[index]
+
+    def __eq__(self, other):
+        """Compare rows with subtitles of any sequence."""
+        if not isinstance(other, collections.abc.Sequence):
+            return NotImplemented
+        return (len(self) == len(other) and
+                all(x == y for x, y in zip(self, other)))
+
+    def __getitem__(self, index):
+        """Return row view(s) at `index`."""
+        if isinstance(index, slice):
+            indices = range(*index.indices(len(self)))
+            return [SubtitleRow(self, i) for i in indices]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Index out of range: {!r}"
+                             .format(index))
+        return SubtitleRow(self, index)
+
+    def __iter__(self):
+        """Return an iterator over row views."""
+        return (SubtitleRow(self, i) for i in range(len(self)))
+
+    def __len__(self):
+        """Return the amount of rows."""
+        return len(self._starts)
+
+    def __setitem__(self, index, subtitle):
+        """Replace row at `index` with values from `subtitle`."""
+        values = self._get_values(subtitle)
+        for column, value in zip(self._get_columns(), values):
+            column[index] = value
+
+    def _append(self, subtitle):
+        """Append values from `subtitle` to the end of the columns."""
+        values = self._get_values(subtitle)
+        for column, value in zip(self._get_columns(), values):
+            column.append(value)
+
+    def bulk_insert(self, indices, subtitles):
+        """
+        Insert values from `subtitles` as new rows at `indices`.
+
+        The result is the same as inserting subtitles one by one, but if
+        `indices` are sorted and unique, columns are rebuilt once instead.
+        """
+        ranges = aeidon.IndexRanges(indices)
+        if ranges != indices:
+            for index, subtitle in zip(indices, subtitles):
+                self.insert(index, subtitle)
+            return
+        if not subtitles: return
+        if not self._starts:
+            self._context = subtitles[0]._context
+        values = zip(*map(self._get_values, subtitles))
+        for column, items in zip(self._get_columns(), values):
+            column[:] = ranges.insert_into(column, items)
+
+    def bulk_remove(self, indices):
+        """Remove rows at unique `indices` and return detached subtitles."""
+        ranges = aeidon.IndexRanges(indices)
+        subtitles = [self[i].copy() for i in ranges]
+        for column in self._get_columns():
+            column[:] = ranges.remove_from(column)
+        return subtitles
+
+    @property
+    def ends(self):
+        """Return column of end positions in native units (read-only)."""
+        return self._ends
+
+    @property
+    def framerate(self):
+        """Return framerate common to all rows."""
+        return self._context.framerate
+
+    @framerate.setter
+    def framerate(self, value):
+        """Set framerate common to all rows."""
+        self._context = self._context.with_framerate(value)
+
+    def _get_columns(self):
+        """Return a tuple of all columns in the order of values."""
+        return (self._starts,
+                self._ends,
+                self._main_texts,
+                self._tran_texts,
+                self._containers)
+
+    def get_positions(self, indices):
+        """
+        Return columns of start and end positions at `indices`.
+
+        `indices` should be an :class:`aeidon.IndexRanges`. Positions are
+        returned as :class:`array.array` in native units of :attr:`mode`,
+        copied a range of rows at a time.
+        """
+        starts = self._starts[:0]
+        ends = self._ends[:0]
+        for span in indices.ranges:
+            starts += self._starts[span.start:span.stop]
+            ends += self._ends[span.start:span.stop]
+        return starts, ends
+
+    def _get_values(self, subtitle):
+        """Return a tuple of values from `subtitle` in the order of columns."""
+        containers = subtitle._get_containers()
+        return (subtitle._get_native_start(self._context.mode),
+                subtitle._get_native_end(self._context.mode),
+                subtitle.main_text,
+                subtitle.tran_text,
+                containers or None)
+
+    def insert(self, index, subtitle):
+        """Insert values from `subtitle` as a new row before `index`."""
+        if not self._starts:
+            # Adopt properties of the first subtitle to avoid conversions.
+            self._context = subtitle._context
+        values = self._get_values(subtitle)
+        for column, value in zip(self._get_columns(), values):
+            column.insert(index, value)
+
+    @property
+    def mode(self):
+        """Return position mode common to all rows."""
+        return self._context.mode
+
+    @mode.setter
+    def mode(self, mode):
+        """Set position mode and convert all positions to it."""
+        if mode == self._context.mode: return
+        if mode == aeidon.modes.TIME:
+            convert = self._context.calc.frames_to_milliseconds
+        elif mode == aeidon.modes.FRAME:
+            convert = self._context.calc.milliseconds_to_frames
+        else:
+            raise ValueError("Invalid mode: {!r}"
+                             .format(mode))
+        self._starts = convert(self._starts)
+        self._ends = convert(self._ends)
+        self._context = self._context.with_mode(mode)
+
+    def pop(self, index=-1):
+        """Remove row at `index` and return it as a detached subtitle."""
+        subtitle = self[index].copy()
+        del self[index]
+        return subtitle
+
+    def set_positions(self, indices, starts, ends):
+        """
+        Set start and end positions at `indices` from columns.
+
+        `indices` should be an :class:`aeidon.IndexRanges` and `starts` and
+        `ends` :class:`array.array` in native units of :attr:`mode`, as
+        returned by :meth:`get_positions`.
+        """
+        i = 0
+        for span in indices.ranges:
+            j = i + len(span)
+            self._starts[span.start:span.stop] = starts[i:j]
+            self._ends[span.start:span.stop] = ends[i:j]
+            i = j
+
+    def splice(self, index, count, subtitles=()):
+        """Replace `count` rows at `index` with `subtitles`, return removed."""
+        index, stop, step = slice(index, index + count).indices(len(self))
+        if not self._starts and subtitles:
+            self._context = subtitles[0]._context
+        removed = [self[i].copy() for i in range(index, stop)]
+        values = list(zip(*map(self._get_values, subtitles)))
+        for i, column in enumerate(self._get_columns()):
+            items = column[:0]
+            if values:
+                items.extend(values[i])
+            column[index:stop] = items
+        return removed
+
+    @property
+    def starts(self):
+        """Return column of start positions in native units (read-only)."""
+        return self._starts
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import codecs
+
+from unittest.mock import patch
+
+
+class TestFileBuffer(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.path = self.new_subrip_file()
+        self.buffer = aeidon.FileBuffer(self.path)
+
+    def test___init__(self):
+        assert self.buffer.data == open(self.path, "rb").read()
+
+    def test_can_decode(self):
+        self.buffer.data = "aä".encode("utf_8")
+        assert self.buffer.can_decode("utf_8")
+        assert self.buffer.can_decode("cp1252")
+        assert not self.buffer.can_decode("ascii")
+
+    def test_can_decode__size(self):
+        self.buffer.data = "aä".encode("utf_8")
+        assert self.buffer.can_decode("utf_8", size=2)
+        self.buffer.data = b"a\xc3"
+        assert not self.buffer.can_decode("utf_8", size=1)
+
+    def test_detect_bom(self):
+        assert self.buffer.detect_bom() is None
+
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom__utf_8_sig(self):
+        self.buffer.data = codecs.BOM_UTF8 + self.buffer.data
+        assert self.buffer.detect_bom() == "utf_8_sig"
+
+    def test_detect_format(self):
+        for format in aeidon.formats:
+            buffer = aeidon.FileBuffer(self.new_temp_file(format))
+            assert buffer.detect_format("ascii") == format
+
+    def test_detect_format__invalid(self):
+        self.buffer.data = b"test\n"
+        self.assert_raises(aeidon.FormatError,
+                           self.buffer.detect_format,
+                           "ascii")
+
+    def test_detect_newlines__mac(self):
+        self.buffer.data = b"a\rb\rc\r"
+        newlines = self.buffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.MAC
+
+    def test_detect_newlines__mixed(self):
+        self.buffer.data = b"a\rb\nc\r"
+        newlines = self.buffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.WINDOWS
+
+    def test_detect_newlines__windows(self):
+        self.buffer.data = b"a\r\nb\r\nc\r\n"
+        newlines = self.buffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.WINDOWS
+
+    def test_iter_lines(self):
+        self.buffer.data = b"a\r\nb\rc\n\x0bd"
+        lines = list(self.buffer.iter_lines("ascii", size=1))
+        assert lines == ["a\n", "b\n", "c\n", "\x0bd"]
+        newlines = self.buffer.detect_newlines("ascii")
+        assert newlines == aeidon.newlines.WINDOWS
+
+    def test_read_lines(self):
+        self.buffer.data = b"a\r\nb\rc\n\x0bd"
+        lines = self.buffer.read_lines("ascii")
+        assert lines == ["a\n", "b\n", "c\n", "\x0bd"]
+
+    def test_read_lines__unicode_error(self):
+        self.buffer.data = b"\xff\xfe\xfa"
+        self.assert_raises(UnicodeError,
+                           self.buffer.read_lines,
+                           "utf_8")
+
+    def test_sniff_format(self):
+        format, confidence = self.buffer.sniff_format("ascii")
+        assert format == aeidon.formats.SUBRIP
+        assert confidence == 1.0
+
+    def test_sniff_format__sniffer(self):
+        formats = [aeidon.formats.MICRODVD]
+        sniffer = aeidon.FormatSniffer(formats)
+        format, confidence = self.buffer.sniff_format("ascii", sniffer)
+        assert format is None
+
+
+class TestOpenAgent(aeidon.TestCase):
+
+    def test_open_main(self):
+        project = aeidon.Project()
+        with patch("aeidon.FileBuffer", wraps=aeidon.FileBuffer) as cls:
+            project.open_main(self.new_subrip_file(), "ascii")
+        assert cls.call_count == 1
+        assert project.main_file.buffer is None
+        assert project.subtitles
@@ -16,6 +16,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import array
+import fractions
 
 
 class TestCalculator(aeidon.TestCase):
@@ -29,6 +31,18 @@ class TestCalculator(aeidon.TestCase):
         b = aeidon.Calculator(aeidon.framerates.FPS_23_976)
         assert a is b
 
+    def test___init____fraction(self):
+        assert self.calc.fraction == fractions.Fraction(24000, 1001)
+        calc = aeidon.Calculator(24 / 1.001)
+        assert calc.fraction == fractions.Fraction(24000, 1001)
+        calc = aeidon.Calculator("120000/1001")
+        assert calc.fraction == fractions.Fraction(120000, 1001)
+
+    def test___init____once(self):
+        fraction = self.calc.fraction
+        calc = aeidon.Calculator(self.framerate)
+        assert calc.fraction is fraction
+
     def test___new____float(self):
         a = aeidon.Calculator(48.0)
         b = aeidon.Calculator(96.0)
@@ -44,6 +58,13 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.add("00:00:10.000",
                              "00:00:10.000") == "00:00:20.000"
 
+    def test_frame_to_milliseconds(self):
+        assert self.calc.frame_to_milliseconds(2658) == 110861
+
+    def test_frame_to_milliseconds__exact(self):
+        assert self.calc.frame_to_milliseconds(172800) == 7207200
+        assert self.calc.frame_to_milliseconds(12) == 500
+
     def test_frame_to_seconds(self):
         calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert calc.frame_to_seconds(127) == 5.08
@@ -51,6 +72,19 @@ class TestCalculator(aeidon.TestCase):
     def test_frame_to_time(self):
         assert self.calc.frame_to_time(2658) == "00:01:50.861"
 
+    def test_frames_to_milliseconds(self):
+        ms = self.calc.frames_to_milliseconds([2658, 0])
+        assert list(ms) == [110861, 0]
+
+    def test_frames_to_milliseconds__long(self):
+        frames = list(range(-1000, 1000))
+        ms = self.calc.frames_to_milliseconds(frames)
+        assert list(ms) == list(map(self.calc.frame_to_milliseconds, frames))
+
+    def test_frames_to_times(self):
+        times = self.calc.frames_to_times([2658])
+        assert times == ["00:01:50.861"]
+
     def test_get_middle__frame(self):
         assert self.calc.get_middle(300, 400) == 350
 
@@ -61,6 +95,15 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.get_middle("00:00:01.000",
                                     "00:00:02.000") == "00:00:01.500"
 
+    def test_get_ratio(self):
+        ratio = self.calc.get_ratio(aeidon.framerates.FPS_25_000)
+        assert ratio == fractions.Fraction(25 * 1001, 24000)
+        assert self.calc.get_ratio(aeidon.framerates.FPS_25_000) is ratio
+
+    def test_get_ratio__float(self):
+        ratio = self.calc.get_ratio(48000 / 1001)
+        assert ratio == 2
+
     def test_is_earlier__frame(self):
         assert self.calc.is_earlier(1, 2)
         assert not self.calc.is_earlier(2, 2)
@@ -99,6 +142,28 @@ class TestCalculator(aeidon.TestCase):
         assert self.calc.is_valid_time("12:34:56.789")
         assert self.calc.is_valid_time("-12:34:56.789")
 
+    def test_milliseconds_to_frame(self):
+        assert self.calc.milliseconds_to_frame(110861) == 2658
+
+    def test_milliseconds_to_frame__exact(self):
+        assert self.calc.milliseconds_to_frame(7207200) == 172800
+        for frame in range(0, 172800, 997):
+            ms = self.calc.frame_to_milliseconds(frame)
+            assert self.calc.milliseconds_to_frame(ms) == frame
+
+    def test_milliseconds_to_frames(self):
+        frames = self.calc.milliseconds_to_frames(array.array("q", [110861]))
+        assert frames == array.array("q", [2658])
+
+    def test_milliseconds_to_time(self):
+        assert self.calc.milliseconds_to_time(68951154) == "19:09:11.154"
+        assert self.calc.milliseconds_to_time(-1500) == "-00:00:01.500"
+        assert self.calc.milliseconds_to_time(10**10) == "99:59:59.999"
+
+    def test_milliseconds_to_times(self):
+        times = self.calc.milliseconds_to_times([68951154, -1500])
+        assert times == ["19:09:11.154", "-00:00:01.500"]
+
     def test_normalize_time(self):
         assert self.calc.normalize_time("1:2:3.4") == "01:02:03.400"
         assert self.calc.normalize_time("-1:2:3,4") == "-01:02:03.400"
@@ -113,24 +178,81 @@ class TestCalculator(aeidon.TestCase):
     def test_round__time(self):
         assert self.calc.round("12:34:56.789", 1) == "12:34:56.800"
 
+    def test_round_frames(self):
+        frames = self.calc.round_frames([13, 15, 25, -16], -1)
+        assert list(frames) == [10, 20, 20, -20]
+        frames = self.calc.round_frames([13], 2)
+        assert list(frames) == [13]
+
+    def test_round_milliseconds(self):
+        ms = self.calc.round_milliseconds([1234, 1250, 1350, -1260], 1)
+        assert list(ms) == [1200, 1200, 1400, -1300]
+        ms = self.calc.round_milliseconds([359999999], 2)
+        assert list(ms) == [self.calc.max_milliseconds]
+
+    def test_round_seconds(self):
+        seconds = self.calc.round_seconds([13.33, 1.25], 1)
+        assert list(seconds) == [13.3, 1.2]
+
+    def test_scale_frames(self):
+        frames = self.calc.scale_frames([10, 15], 1.5)
+        assert list(frames) == [15, 22]
+
+    def test_scale_milliseconds(self):
+        ms = self.calc.scale_milliseconds([1000, 300000000], 2.0)
+        assert list(ms) == [2000, self.calc.max_milliseconds]
+
     def test_seconds_to_frame(self):
         assert self.calc.seconds_to_frame(6552) == 157091
 
+    def test_seconds_to_frames(self):
+        frames = self.calc.seconds_to_frames([6552, 0.0])
+        assert list(frames) == [157091, 0]
+
+    def test_seconds_to_milliseconds(self):
+        assert self.calc.seconds_to_milliseconds(68951.15388) == 68951154
+
     def test_seconds_to_time(self):
         assert self.calc.seconds_to_time(68951.15388) == "19:09:11.154"
 
+    def test_shift_frames(self):
+        frames = self.calc.shift_frames([10, 20], -5)
+        assert list(frames) == [5, 15]
+
+    def test_shift_milliseconds(self):
+        ms = self.calc.shift_milliseconds([1000, 359999000], 2000)
+        assert list(ms) == [3000, self.calc.max_milliseconds]
+
     def test_time_to_frame(self):
         assert self.calc.time_to_frame("01:22:36.144") == 118829
 
+    def test_time_to_milliseconds(self):
+        assert self.calc.time_to_milliseconds("03:45:22.117") == 13522117
+        assert self.calc.time_to_milliseconds("-00:00:01.500") == -1500
+
     def test_time_to_seconds(self):
         assert self.calc.time_to_seconds("03:45:22.117") == 13522.117
 
+    def test_times_to_milliseconds(self):
+        ms = self.calc.times_to_milliseconds(["03:45:22.117", "-00:00:01.500"])
+        assert list(ms) == [13522117, -1500]
+
+    def test_times_to_seconds(self):
+        seconds = self.calc.times_to_seconds(["03:45:22.117"])
+        assert list(seconds) == [13522.117]
+
     def test_to_frame(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_frame("00:00:01.000") == 25
         assert self.calc.to_frame(25) == 25
         assert self.calc.to_frame(1.0) == 25
 
+    def test_to_milliseconds(self):
+        self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
+        assert self.calc.to_milliseconds("00:00:01.000") == 1000
+        assert self.calc.to_milliseconds(25) == 1000
+        assert self.calc.to_milliseconds(1.0) == 1000
+
     def test_to_seconds(self):
         self.calc = aeidon.Calculator(aeidon.framerates.FPS_25_000)
         assert self.calc.to_seconds("00:00:01.000") == 1.0
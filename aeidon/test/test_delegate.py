@@ -41,3 +41,20 @@ class TestDelegate(aeidon.TestCase):
     def test___setattr____master(self):
         self.delegate.name = "slave"
         assert self.master.name == "slave"
+
+    def test_bind_master_attributes(self):
+        class PuppetDelegate(aeidon.Delegate): pass
+        PuppetDelegate.bind_master_attributes(("master", "name"))
+        assert not "master" in PuppetDelegate.__dict__
+        delegate = PuppetDelegate(self.master)
+        self.master.name = "changed"
+        assert delegate.name == "changed"
+        delegate = PuppetDelegate(object())
+        delegate.name = "delegate"
+        assert delegate.name == "delegate"
+        assert not "name" in aeidon.Delegate.__dict__
+
+    def test_bind_master_attributes__delegate(self):
+        self.assert_raises(ValueError,
+                           aeidon.Delegate.bind_master_attributes,
+                           ("name",))
@@ -24,6 +24,13 @@ from unittest.mock import patch
 
 class TestModule(aeidon.TestCase):
 
+    def test_can_decode(self):
+        path = self.new_subrip_file()
+        with open(path, "ab") as f:
+            f.write("\xe4".encode("cp1252"))
+        assert aeidon.encodings.can_decode(path, "cp1252")
+        assert not aeidon.encodings.can_decode(path, "utf_8", size=16)
+
     def test_code_to_description(self):
         code_to_description = aeidon.encodings.code_to_description
         assert code_to_description("cp1006") == _("Urdu")
@@ -90,6 +97,12 @@ class TestModule(aeidon.TestCase):
         encoding = aeidon.encodings.detect_bom(path)
         assert encoding == "utf_8_sig"
 
+    @patch("aeidon.encodings.is_valid_code", lambda x: True)
+    def test_detect_bom_data(self):
+        data = codecs.BOM_UTF16_LE + b"test"
+        encoding = aeidon.encodings.detect_bom_data(data)
+        assert encoding == "utf_16_le"
+
     def test_get_locale_code(self):
         code = aeidon.encodings.get_locale_code()
         assert aeidon.encodings.is_valid_code(code)
@@ -106,6 +119,13 @@ class TestModule(aeidon.TestCase):
             code, name, description = item
             assert aeidon.encodings.is_valid_code(code)
 
+    def test_is_ascii_compatible(self):
+        assert aeidon.encodings.is_ascii_compatible("utf_8")
+        assert aeidon.encodings.is_ascii_compatible("cp1251")
+        assert not aeidon.encodings.is_ascii_compatible("iso2022_jp")
+        assert not aeidon.encodings.is_ascii_compatible("shift_jis")
+        assert not aeidon.encodings.is_ascii_compatible("utf_16")
+
     def test_is_valid_code(self):
         assert aeidon.encodings.is_valid_code("gbk")
         assert aeidon.encodings.is_valid_code("utf_16_be")
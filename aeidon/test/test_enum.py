@@ -16,6 +16,8 @@
 # along with this program. If not, see <http://www.gnu.org/licenses/>.
 
 import aeidon
+import copy
+import pickle
 
 
 class TestEnumerationItem(aeidon.TestCase):
@@ -39,6 +41,24 @@ class TestEnumerationItem(aeidon.TestCase):
         assert self.item_0 != self.item_1
         assert self.item_0 != 1
 
+    def test___reduce_ex__(self):
+        item = aeidon.framerates.FPS_25_000
+        assert pickle.loads(pickle.dumps(item)) is item
+        assert copy.deepcopy(item) is item
+
+    def test___reduce_ex____location(self):
+        fruits = aeidon.Enumeration("aeidon.enums", "formats")
+        fruits.SUBRIP = aeidon.EnumerationItem()
+        item = pickle.loads(pickle.dumps(fruits.SUBRIP))
+        assert item is aeidon.formats.SUBRIP
+
+    def test___reduce_ex____local(self):
+        fruits = aeidon.Enumeration()
+        fruits.APPLE = aeidon.EnumerationItem()
+        item = pickle.loads(pickle.dumps(fruits.APPLE))
+        assert item == fruits.APPLE
+        assert item.name == "APPLE"
+
     def test___str__(self):
         assert str(self.item_0) == "a"
         assert str(self.item_1) == "b"
@@ -32,6 +32,54 @@ class TestSubtitleFile(aeidon.TestCase):
         newline = aeidon.newlines.UNIX
         self.file = PuppetSubtitleFile(path, "ascii", newline)
 
+    def test__iter_lines(self):
+        with open(self.file.path, "w", newline="") as f:
+            f.write("\n \r\na\r\n\r\nb\r\n\r\n")
+        lines = self.file._iter_lines()
+        assert next(lines) == "a"
+        assert self.file.newline == aeidon.newlines.UNIX
+        assert list(lines) == ["", "b"]
+        assert self.file.newline == aeidon.newlines.WINDOWS
+
+    def test__iter_lines__buffer(self):
+        self.file.buffer = aeidon.FileBuffer(self.file.path)
+        lines = list(self.file._iter_lines())
+        assert lines == self.file._read_lines()
+        assert self.file.buffer is None
+
+    def test__iter_lines__utf_8_sig(self):
+        with open(self.file.path, "w", encoding="utf_8_sig") as f:
+            f.write("a\nb\n")
+        self.file.encoding = "utf_8"
+        assert list(self.file._iter_lines()) == ["a", "b"]
+        assert self.file.encoding == "utf_8_sig"
+
+    def test_iter_read_mapped__mac(self):
+        path = self.new_subrip_file()
+        text = open(path, "r").read()
+        open(path, "w", newline="").write(text.replace("\n", "\r"))
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "ascii")
+        subtitles = list(file.iter_read_mapped())
+        assert subtitles == file.read()
+        assert file.newline == aeidon.newlines.MAC
+
+    def test_iter_read_mapped__utf_8_sig(self):
+        path = self.new_subrip_file()
+        text = open(path, "r").read()
+        open(path, "w", encoding="utf_8_sig").write(text)
+        file = aeidon.files.new(aeidon.formats.SUBRIP, path, "utf_8")
+        assert list(file.iter_read_mapped())
+        assert file.encoding == "utf_8_sig"
+
+    def test_iter_read_mapped__windows(self):
+        path = self.new_microdvd_file()
+        text = open(path, "r").read()
+        open(path, "w", newline="\r\n").write(text)
+        file = aeidon.files.new(aeidon.formats.MICRODVD, path, "ascii")
+        subtitles = list(file.iter_read_mapped())
+        assert not any("\r" in x.main_text for x in subtitles)
+        assert file.newline == aeidon.newlines.WINDOWS
+
     def test_read__utf_16(self):
         path = self.new_subrip_file()
         with open(path, "r") as f:
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import os
+
+
+class TestJournal(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.journal = aeidon.Journal()
+
+    def teardown_method(self, method):
+        self.journal.remove()
+
+    def test_read(self):
+        key_1 = self.journal.write(["a", "b"])
+        key_2 = self.journal.write((aeidon.modes.TIME, 1))
+        assert self.journal.read(key_2) == (aeidon.modes.TIME, 1)
+        assert self.journal.read(key_1) == ["a", "b"]
+        assert os.path.getsize(self.journal.path) == 0
+
+    def test_read__subtitle(self):
+        subtitle = aeidon.Subtitle(framerate=aeidon.framerates.FPS_25_000)
+        subtitle.main_text = "test"
+        key = self.journal.write(subtitle)
+        copy = self.journal.read(key)
+        assert copy == subtitle
+        assert copy.framerate is aeidon.framerates.FPS_25_000
+
+    def test_release(self):
+        key_1 = self.journal.write("a" * 1000)
+        key_2 = self.journal.write("b")
+        self.journal.release(key_1)
+        assert len(self.journal) == 1
+        assert self.journal.read(key_2) == "b"
+        assert os.path.getsize(self.journal.path) == 0
+
+    def test_release__compact(self):
+        keys = [self.journal.write(str(i) * 100) for i in range(10)]
+        for key in keys[:6]:
+            self.journal.release(key)
+        size = sum(self.journal._records[x][1] for x in keys[6:])
+        assert os.path.getsize(self.journal.path) == size
+        assert self.journal.read(keys[9]) == "9" * 100
+        assert self.journal.read(keys[6]) == "6" * 100
+
+    def test_remove(self):
+        self.journal.write("test")
+        path = self.journal.path
+        self.journal.remove()
+        assert not os.path.isfile(path)
+        assert len(self.journal) == 0
+
+    def test_write(self):
+        assert self.journal.path is None
+        self.journal.write("test")
+        assert os.path.isfile(self.journal.path)
+        assert len(self.journal) == 1
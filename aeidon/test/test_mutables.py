@@ -113,6 +113,18 @@ class TestObservableList(_TestObservable):
     def test_append(self):
         self.obs.append(4)
 
+    def test_bulk_insert(self):
+        self.obs.bulk_insert((0, 2, 5, 6), (4, 5, 6, 7))
+        assert self.obs == [4, 1, 5, 2, 3, 6, 7]
+
+    def test_bulk_insert__unsorted(self):
+        self.obs.bulk_insert((3, 0), (4, 5))
+        assert self.obs == [5, 1, 2, 3, 4]
+
+    def test_bulk_remove(self):
+        assert self.obs.bulk_remove((2, 0)) == [1, 3]
+        assert self.obs == [2]
+
     def test_extend(self):
         self.obs.extend((4, 5))
 
@@ -131,6 +143,10 @@ class TestObservableList(_TestObservable):
     def test_sort(self):
         self.obs.sort()
 
+    def test_splice(self):
+        assert self.obs.splice(1, 1, (4, 5)) == [2]
+        assert self.obs == [1, 4, 5, 3]
+
 
 class TestObservableSet(_TestObservable):
 
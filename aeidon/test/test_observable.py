@@ -78,16 +78,38 @@ class TestObservable(aeidon.TestCase):
         self.obs.emit("do")
         assert self.do_count == 1
 
+    def test_emit__blocked(self):
+        self.obs.block("notify::x")
+        self.obs.x = 1
+        assert self.notify_count == 0
+        self.obs.unblock("notify::x")
+        self.obs.x = 2
+        assert self.notify_count == 1
+
+    def test_emit__no_handlers(self):
+        self.obs.y = 0
+        self.obs.y = 1
+        self.obs.emit("notify::y")
+
     def test_freeze_notify(self):
         assert self.obs.freeze_notify()
         assert not self.obs.freeze_notify()
         self.obs.x = 1
         assert self.notify_count == 0
 
+    def test_is_notify_signal(self):
+        assert self.obs.is_notify_signal("notify::x")
+        assert not self.obs.is_notify_signal("do")
+
     def test_notify(self):
         self.obs.notify("x")
         assert self.notify_count == 1
 
+    def test_notify__signal(self):
+        signal = aeidon.observable._get_notify_signal("x")
+        assert signal == "notify::x"
+        assert aeidon.observable._get_notify_signal("x") is signal
+
     def test_thaw_notify(self):
         self.obs.freeze_notify()
         self.obs.x = 1
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project()
+
+    def test___getattr__(self):
+        assert not aeidon.agents.TextAgent in self.project._agents
+        method = self.project.capitalize
+        assert aeidon.agents.TextAgent in self.project._agents
+        assert method.__self__ is self.project._agents[aeidon.agents.TextAgent]
+        assert self.project.capitalize is method
+
+    def test___getattr____invalid(self):
+        self.assert_raises(AttributeError, lambda: self.project.xxx)
+
+    def test__init_delegations(self):
+        assert aeidon.agents.RegisterAgent in self.project._agents
+        assert not "capitalize" in aeidon.Project.__dict__
+        assert "subtitles" in aeidon.agents.EditAgent.__dict__
+        assert not "subtitles" in aeidon.Delegate.__dict__
+
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import array
+
+
+class TestIndexRanges(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.ranges = aeidon.IndexRanges([7, 1, 2, 3, 9, 8, 2, 5])
+
+    def test___contains__(self):
+        assert 1 in self.ranges
+        assert 9 in self.ranges
+        assert not 0 in self.ranges
+        assert not 4 in self.ranges
+        assert not 10 in self.ranges
+
+    def test___eq__(self):
+        assert self.ranges == [1, 2, 3, 5, 7, 8, 9]
+        assert self.ranges == (1, 2, 3, 5, 7, 8, 9)
+        assert self.ranges != [1, 2, 3]
+        assert self.ranges == aeidon.IndexRanges(self.ranges)
+
+    def test___getitem__(self):
+        assert self.ranges[0] == 1
+        assert self.ranges[3] == 5
+        assert self.ranges[-1] == 9
+        assert self.ranges[2:5] == [3, 5, 7]
+        self.assert_raises(IndexError, lambda: self.ranges[7])
+
+    def test___init____range(self):
+        ranges = aeidon.IndexRanges(range(100000))
+        assert ranges.ranges == [range(100000)]
+        assert len(ranges) == 100000
+
+    def test___iter__(self):
+        assert list(self.ranges) == [1, 2, 3, 5, 7, 8, 9]
+
+    def test___len__(self):
+        assert len(self.ranges) == 7
+        assert len(aeidon.IndexRanges()) == 0
+
+    def test___reversed__(self):
+        assert list(reversed(self.ranges)) == [9, 8, 7, 5, 3, 2, 1]
+
+    def test_index(self):
+        assert self.ranges.index(5) == 3
+        assert self.ranges.index(9) == 6
+        self.assert_raises(ValueError, self.ranges.index, 4)
+
+    def test_insert_into(self):
+        ranges = aeidon.IndexRanges([0, 2, 3, 7])
+        lst = ranges.insert_into([1, 2, 3], "abcd")
+        assert lst == ["a", 1, "b", "c", 2, 3, "d"]
+
+    def test_insert_into__array(self):
+        ranges = aeidon.IndexRanges([1, 2])
+        column = array.array("q", [0, 3])
+        assert ranges.insert_into(column, (1, 2)) == array.array("q", range(4))
+
+    def test_ranges(self):
+        assert self.ranges.ranges == [range(1, 4), range(5, 6), range(7, 10)]
+
+    def test_remove_from(self):
+        assert self.ranges.remove_from(list(range(11))) == [0, 4, 6, 10]
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_positions_changed(self):
+        emitted = []
+        def on_positions_changed(project, indices):
+            emitted.append(indices)
+        self.project.connect("positions-changed", on_positions_changed)
+        self.project.shift_positions(None, 1.0)
+        assert isinstance(emitted[0], aeidon.IndexRanges)
+        assert len(emitted[0].ranges) == 1
+        assert len(emitted[0]) == len(self.project.subtitles)
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestRevertableActionStack(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.stack = aeidon.RevertableActionStack()
+        for i in range(5):
+            self.stack.insert(0, i)
+
+    def test___delitem__(self):
+        del self.stack[3:]
+        assert self.stack == [4, 3, 2]
+
+    def test___delitem____middle(self):
+        del self.stack[1:3]
+        assert self.stack == [4, 1, 0]
+        del self.stack[0]
+        assert self.stack == [1, 0]
+
+    def test___eq__(self):
+        assert self.stack == [4, 3, 2, 1, 0]
+        assert self.stack != [4, 3, 2, 1]
+        assert self.stack == aeidon.RevertableActionStack(range(4, -1, -1))
+
+    def test___getitem__(self):
+        assert self.stack[0] == 4
+        assert self.stack[-1] == 0
+        assert self.stack[1:3] == [3, 2]
+
+    def test_pop(self):
+        assert self.stack.pop(0) == 4
+        assert self.stack.pop() == 0
+        assert self.stack.pop(1) == 2
+        assert self.stack == [3, 1]
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+
+    def test_undoables(self):
+        self.project.clear_texts((0,), aeidon.documents.MAIN)
+        assert isinstance(self.project.undoables, aeidon.RevertableActionStack)
+        self.project.undo()
+        assert isinstance(self.project.redoables, aeidon.RevertableActionStack)
+        self.project.undoables = []
+        assert isinstance(self.project.undoables, aeidon.RevertableActionStack)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import pickle
+
+MAIN = aeidon.documents.MAIN
+
+
+class TestProjectSnapshot(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = self.new_project()
+        self.snapshot = self.project.snapshot()
+
+    def test_changed_indices(self):
+        self.snapshot.subtitles[3].main_text = "test"
+        self.snapshot.subtitles[1].start = "00:00:00.500"
+        assert self.snapshot.changed_indices() == [1, 3]
+        assert self.project.subtitles[3].main_text != "test"
+        assert self.project.subtitles[1].start != "00:00:00.500"
+
+    def test_changed_indices__container(self):
+        self.snapshot.subtitles[2].ssa.style = "Test"
+        assert self.snapshot.changed_indices() == [2]
+        assert self.snapshot.subtitles[2].ssa.style == "Test"
+        assert not self.project.subtitles[2].has_container("ssa")
+
+    def test_changed_indices__remove(self):
+        self.project.subtitles[0].main_text = "[Boo]"
+        manager = aeidon.PatternManager("hearing-impaired")
+        patterns = manager.get_patterns("Latn")
+        for pattern in patterns:
+            pattern.enabled = True
+        self.snapshot = self.project.snapshot()
+        self.snapshot.remove_hearing_impaired(None, MAIN, patterns)
+        assert self.snapshot.changed_indices() == [0]
+        subtitle = self.snapshot.get_snapshot_subtitle(0)
+        assert subtitle.main_text == ""
+        assert self.project.subtitles[0].main_text == "[Boo]"
+
+    def test_changed_indices__unchanged(self):
+        for subtitle in self.snapshot.subtitles:
+            assert subtitle.main_text
+            assert subtitle.start_seconds is not None
+        assert self.snapshot.changed_indices() == []
+        assert not self.snapshot.subtitles._copies
+
+    def test_changed_indices__structure(self):
+        text = self.project.subtitles[2].main_text
+        self.snapshot.remove_subtitles((0, 1))
+        self.snapshot.insert_subtitles((1,))
+        self.snapshot.subtitles[0].main_text = "test"
+        assert self.snapshot.changed_indices() == [2]
+        assert self.snapshot.get_snapshot_subtitle(2).main_text == "test"
+        assert self.project.subtitles[2].main_text == text
+        assert self.snapshot.subtitles[1].main_text == ""
+        n = len(self.project.subtitles)
+        assert len(self.snapshot.subtitles) == n - 1
+
+    def test_copy(self):
+        self.snapshot.subtitles[0].main_text = "test"
+        subtitle = self.snapshot.subtitles[0].copy()
+        assert not isinstance(subtitle, aeidon.SnapshotSubtitle)
+        assert subtitle.main_text == "test"
+
+    def test_pickle(self):
+        subtitle = pickle.loads(pickle.dumps(self.snapshot.subtitles[1]))
+        assert not isinstance(subtitle, aeidon.SnapshotSubtitle)
+        assert subtitle == self.project.subtitles[1]
+
+    def test_snapshot__table(self):
+        project = aeidon.Project(table=True)
+        project.open_main(self.new_subrip_file(), "ascii")
+        snapshot = project.snapshot()
+        snapshot.subtitles[1].main_text = "test"
+        assert snapshot.changed_indices() == [1]
+        assert project.subtitles[1].main_text != "test"
+
+    def test_undo_limit(self):
+        self.snapshot.set_text(2, MAIN, "test")
+        self.snapshot.set_text(3, MAIN, "test")
+        assert len(self.snapshot.undoables) == 1
+        agent = self.snapshot.register_action.__self__
+        assert agent._journal is None
+        assert agent._memory_size == 0
+        assert self.snapshot.changed_indices() == [2, 3]
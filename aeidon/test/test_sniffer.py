@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+
+
+class TestFormatSniffer(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.sniffer = aeidon.FormatSniffer()
+
+    def test_get_default(self):
+        sniffer = aeidon.FormatSniffer.get_default()
+        assert sniffer is aeidon.FormatSniffer.get_default()
+
+    def test_get_scores(self):
+        scores = self.sniffer.get_scores("{1}{2}a\n[1][2]b\n{3}{4}c\n")
+        assert scores[aeidon.formats.MICRODVD] == 2
+        assert scores[aeidon.formats.MPL2] == 1
+        assert scores[aeidon.formats.SUBRIP] == 0
+
+    def test_sniff(self):
+        for format in aeidon.formats:
+            path = self.new_temp_file(format)
+            data = open(path, "rb").read()
+            assert self.sniffer.sniff(data, "ascii") == (format, 1.0)
+
+    def test_sniff__ambiguous(self):
+        data = b"00:00:01:a\n{1}{2}b\n{3}{4}c\n{5}{6}d\n"
+        format, confidence = self.sniffer.sniff(data, "ascii")
+        assert format == aeidon.formats.MICRODVD
+        assert confidence == 0.75
+
+    def test_sniff__invalid(self):
+        assert self.sniffer.sniff(b"test\n", "ascii") == (None, 0.0)
+
+    def test_sniff__mac(self):
+        data = b"{1}{2}a\r{3}{4}b\r"
+        format, confidence = self.sniffer.sniff(data, "ascii")
+        assert format == aeidon.formats.MICRODVD
+
+    def test_sniff__size(self):
+        self.sniffer.size = 12
+        data = b"[1][2]a\n{3}{4}b\n{5}{6}c\n"
+        format, confidence = self.sniffer.sniff(data, "ascii")
+        assert format == aeidon.formats.MPL2
+
+    def test_sniff__size_cut(self):
+        self.sniffer.size = 7
+        assert self.sniffer.sniff(b"{1}{2}a\n", "ascii") == (None, 0.0)
+
+    def test_sniff__unicode_error(self):
+        self.assert_raises(UnicodeError,
+                           self.sniffer.sniff,
+                           b"\xff\xfe\xfa",
+                           "utf_8")
+
+    def test_sniff_file(self):
+        path = self.new_subrip_file()
+        format, confidence = self.sniffer.sniff_file(path, "ascii")
+        assert format == aeidon.formats.SUBRIP
+        assert confidence == 1.0
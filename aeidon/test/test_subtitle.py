@@ -51,6 +51,13 @@ class TestSubtitle(aeidon.TestCase):
         assert self.fsub.start == 96
         assert self.fsub.end == 192
 
+    def test_convert_framerate__frame_exact(self):
+        self.fsub.framerate = aeidon.framerates.FPS_23_976
+        self.fsub.start = 172656
+        self.fsub.convert_framerate(aeidon.framerates.FPS_24_000)
+        self.fsub.convert_framerate(aeidon.framerates.FPS_23_976)
+        assert self.fsub.start == 172656
+
     def test_convert_framerate__time(self):
         self.tsub.start = "00:00:01.000"
         self.tsub.end = "00:00:02.000"
@@ -60,6 +67,20 @@ class TestSubtitle(aeidon.TestCase):
         assert self.tsub.start == "00:00:01.043"
         assert self.tsub.end == "00:00:02.085"
 
+    def test_copy(self):
+        self.tsub.ssa.style = "Test"
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle.has_container("ssa")
+        assert not subtitle.has_container("subrip")
+        assert subtitle.ssa is not self.tsub.ssa
+        assert subtitle.ssa.style == "Test"
+
+    def test_copy__no_containers(self):
+        subtitle = self.tsub.copy()
+        assert subtitle == self.tsub
+        assert subtitle._get_containers() == {}
+
     def test_duration__get(self):
         assert self.tsub.duration == "00:00:02.000"
         assert self.fsub.duration == 200
@@ -155,6 +176,13 @@ class TestSubtitle(aeidon.TestCase):
     def test_framerate__set(self):
         self.tsub.framerate = aeidon.framerates.FPS_29_970
         assert self.tsub.framerate == aeidon.framerates.FPS_29_970
+        assert self.tsub.calc is aeidon.Calculator(self.tsub.framerate)
+
+    def test_has_container(self):
+        assert not self.tsub.has_container("ssa")
+        self.tsub.ssa.style = "Test"
+        assert self.tsub.has_container("ssa")
+        assert not self.tsub.has_container("foo")
 
     def test_get_duration(self):
         assert self.tsub.get_duration(TIME) == "00:00:02.000"
@@ -193,8 +221,8 @@ class TestSubtitle(aeidon.TestCase):
     def test_mode__set_frame(self):
         self.fsub.mode = FRAME
         self.fsub.mode = TIME
-        assert self.fsub._start == "00:00:04.000"
-        assert self.fsub._end == "00:00:12.000"
+        assert self.fsub._start == 4000
+        assert self.fsub._end == 12000
 
     def test_mode__set_time(self):
         self.tsub.mode = TIME
@@ -225,13 +253,18 @@ class TestSubtitle(aeidon.TestCase):
 
     def test_shift_positions__seconds(self):
         self.tsub.shift_positions(1.0)
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
 
     def test_shift_positions__time(self):
         self.tsub.shift_positions("00:00:01.000")
-        assert self.tsub._start == "00:00:02.000"
-        assert self.tsub._end == "00:00:04.000"
+        assert self.tsub._start == 2000
+        assert self.tsub._end == 4000
+
+    def test_shift_positions__time_limit(self):
+        self.tsub.shift_positions("99:59:58.000")
+        assert self.tsub.start == "99:59:59.000"
+        assert self.tsub.end == "99:59:59.999"
 
     def test_start__get(self):
         assert self.tsub.start == "00:00:01.000"
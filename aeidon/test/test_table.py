@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import copy
+import pickle
+
+FRAME = aeidon.modes.FRAME
+TIME  = aeidon.modes.TIME
+
+
+class TestSubtitleTable(aeidon.TestCase):
+
+    def new_subtitle(self, start, end, text):
+        subtitle = aeidon.Subtitle(TIME)
+        subtitle.start = start
+        subtitle.end = end
+        subtitle.main_text = text
+        return subtitle
+
+    def setup_method(self, method):
+        self.table = aeidon.SubtitleTable([
+            self.new_subtitle("00:00:01.000", "00:00:02.000", "one"),
+            self.new_subtitle("00:00:03.000", "00:00:04.000", "two"),
+            self.new_subtitle("00:00:05.000", "00:00:06.000", "three"),
+        ])
+
+    def test___delitem__(self):
+        del self.table[1]
+        assert len(self.table) == 2
+        assert self.table[1].main_text == "three"
+
+    def test___getitem__(self):
+        assert self.table[0].start == "00:00:01.000"
+        assert self.table[-1].main_text == "three"
+        self.assert_raises(IndexError, lambda: self.table[3])
+
+    def test___getitem____slice(self):
+        texts = [x.main_text for x in self.table[1:]]
+        assert texts == ["two", "three"]
+
+    def test___iter__(self):
+        texts = [x.main_text for x in self.table]
+        assert texts == ["one", "two", "three"]
+
+    def test___setitem__(self):
+        subtitle = self.new_subtitle("00:00:07.000", "00:00:08.000", "four")
+        self.table[0] = subtitle
+        assert self.table[0] == subtitle
+
+    def test_bulk_insert(self):
+        subtitle = self.new_subtitle("00:00:07.000", "00:00:08.000", "four")
+        self.table.bulk_insert((1, 4), (subtitle, subtitle.copy()))
+        texts = [x.main_text for x in self.table]
+        assert texts == ["one", "four", "two", "three", "four"]
+        assert self.table[4].start == "00:00:07.000"
+
+    def test_bulk_remove(self):
+        self.table[2].ssa.style = "Test"
+        subtitles = self.table.bulk_remove((0, 2))
+        assert [x.main_text for x in subtitles] == ["one", "three"]
+        assert subtitles[1].ssa.style == "Test"
+        assert [x.main_text for x in self.table] == ["two"]
+
+    def test_containers(self):
+        self.table[0].ssa.style = "Test"
+        assert self.table[0].has_container("ssa")
+        assert not self.table[1].has_container("ssa")
+        subtitle = self.table[0].copy()
+        assert subtitle.ssa.style == "Test"
+
+    def test_copy(self):
+        subtitle = copy.copy(self.table[0])
+        del self.table[0]
+        assert not isinstance(subtitle, aeidon.table.SubtitleRow)
+        assert subtitle.main_text == "one"
+
+    def test_insert(self):
+        subtitle = self.new_subtitle("00:00:07.000", "00:00:08.000", "four")
+        self.table.insert(1, subtitle)
+        assert self.table[1] == subtitle
+        assert self.table[2].main_text == "two"
+
+    def test_insert__frame(self):
+        subtitle = aeidon.Subtitle(FRAME)
+        subtitle.start = 24
+        self.table.insert(0, subtitle)
+        assert self.table[0].mode == TIME
+        assert self.table[0].start_frame == 24
+
+    def test_mode__set(self):
+        self.table.mode = FRAME
+        assert self.table[0].start == 24
+        assert self.table[2].end == 144
+        self.table[0].mode = TIME
+        assert self.table[0].start == "00:00:01.001"
+
+    def test_get_positions(self):
+        indices = aeidon.IndexRanges((0, 2))
+        starts, ends = self.table.get_positions(indices)
+        assert list(starts) == [1000, 5000]
+        assert list(ends) == [2000, 6000]
+
+    def test_pickle(self):
+        subtitle = pickle.loads(pickle.dumps(self.table[1]))
+        assert subtitle == self.table[1]
+
+    def test_pop(self):
+        subtitle = self.table.pop(0)
+        assert subtitle.main_text == "one"
+        assert subtitle.start == "00:00:01.000"
+        assert len(self.table) == 2
+
+    def test_set_framerate__row(self):
+        def set_framerate():
+            self.table[0].framerate = aeidon.framerates.FPS_25_000
+        self.assert_raises(AttributeError, set_framerate)
+        assert self.table.framerate == aeidon.framerates.FPS_23_976
+
+    def test_set_positions(self):
+        indices = aeidon.IndexRanges((0, 2))
+        starts, ends = self.table.get_positions(indices)
+        starts[1] = 4500
+        self.table.set_positions(indices, starts, ends)
+        assert self.table[0].start == "00:00:01.000"
+        assert self.table[2].start == "00:00:04.500"
+
+    def test_set_text(self):
+        self.table[1].main_text = "test"
+        assert self.table[1].main_text == "test"
+        assert self.table[2].main_text == "three"
+
+    def test_splice(self):
+        subtitle = self.new_subtitle("00:00:07.000", "00:00:08.000", "four")
+        subtitles = self.table.splice(0, 2, (subtitle,))
+        assert [x.main_text for x in subtitles] == ["one", "two"]
+        assert [x.main_text for x in self.table] == ["four", "three"]
+
+    def test_sort(self):
+        self.table[0].start = "00:00:10.000"
+        table = aeidon.SubtitleTable(sorted(self.table))
+        texts = [x.main_text for x in table]
+        assert texts == ["two", "three", "one"]
+
+
+class TestProject(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.project = aeidon.Project(table=True)
+        self.project.open_main(self.new_subrip_file(), "ascii")
+        self.project.open_translation(self.new_microdvd_file(), "ascii")
+
+    def test_convert_framerate(self):
+        start = self.project.subtitles[1].start
+        self.project.convert_framerate(None,
+                                       aeidon.framerates.FPS_23_976,
+                                       aeidon.framerates.FPS_25_000)
+
+        assert self.project.subtitles.framerate == aeidon.framerates.FPS_25_000
+        assert self.project.subtitles[1].start != start
+        self.project.undo()
+        assert self.project.subtitles.framerate == aeidon.framerates.FPS_23_976
+        assert self.project.subtitles[1].start == start
+
+    def test_open(self):
+        assert isinstance(self.project.subtitles, aeidon.SubtitleTable)
+        assert self.project.subtitles[0].main_text
+        assert self.project.subtitles[0].tran_text
+
+    def test_remove_subtitles(self):
+        text = self.project.subtitles[1].main_text
+        self.project.remove_subtitles((0,))
+        assert self.project.subtitles[0].main_text == text
+        self.project.undo()
+        assert self.project.subtitles[1].main_text == text
+
+    def test_shift_positions(self):
+        start = self.project.subtitles[0].start_seconds
+        self.project.shift_positions(None, 1.0)
+        assert self.project.subtitles[0].start_seconds == start + 1.0
+        self.project.undo()
+        assert self.project.subtitles[0].start_seconds == start
+
+    def test_transform_positions(self):
+        ends = [x.end for x in self.project.subtitles]
+        self.project.transform_positions((1, 3), [0, "00:00:00.000"],
+                                         [1, "99:59:59.999"])
+
+        assert self.project.subtitles[0].end == ends[0]
+        assert self.project.subtitles[3].end == "99:59:59.999"
+        self.project.undo()
+        assert [x.end for x in self.project.subtitles] == ends
@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import pickle
+
+FRAME = aeidon.modes.FRAME
+TIME  = aeidon.modes.TIME
+
+
+class TestTimingContext(aeidon.TestCase):
+
+    def setup_method(self, method):
+        self.framerate = aeidon.framerates.FPS_25_000
+        self.context = aeidon.TimingContext(TIME, self.framerate)
+
+    def test___new__(self):
+        context = aeidon.TimingContext(TIME, self.framerate)
+        assert context is self.context
+
+    def test___new____float(self):
+        a = aeidon.TimingContext(TIME, 48.0)
+        b = aeidon.TimingContext(TIME, 48.0)
+        assert a is not b
+
+    def test___reduce__(self):
+        context = pickle.loads(pickle.dumps(self.context))
+        assert context is self.context
+
+    def test_calc(self):
+        assert self.context.calc is aeidon.Calculator(self.framerate)
+
+    def test_with_framerate(self):
+        framerate = aeidon.framerates.FPS_29_970
+        context = self.context.with_framerate(framerate)
+        assert context.framerate == framerate
+        assert context.mode == TIME
+        assert self.context.with_framerate(self.framerate) is self.context
+
+    def test_with_mode(self):
+        context = self.context.with_mode(FRAME)
+        assert context.framerate == self.framerate
+        assert context.mode == FRAME
+        assert self.context.with_mode(TIME) is self.context
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+import aeidon
+import fractions
+
+FRAME = aeidon.modes.FRAME
+TIME  = aeidon.modes.TIME
+
+
+class TestPiecewiseTransform(aeidon.TestCase):
+
+    def setup_method(self, method):
+        points = ((0, 0), (1000, 2000), (2000, 2500))
+        self.transform = aeidon.PiecewiseTransform(TIME, points)
+
+    def test___init____invalid(self):
+        self.assert_raises(ValueError,
+                           aeidon.PiecewiseTransform,
+                           TIME, ((0, 0), (0, 10)))
+
+    def test_apply_column(self):
+        values = self.transform.apply_column([-500, 500])
+        assert list(values) == [-1000, 1000]
+
+    def test_apply_position(self):
+        assert self.transform.apply_position(-500) == -1000
+        assert self.transform.apply_position(500) == 1000
+        assert self.transform.apply_position(1000) == 2000
+        assert self.transform.apply_position(1500) == 2250
+        assert self.transform.apply_position(3000) == 3000
+
+    def test_get_inverse(self):
+        inverse = self.transform.get_inverse()
+        for value in range(-3000, 1000, 7):
+            assert inverse.apply_position(
+                self.transform.apply_position(value)) == value
+
+
+class TestPositionTransform(aeidon.TestCase):
+
+    def test_apply(self):
+        transform = aeidon.PositionTransform(TIME, 2, after=500)
+        assert transform.apply(0, 1000, 2000) == (2500, 4500)
+
+    def test_apply__corrections(self):
+        transform = aeidon.PositionTransform(TIME, corrections={1: (3, 4)})
+        assert transform.apply(0, 1, 2) == (1, 2)
+        assert transform.apply(1, 1, 2) == (3, 4)
+
+    def test_apply_column(self):
+        coefficient = fractions.Fraction(1001, 1000)
+        for mode in (FRAME, TIME):
+            transform = aeidon.PositionTransform(
+                mode, coefficient, before=-3, after=10**9)
+            values = [-10**9, -1, 0, 1499, 10**8]
+            expected = list(map(transform.apply_position, values))
+            assert list(transform.apply_column(values)) == expected
+
+    def test_apply_position__frame(self):
+        transform = aeidon.PositionTransform(FRAME, after=-10**10)
+        assert transform.apply_position(0) == -10**10
+
+    def test_apply_position__time(self):
+        transform = aeidon.PositionTransform(TIME, after=10**10)
+        assert transform.apply_position(0) == 359999999
+
+    def test_get_inverse(self):
+        coefficient = fractions.Fraction(1001, 1000)
+        transform = aeidon.PositionTransform(FRAME, coefficient, after=-24)
+        inverse = transform.get_inverse()
+        for value in range(-1000, 1000, 7):
+            value = transform.apply_position(value)
+            assert transform.apply_position(
+                inverse.apply_position(value)) == value
+
+    def test_get_inverse__zero(self):
+        transform = aeidon.PositionTransform(TIME, 0)
+        assert transform.get_inverse().coefficient == 1
@@ -84,6 +84,18 @@ class TestModule(aeidon.TestCase):
         lst = aeidon.util.get_ranges(lst)
         assert lst == [[0], [2, 3, 4, 5], [7, 8]]
 
+    def test_get_size(self):
+        text = "a" * 1000
+        assert aeidon.util.get_size(text) > 1000
+        assert aeidon.util.get_size([text, text]) < 2000
+        texts = [text + str(i) for i in range(1000)]
+        assert aeidon.util.get_size(texts) > 1000000
+
+    def test_get_size__subtitle(self):
+        subtitle = aeidon.Subtitle()
+        subtitle.main_text = "a" * 1000
+        assert aeidon.util.get_size(subtitle) > 1000
+
     def test_get_unique__first(self):
         lst = [4, 1, 5, 5, 1, 1, 3, 6, 4, 4]
         lst = aeidon.util.get_unique(lst)
@@ -114,6 +126,14 @@ class TestModule(aeidon.TestCase):
         open(path, "w", encoding="utf_8").write("\xc3\xb6\n")
         assert aeidon.util.readlines(path, "ascii") == ["\xc3\xb6"]
 
+    def test_shift_inserted(self):
+        shifted = aeidon.util.shift_inserted([0, 1, 2, 5], [1, 2])
+        assert shifted == [0, 3, 4, 7]
+
+    def test_shift_removed(self):
+        shifted = aeidon.util.shift_removed([0, 1, 2, 5], [1, 3])
+        assert shifted == [0, 1, 3]
+
     def test_write__basic(self):
         text = "test\ntest\n"
         path = self.new_subrip_file()
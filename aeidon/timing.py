@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Position mode, framerate and calculator shared by subtitles."""
+
+import aeidon
+
+__all__ = ("TimingContext",)
+
+
+class TimingContext:
+
+    """
+    Position mode, framerate and calculator shared by subtitles.
+
+    :ivar calc: :class:`aeidon.Calculator` instance for :attr:`framerate`
+    :ivar framerate: :attr:`aeidon.framerates` item
+    :ivar mode: :attr:`aeidon.modes` item
+
+    Only one instance of :class:`TimingContext` exists for a given mode and
+    framerate, which means that all subtitles of a project share the same
+    instance instead of each carrying copies of the same three attributes.
+    Instances should be treated as immutable; use :meth:`with_framerate` or
+    :meth:`with_mode` to get the context for different values.
+    """
+
+    __slots__ = ("calc", "framerate", "mode")
+
+    _instances = {}
+
+    def __new__(cls, mode=None, framerate=None):
+        """
+        Return possibly existing instance for `mode` and `framerate`.
+
+        `framerate` can be either an :attr:`aeidon.framerates` item
+        (preferred to be able to reuse instances) or an exact float value.
+        """
+        mode = mode or aeidon.modes.TIME
+        framerate = framerate or aeidon.framerates.FPS_23_976
+        if not framerate in aeidon.framerates:
+            # Always return a new instance for float values.
+            return object.__new__(cls)
+        key = (mode, framerate)
+        if not key in cls._instances:
+            cls._instances[key] = object.__new__(cls)
+        return cls._instances[key]
+
+    def __init__(self, mode=None, framerate=None):
+        """Initialize a :class:`TimingContext` instance."""
+        self.mode = mode or aeidon.modes.TIME
+        self.framerate = framerate or aeidon.framerates.FPS_23_976
+        self.calc = aeidon.Calculator(self.framerate)
+
+    def __reduce__(self):
+        """Return arguments to look up instance when unpickling."""
+        return (self.__class__, (self.mode, self.framerate))
+
+    def with_framerate(self, framerate):
+        """Return context with the same mode and `framerate`."""
+        if framerate is self.framerate: return self
+        return self.__class__(self.mode, framerate)
+
+    def with_mode(self, mode):
+        """Return context with `mode` and the same framerate."""
+        if mode is self.mode: return self
+        return self.__class__(mode, self.framerate)
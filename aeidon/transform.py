@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+
+# Copyright (C) 2026 Osmo Salomaa
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <http://www.gnu.org/licenses/>.
+
+"""Linear transformation of native integer positions."""
+
+import aeidon
+import array
+import bisect
+
+__all__ = ("PiecewiseTransform", "PositionTransform",)
+
+
+class PositionTransform:
+
+    """
+    Linear transformation of native integer positions.
+
+    :ivar after: Integer added to positions after scaling
+    :ivar before: Integer added to positions before scaling
+    :ivar coefficient: Float or :class:`fractions.Fraction` to scale with
+    :ivar corrections: Dictionary mapping index to start and end positions
+    :ivar mode: :attr:`aeidon.modes` item of positions
+
+    Positions are integers in native units of `mode`, i.e. milliseconds or
+    frames, see :class:`aeidon.Subtitle`. Milliseconds are limited to the
+    valid range after each of adding `before`, scaling and adding `after`.
+
+    Transforms are used to record bulk position changes for undo and redo
+    by parameters instead of copies of subtitles. Rounding and limiting
+    make most transforms not exactly invertible, which is why positions
+    that the inverse would not restore exactly are stored as `corrections`,
+    which are used instead of computed values.
+    """
+
+    def __init__(self, mode, coefficient=1, before=0, after=0,
+                 corrections=None):
+        """Initialize a :class:`PositionTransform` instance."""
+        self.after = after
+        self.before = before
+        self.coefficient = coefficient
+        self.corrections = corrections or {}
+        self.mode = mode
+        self._limit = (aeidon.Calculator.max_milliseconds
+                       if mode == aeidon.modes.TIME else None)
+
+    def apply(self, index, start, end):
+        """Return transformed `start` and `end` at `index`."""
+        if index in self.corrections:
+            return self.corrections[index]
+        return (self.apply_position(start),
+                self.apply_position(end))
+
+    def apply_column(self, values):
+        """
+        Return transformed positions `values` ignoring corrections.
+
+        Positions are transformed with the batch methods of
+        :class:`aeidon.Calculator`, with the same result as transforming each
+        with :meth:`apply_position`.
+        """
+        calc = aeidon.Calculator()
+        if self.mode == aeidon.modes.TIME:
+            shift, scale = calc.shift_milliseconds, calc.scale_milliseconds
+        else:
+            shift, scale = calc.shift_frames, calc.scale_frames
+        values = shift(values, self.before)
+        if self.coefficient != 1:
+            values = scale(values, self.coefficient)
+        return shift(values, self.after)
+
+    def apply_position(self, value):
+        """Return transformed position `value` ignoring corrections."""
+        if self._limit is None:
+            value = value + self.before
+            if self.coefficient != 1:
+                value = round(value * self.coefficient)
+            return value + self.after
+        value = self._limit_value(value + self.before)
+        if self.coefficient != 1:
+            value = self._limit_value(round(value * self.coefficient))
+        return self._limit_value(value + self.after)
+
+    def get_inverse(self):
+        """Return the inverse transform without corrections."""
+        # Scaling by zero cannot be inverted, but corrections will
+        # then be needed for all positions anyway.
+        coefficient = 1 / self.coefficient if self.coefficient else 1
+        return self.__class__(self.mode,
+                              coefficient,
+                              -self.after,
+                              -self.before)
+
+    def _limit_value(self, value):
+        """Return `value` limited to the valid range of milliseconds."""
+        if value > self._limit:
+            return self._limit
+        if value < -self._limit:
+            return -self._limit
+        return value
+
+
+class PiecewiseTransform(PositionTransform):
+
+    """
+    Piecewise linear transformation of native integer positions.
+
+    :ivar points: List of input and output position pairs sorted by input
+
+    Positions between two consecutive points are transformed linearly,
+    positions before the first or after the last point by extending the
+    nearest segment. At least two points with distinct input positions
+    are required.
+    """
+
+    def __init__(self, mode, points, corrections=None):
+        """Initialize a :class:`PiecewiseTransform` instance."""
+        PositionTransform.__init__(self, mode, corrections=corrections)
+        # Keep only the last point for each input position.
+        self.points = sorted(dict(points).items())
+        if len(self.points) < 2:
+            raise ValueError("Invalid points: {!r}"
+                             .format(points))
+        self._inputs = [x for x, y in self.points]
+        self._segments = []
+        for (x1, y1), (x2, y2) in zip(self.points, self.points[1:]):
+            self._segments.append((x1, y1, (y2 - y1) / (x2 - x1)))
+        self._count = len(self._segments)
+
+    def apply_column(self, values):
+        """Return transformed positions `values` ignoring corrections."""
+        return array.array("q", map(self.apply_position, values))
+
+    def apply_position(self, value):
+        """Return transformed position `value` ignoring corrections."""
+        i = bisect.bisect_right(self._inputs, value, 1, self._count)
+        x1, y1, slope = self._segments[i - 1]
+        value = round(y1 + (value - x1) * slope)
+        if self._limit is not None:
+            return self._limit_value(value)
+        return value
+
+    def get_inverse(self):
+        """Return the inverse transform without corrections."""
+        points = [(y, x) for x, y in self.points]
+        if len(set(y for y, x in points)) < 2:
+            # All positions are transformed to the same value,
+            # corrections will be needed for all positions anyway.
+            return PositionTransform(self.mode)
+        return self.__class__(self.mode, points)
@@ -31,6 +31,7 @@ import stat
 import subprocess
 import sys
 import traceback
+import types
 import urllib.parse
 
 VIDEO_FILE_EXTENSIONS = [
@@ -153,42 +154,25 @@ def detect_format(path, encoding):
     """
     Detect and return format of subtitle file at `path`.
 
+    Only the beginning of the file is read, see :class:`aeidon.FormatSniffer`.
     Raise :exc:`IOError` if reading fails.
     Raise :exc:`UnicodeError` if decoding fails.
     Raise :exc:`aeidon.FormatError` if unable to detect format.
     Return an :attr:`aeidon.formats` enumeration item.
     """
-    re_ids = [(x, re.compile(x.identifier)) for x in aeidon.formats]
-    with open(path, "r", encoding=encoding) as f:
-        for line in f:
-            for format, re_id in re_ids:
-                if re_id.search(line) is not None:
-                    return format
+    sniffer = aeidon.FormatSniffer.get_default()
+    format, confidence = sniffer.sniff_file(path, encoding)
+    if format is not None: return format
     raise aeidon.FormatError("Failed to detect format of file {!r}"
                              .format(path))
 
 def detect_newlines(path):
     """Detect and return the newline type of file at `path` or ``None``."""
     try:
-        with open(path, "r", newline="") as f:
-            f.read()
-            chars = f.newlines
+        buffer = aeidon.FileBuffer(path)
+        return buffer.detect_newlines(locale.getpreferredencoding(False))
     except Exception:
         return None
-    if chars is None:
-        return None
-    if isinstance(chars, str):
-        return aeidon.newlines.find_item("value", chars)
-    if isinstance(chars, tuple):
-        if len(chars) == 1:
-            return aeidon.newlines.find_item("value", chars[0])
-        # This is not actually correct. If both CR and LF are detected,
-        # it could mean a mixture of Mac and Unix newlines on separate
-        # lines or one Windows newline in a mostly something else file.
-        # We could count the frequencies, but it's probably not worth
-        # the effort.
-        return aeidon.newlines.WINDOWS
-    return None
 
 @aeidon.deco.once
 def enchant_available():
@@ -208,6 +192,28 @@ def enchant_and_dicts_available():
     except Exception:
         return False
 
+def find_newline(chars):
+    """
+    Return :attr:`aeidon.newlines` item matching `chars` or ``None``.
+
+    `chars` should be the value of the ``newlines`` attribute of a text
+    stream after reading, i.e. ``None``, a string or a tuple of strings.
+    """
+    if chars is None:
+        return None
+    if isinstance(chars, str):
+        return aeidon.newlines.find_item("value", chars)
+    if isinstance(chars, tuple):
+        if len(chars) == 1:
+            return aeidon.newlines.find_item("value", chars[0])
+        # This is not actually correct. If both CR and LF are detected,
+        # it could mean a mixture of Mac and Unix newlines on separate
+        # lines or one Windows newline in a mostly something else file.
+        # We could count the frequencies, but it's probably not worth
+        # the effort.
+        return aeidon.newlines.WINDOWS
+    return None
+
 def flatten(lst):
     """
     Return a shallow version of `lst`.
@@ -278,6 +284,60 @@ def get_ranges(lst):
             ranges.append([item])
     return ranges
 
+def get_size(obj):
+    """
+    Return estimated memory size of `obj` in bytes.
+
+    Size includes objects that `obj` refers to via containers, instance
+    dictionaries and slots down to a few levels, counting each object only
+    once. Classes, functions, modules, enumeration items and objects shared
+    by subtitles in a project, such as timing contexts, are not followed.
+    Sizes of items of large lists, tuples and sets are extrapolated from an
+    evenly spaced sample, which keeps the estimate cheap regardless of the
+    size of `obj`.
+    """
+    shared = (type,
+              types.BuiltinFunctionType,
+              types.FunctionType,
+              types.MethodType,
+              types.ModuleType,
+              aeidon.EnumerationItem,
+              aeidon.SubtitleTable,
+              aeidon.TimingContext)
+
+    return _get_size(obj, set(), shared)
+
+def _get_size(obj, seen, shared, depth=0, max_depth=5, sample_size=16):
+    """Return estimated memory size of `obj` not in `seen` in bytes."""
+    if id(obj) in seen: return 0
+    seen.add(id(obj))
+    if isinstance(obj, shared): return 0
+    size = sys.getsizeof(obj)
+    if obj is None or isinstance(obj, (bytes, bytearray, float, int, str)):
+        return size
+    if depth >= max_depth: return size
+    depth += 1
+    if isinstance(obj, (dict, list, tuple, set, frozenset)):
+        items = obj
+        if isinstance(obj, dict):
+            items = list(obj.keys()) + list(obj.values())
+        count = len(items)
+        if count > sample_size:
+            step = count / sample_size
+            if not isinstance(items, (list, tuple)):
+                items = list(items)
+            items = [items[int(i * step)] for i in range(sample_size)]
+        items_size = sum(_get_size(x, seen, shared, depth) for x in items)
+        return size + round(items_size * count / max(1, len(items)))
+    if hasattr(obj, "__dict__"):
+        size += _get_size(obj.__dict__, seen, shared, depth)
+    for cls in type(obj).__mro__:
+        for name in getattr(cls, "__slots__", ()):
+            with silent(AttributeError):
+                value = object.__getattribute__(obj, name)
+                size += _get_size(value, seen, shared, depth)
+    return size
+
 def get_template_header(format):
     """
     Read and return the template header for `format`.
@@ -351,6 +411,15 @@ def normalize_newlines(text):
     re_newline_char = re.compile(r"\r\n?")
     return re_newline_char.sub("\n", text)
 
+@aeidon.deco.once
+def numpy_available():
+    """Return ``True`` if :mod:`numpy` module is available."""
+    try:
+        import numpy
+        return True
+    except Exception:
+        return False
+
 def path_to_uri(path):
     """Convert local filepath to URI."""
     if sys.platform == "win32":
@@ -434,6 +503,37 @@ def shell_quote(path):
         path = path.replace('"', '\\"')
     return '"{}"'.format(path)
 
+def shift_inserted(indices, inserted):
+    """
+    Return `indices` shifted by items inserted at `inserted`.
+
+    Both arguments should be sorted, `inserted` being the indices of the
+    inserted items after the insertion.
+    """
+    shifted = []
+    k = 0
+    for index in indices:
+        while k < len(inserted) and inserted[k] <= index + k:
+            k += 1
+        shifted.append(index + k)
+    return shifted
+
+def shift_removed(indices, removed):
+    """
+    Return `indices` without and shifted by items removed at `removed`.
+
+    Both arguments should be sorted, `removed` being the indices of the
+    removed items before the removal.
+    """
+    shifted = []
+    k = 0
+    for index in indices:
+        while k < len(removed) and removed[k] < index:
+            k += 1
+        if k < len(removed) and removed[k] == index: continue
+        shifted.append(index - k)
+    return shifted
+
 @contextlib.contextmanager
 def silent(*exceptions, tb=False):
     """Try to execute body, ignoring `exceptions`."""
@@ -109,7 +109,7 @@ class PreferencesDialog(gaupol.BuilderDialog):
         selection.connect("changed", self._on_tree_view_selection_changed)
         store = Gtk.ListStore(float)
         for framerate in framerates:
-            store.append((framerate,))
+            store.append((float(aeidon.Calculator(framerate).fraction),))
         store.set_sort_column_id(0, Gtk.SortType.ASCENDING)
         self._tree_view.set_model(store)
         renderer = Gtk.CellRendererText()
@@ -163,13 +163,19 @@ class CustomFrameratesExtension(gaupol.Extension):
         self.framerates = []
         menu = self.application.get_menubar_section(
             "custom-framerates-placeholder")
-        for value in sorted(self.conf.framerates):
+        # Framerates can be defined as floats or as exact rational
+        # strings, e.g. "120000/1001", see aeidon.Calculator.
+        rates = [aeidon.Calculator(x).fraction
+                 for x in self.conf.framerates]
+        for fraction in sorted(rates):
+            value = float(fraction)
             name = "FPS_{:.3f}".format(value).replace(".", "_")
             if hasattr(aeidon.framerates, name): continue
             setattr(aeidon.framerates, name, aeidon.EnumerationItem())
             framerate = getattr(aeidon.framerates, name)
             framerate.label = _("{:.3f} fps").format(value)
-            framerate.value = float(value)
+            framerate.fraction = fraction
+            framerate.value = value
             self.framerates.append(framerate)
             with aeidon.util.silent(AttributeError):
                 # Menubar not available when running unit tests.
@@ -25,6 +25,7 @@ sys.path.insert(1, os.path.abspath(os.path.join(
     os.path.dirname(__file__), "..", "..", "..", "..")))
 
 import aeidon
+import fractions
 import gaupol
 
 from gi.repository import Gtk
@@ -95,6 +96,16 @@ class TestCustomFrameratesExtension(gaupol.TestCase):
         assert not hasattr(aeidon.framerates, "FPS_48_000")
         gaupol.TestCase.teardown_method(self, self.application)
 
+    def test__add_framerates__fraction(self):
+        self.extension.conf.framerates = [48.0, "120000/1001"]
+        self.extension.teardown(self.application)
+        self.extension.setup(self.application)
+        framerate = aeidon.framerates.FPS_119_880
+        assert framerate.fraction == fractions.Fraction(120000, 1001)
+        calc = aeidon.Calculator(framerate)
+        assert calc.frame_to_milliseconds(120000) == 1001000
+        self.extension.conf.framerates = [48.0]
+
     @patch("gaupol.util.run_dialog", lambda *args: Gtk.ResponseType.CLOSE)
     def test_show_preferences_dialog(self):
         self.extension.show_preferences_dialog(self.application.window)
@@ -42,6 +42,7 @@ class CloseAgent(aeidon.Delegate):
         self.pages.remove(page)
         self.update_gui()
         self.emit("page-closed", page)
+        page.project.clear_reversion_stacks()
 
     @aeidon.deco.export
     def close_all(self, confirm=True):
@@ -115,7 +115,14 @@ class OpenAgent(aeidon.Delegate):
     def _check_file_size(self, path):
         """Raise :exc:`gaupol.Default` if size of file at `path` too large."""
         size_mb = os.stat(path).st_size / 1048576
-        if size_mb <= 1: return
+        limit = gaupol.conf.file.warning_size
+        if not limit or size_mb <= limit: return
+        # Large subtitle files are fine, they are read memory-mapped.
+        # Only ask if the file doesn't look like a subtitle file at all.
+        with aeidon.util.silent(Exception):
+            encoding = aeidon.encodings.detect_bom(path) or "latin_1"
+            aeidon.util.detect_format(path, encoding)
+            return
         basename = os.path.basename(path)
         self._show_size_warning_dialog(basename, size_mb)
 
@@ -143,6 +150,23 @@ class OpenAgent(aeidon.Delegate):
             callback = self._on_view_header_button_press_event
             button.connect("button-press-event", callback)
 
+    def _find_encoding(self, path, buffer, encodings):
+        """Return the first of `encodings` to decode file or ``None``."""
+        bom_encoding = (buffer.detect_bom() if buffer is not None
+                        else aeidon.encodings.detect_bom(path))
+        if bom_encoding is not None:
+            return bom_encoding
+        for encoding in encodings:
+            if encoding == "auto":
+                encoding = aeidon.encodings.detect(path)
+                if encoding is None: continue
+            if buffer is not None:
+                if buffer.can_decode(encoding):
+                    return encoding
+            elif aeidon.encodings.can_decode(path, encoding):
+                return encoding
+        return None
+
     def _get_encodings(self, first=None):
         """Return a sequence of encodings to try when opening files."""
         encodings = [first]
@@ -250,14 +274,25 @@ class OpenAgent(aeidon.Delegate):
         basename = os.path.basename(path)
         page = (gaupol.Page() if doc == aeidon.documents.MAIN
                 else self.get_current_page())
-        for encoding in encodings:
-            with aeidon.util.silent(UnicodeError):
-                n = self._try_open_file(page, doc, path, encoding)
-                self._check_sort_count(path, n)
-                return page
-        # Report if all codecs failed to decode file.
-        self._show_encoding_error_dialog(basename)
-        raise gaupol.Default
+        map_size = page.project.map_size
+        try:
+            # Large files are not read into memory,
+            # but validated from disk and read memory-mapped.
+            buffer = (aeidon.FileBuffer(path)
+                      if map_size is None or
+                      os.path.getsize(path) < map_size else None)
+            # Pick the encoding before parsing to avoid reading and parsing
+            # the file again for every encoding that fails to decode it.
+            encoding = self._find_encoding(path, buffer, encodings)
+        except IOError as error:
+            self._show_io_error_dialog(basename, str(error))
+            raise gaupol.Default
+        if encoding is None:
+            self._show_encoding_error_dialog(basename)
+            raise gaupol.Default
+        n = self._try_open_file(page, doc, path, encoding, buffer=buffer)
+        self._check_sort_count(path, n)
+        return page
 
     @aeidon.deco.export
     @aeidon.deco.silent(gaupol.Default)
@@ -392,23 +427,25 @@ class OpenAgent(aeidon.Delegate):
             return self.save_translation(page)
         gaupol.util.raise_default(response != Gtk.ResponseType.NO)
 
-    def _try_open_file(self, page, doc, path, encoding, **kwargs):
+    def _try_open_file(self, page, doc, path, encoding, buffer=None,
+                       **kwargs):
         """Try to open file at `path` and return subtitle sort count."""
-        if encoding == "auto":
-            encoding = aeidon.encodings.detect(path)
-            if encoding is None: raise UnicodeError
         kwargs["align_method"] = gaupol.conf.file.align_method
+        kwargs["text_weight"] = gaupol.conf.file.align_text_weight
         basename = os.path.basename(path)
         try:
-            return page.project.open(doc, path, encoding, **kwargs)
+            return page.project.open(doc, path, encoding, buffer=buffer,
+                                     **kwargs)
         except aeidon.FormatError:
             self._show_format_error_dialog(basename)
         except IOError as error:
             self._show_io_error_dialog(basename, str(error))
+        except UnicodeError:
+            self._show_encoding_error_dialog(basename)
         except aeidon.ParseError:
-            bom_encoding = aeidon.encodings.detect_bom(path)
-            encoding = bom_encoding or encoding
             with aeidon.util.silent(Exception):
-                format = aeidon.util.detect_format(path, encoding)
+                buffer = buffer or aeidon.FileBuffer(path)
+                encoding = buffer.detect_bom() or encoding
+                format = buffer.detect_format(encoding)
             self._show_parse_error_dialog(basename, format)
         raise gaupol.Default
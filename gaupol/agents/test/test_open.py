@@ -53,6 +53,22 @@ class TestOpenAgent(gaupol.TestCase):
         self.application = self.new_application()
         self.delegate = self.application.open_main.__self__
 
+    def test__find_encoding(self):
+        path = self.new_subrip_file()
+        buffer = aeidon.FileBuffer(path)
+        buffer.data += "\xe4".encode("cp1252")
+        encodings = ("ascii", "utf_8", "cp1252")
+        encoding = self.delegate._find_encoding(path, buffer, encodings)
+        assert encoding == "cp1252"
+
+    def test__find_encoding__mapped(self):
+        path = self.new_subrip_file()
+        with open(path, "ab") as f:
+            f.write("\xe4".encode("cp1252"))
+        encodings = ("ascii", "utf_8", "cp1252")
+        encoding = self.delegate._find_encoding(path, None, encodings)
+        assert encoding == "cp1252"
+
     def test_add_to_recent_files(self):
         self.application.add_to_recent_files(self.new_subrip_file(),
                                              aeidon.formats.SUBRIP,
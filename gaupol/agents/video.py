@@ -41,11 +41,14 @@ class VideoAgent(aeidon.Delegate):
         # subtitle texts in order to allow fast polled updates in video player.
         # This cache must be updated when page or subtitle data changes.
         self._cache = []
+        self._cache_project = None
+        self._cache_revision = 0
         self._update_handlers = []
 
     def _clear_subtitle_cache(self):
         """Clear subtitle position and text cache."""
         self._cache = []
+        self._cache_project = None
 
     def _init_cache_updates(self):
         """Initialize cache updates on application signals."""
@@ -362,5 +365,18 @@ class VideoAgent(aeidon.Delegate):
         page = self.get_current_page()
         if self.player is None or page is None:
             return self._clear_subtitle_cache()
-        self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
-                       for x in page.project.subtitles]
+        project = page.project
+        revision = self._cache_revision
+        if (project is self._cache_project and
+            not project.is_structure_changed(revision)):
+            # Update only subtitles changed since the last update.
+            for i in project.get_changed_indices(revision):
+                subtitle = project.subtitles[i]
+                self._cache[i] = (subtitle.start_seconds,
+                                  subtitle.end_seconds,
+                                  subtitle.main_text)
+        else:
+            self._cache = [(x.start_seconds, x.end_seconds, x.main_text)
+                           for x in project.subtitles]
+        self._cache_project = project
+        self._cache_revision = project.get_revision()
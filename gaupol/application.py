@@ -37,14 +37,24 @@ class ApplicationMeta(type):
     Public methods are added to the class dictionary during :meth:`__new__`
     in order to fool Sphinx (and perhaps other API documentation generators)
     into thinking that the resulting instantiated class actually contains those
-    methods, which it does not since the methods are removed during
-    :meth:`Application.__init__`.
+    methods, which it does not since the methods are removed when the first
+    instance is initialized.
+
+    The mapping of delegated method names to agent classes is computed once
+    here and saved as class attribute ``_agent_classes``. Agent classes that
+    define their own ``__init__``, e.g. to connect to signals, are saved as
+    ``_eager_agent_classes`` to be instantiated along with the application,
+    other agents are instantiated only when first used.
     """
 
     def __new__(meta, class_name, bases, dic):
         new_dict = dic.copy()
+        agent_classes = {}
+        eager_agent_classes = []
         for agent_class_name in gaupol.agents.__all__:
             agent_class = getattr(gaupol.agents, agent_class_name)
+            if agent_class.__init__ is not aeidon.Delegate.__init__:
+                eager_agent_classes.append(agent_class)
             def is_delegate_method(name):
                 value = getattr(agent_class, name)
                 return (callable(value) and
@@ -53,7 +63,14 @@ class ApplicationMeta(type):
 
             attr_names = list(filter(is_delegate_method, dir(agent_class)))
             for attr_name in attr_names:
+                if attr_name in agent_classes:
+                    raise ValueError("Multiple definitions of {!r}"
+                                     .format(attr_name))
+
+                agent_classes[attr_name] = agent_class
                 new_dict[attr_name] = getattr(agent_class, attr_name)
+        new_dict["_agent_classes"] = agent_classes
+        new_dict["_eager_agent_classes"] = tuple(eager_agent_classes)
         return type.__new__(meta, class_name, bases, new_dict)
 
 
@@ -62,9 +79,9 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
     """
     GTK+ user interface controller for :class:`aeidon.Project`.
 
+    :ivar _agents: Dictionary mapping agent classes to instances
     :ivar clipboard: Instance of :class:`aeidon.Clipboard` used
     :ivar counter: Iterator used for naming unsaved documents
-    :ivar _delegations: Dictionary mapping method names to agent methods
     :ivar extension_manager: Instance of :class:`gaupol.ExtensionManager` used
     :ivar main_toolbar: A :class:`Gtk.Toolbar` shown below the menubar
     :ivar notebook: A :class:`Gtk.Notebook` used to hold multiple projects
@@ -112,9 +129,9 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
     def __init__(self):
         """Initialize an :class:`Application` instance."""
         aeidon.Observable.__init__(self)
+        self._agents = {}
         self.clipboard = aeidon.Clipboard()
         self.counter = itertools.count(1)
-        self._delegations = {}
         self.extension_manager = gaupol.ExtensionManager(self)
         self.main_toolbar = None
         self.notebook = None
@@ -146,14 +163,27 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
     def __getattr__(self, name):
         """Return method delegated to an agent."""
         try:
-            return self._delegations[name]
+            agent_class = self._agent_classes[name]
         except KeyError:
             raise AttributeError
+        method = getattr(self._get_agent(agent_class), name)
+        # Store the bound method as an instance attribute so that
+        # subsequent lookups find it without calling __getattr__.
+        self.__dict__[name] = method
+        return method
 
     def __setattr__(self, name, value):
         """Set value of attribute `name`."""
         return aeidon.Observable.__setattr__(self, name, value)
 
+    def _get_agent(self, agent_class):
+        """Return instance of `agent_class`, instantiating if needed."""
+        try:
+            return self._agents[agent_class]
+        except KeyError:
+            agent = self._agents[agent_class] = agent_class(self)
+            return agent
+
     def _init_actions(self):
         """Initialize user-activatable actions."""
         for name in gaupol.actions.__all__:
@@ -168,26 +198,17 @@ class Application(aeidon.Observable, metaclass=ApplicationMeta):
             self.window.add_action(action)
 
     def _init_delegations(self):
-        """Initialize the delegation mappings."""
-        for agent_class_name in gaupol.agents.__all__:
-            agent = getattr(gaupol.agents, agent_class_name)(self)
-            def is_delegate_method(name):
-                value = getattr(agent, name)
-                return (callable(value) and
-                        hasattr(value, "export") and
-                        value.export is True)
-
-            attr_names = list(filter(is_delegate_method, dir(agent)))
-            for attr_name in attr_names:
-                attr_value = getattr(agent, attr_name)
-                if attr_name in self._delegations:
-                    raise ValueError("Multiple definitions of {!r}"
-                                     .format(attr_name))
-
-                self._delegations[attr_name] = attr_value
-                # Remove class-level function added by ApplicationMeta.
-                if hasattr(self.__class__, attr_name):
-                    delattr(self.__class__, attr_name)
+        """Initialize agents that need to be initialized eagerly."""
+        for cls in self.__class__.__mro__:
+            if not isinstance(cls, ApplicationMeta): continue
+            if cls.__dict__.get("_class_methods_removed", False): continue
+            # Remove class-level functions added by ApplicationMeta.
+            for name in cls._agent_classes:
+                if name in cls.__dict__:
+                    delattr(cls, name)
+            cls._class_methods_removed = True
+        for agent_class in self._eager_agent_classes:
+            self._get_agent(agent_class)
 
     def _init_gui(self):
         """Initialize the user interface."""
@@ -1003,14 +1003,6 @@ class TextAssistant(Gtk.Assistant):
                 page.set_visible(pages[0].get_visible())
         pages[0].connect("notify::visible", on_notify_visible, pages)
 
-    def _copy_project(self, project):
-        """Return a copy of `project` with some same properties."""
-        copy = aeidon.Project(project.framerate)
-        copy.main_file = project.main_file
-        copy.tran_file = project.tran_file
-        copy.subtitles = [x.copy() for x in project.subtitles]
-        return copy
-
     def _correct_texts(self, assistant_pages):
         """Correct texts by all pages and present changes."""
         changes = []
@@ -1028,15 +1020,14 @@ class TextAssistant(Gtk.Assistant):
             # Initialize a dummy project to apply corrections in
             # to be able to present those corrections for approval and
             # to finally be able to apply only approved corrections.
-            dummy = self._copy_project(project)
-            static_subtitles = dummy.subtitles[:]
+            dummy = project.snapshot()
             for page in assistant_pages:
                 self._progress_page.set_task_name(page.title)
                 page.correct_texts(dummy, rows, doc)
                 self._progress_page.bump_progress()
-            for i in range(len(static_subtitles)):
+            for i in dummy.changed_indices():
                 orig = project.subtitles[i].get_text(doc)
-                new = static_subtitles[i].get_text(doc)
+                new = dummy.get_snapshot_subtitle(i).get_text(doc)
                 if orig == new: continue
                 changes.append((application_page, i, orig, new))
         self._prepare_confirmation_page(doc, changes)
@@ -105,10 +105,12 @@ CONFIG_DEFAULTS = {
     },
     "file": {
         "align_method": aeidon.align_methods.POSITION,
+        "align_text_weight": 0.0,
         "directory": "",
         "encoding": "utf_8",
         "format": aeidon.formats.SUBRIP,
         "newline": aeidon.util.get_default_newline(),
+        "warning_size": 1.0,
     },
     "framerate_convert": {
         "target": gaupol.targets.CURRENT,
@@ -69,7 +69,7 @@ class FieldTranslationText(aeidon.EnumerationItem):
     label = _("Translation")
     tooltip = _("Translation")
 
-fields = aeidon.Enumeration()
+fields = aeidon.Enumeration(__name__, "fields")
 fields.NUMBER = FieldNumber()
 fields.START = FieldStart()
 fields.END = FieldEnd()
@@ -84,7 +84,7 @@ class LengthUnitChar(aeidon.EnumerationItem):
 class LengthUnitEm(aeidon.EnumerationItem):
     label = _("ems")
 
-length_units = aeidon.Enumeration()
+length_units = aeidon.Enumeration(__name__, "length_units")
 length_units.CHAR = LengthUnitChar()
 length_units.EM = LengthUnitEm()
 
@@ -95,7 +95,7 @@ class OrientationHorizontal(aeidon.EnumerationItem):
 class OrientationVertical(aeidon.EnumerationItem):
     value = Gtk.Orientation.VERTICAL
 
-orientation = aeidon.Enumeration()
+orientation = aeidon.Enumeration(__name__, "orientation")
 orientation.HORIZONTAL = OrientationHorizontal()
 orientation.VERTICAL = OrientationVertical()
 
@@ -105,7 +105,7 @@ class TargetSelectedToEnd(aeidon.EnumerationItem): pass
 class TargetCurrent(aeidon.EnumerationItem): pass
 class TargetAll(aeidon.EnumerationItem): pass
 
-targets = aeidon.Enumeration()
+targets = aeidon.Enumeration(__name__, "targets")
 targets.SELECTED = TargetSelected()
 targets.SELECTED_TO_END = TargetSelectedToEnd()
 targets.CURRENT = TargetCurrent()
@@ -124,7 +124,7 @@ class ToolbarStyleIcons(aeidon.EnumerationItem):
 class ToolbarStyleText(aeidon.EnumerationItem):
     value = Gtk.ToolbarStyle.TEXT
 
-toolbar_styles = aeidon.Enumeration()
+toolbar_styles = aeidon.Enumeration(__name__, "toolbar_styles")
 toolbar_styles.ICONS = ToolbarStyleIcons()
 toolbar_styles.TEXT = ToolbarStyleText()
 toolbar_styles.BOTH = ToolbarStyleBoth()
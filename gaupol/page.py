@@ -309,9 +309,15 @@ class Page(aeidon.Observable):
     def reload_view(self, rows, fields):
         """Reload the view in `rows` and `fields`."""
         store = self.view.get_model()
-        for row, field in ((x, y) for x in rows for y in fields):
-            value = self._get_subtitle_value(row, field)
-            store[row][field] = value
+        fields = list(fields)
+        for span in aeidon.IndexRanges(rows).ranges:
+            # Walk blocks of consecutive rows with iterators and set all
+            # fields at once instead of looking up each cell separately.
+            itr = store.iter_nth_child(None, span.start)
+            for row in span:
+                values = [self._get_subtitle_value(row, x) for x in fields]
+                store.set(itr, fields, values)
+                itr = store.iter_next(itr)
 
     def reload_view_all(self):
         """Clear and repopulate the entire view."""
@@ -355,9 +355,9 @@ class View(Gtk.TreeView):
         for handler_id in self._selection_changed_handlers:
             selection.handler_block(handler_id)
         selection.unselect_all()
-        for lst in aeidon.util.get_ranges(rows):
-            start = gaupol.util.tree_row_to_path(lst[0])
-            end = gaupol.util.tree_row_to_path(lst[-1])
+        for span in aeidon.IndexRanges(rows).ranges:
+            start = gaupol.util.tree_row_to_path(span[0])
+            end = gaupol.util.tree_row_to_path(span[-1])
             selection.select_range(start, end)
         for handler_id in self._selection_changed_handlers:
             selection.handler_unblock(handler_id)